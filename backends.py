@@ -0,0 +1,523 @@
+import importlib
+import importlib.util
+import shutil
+import subprocess
+import time
+from contextlib import ExitStack
+
+import conversion_metrics as metrics
+from page_text import PageText, with_text
+from pdf_source import open_source
+
+# OCR 엔진 선택지
+# auto: tesserocr가 있으면 사용하고 없으면 pytesseract
+# tesserocr: 언어 모델을 한 번만 읽고 계속 재사용 (페이지마다 프로세스 실행 없음)
+# pytesseract: 호출마다 tesseract 프로세스 실행 (별도 설치 없이 동작)
+OCR_ENGINES = ("auto", "tesserocr", "pytesseract")
+
+def ocr_engine_name(engine):
+    """
+    'auto'를 실제 사용할 OCR 엔진 이름으로 바꿈 (캐시 키용)
+
+    pdf_ocr.resolve_ocr_engine과 같은 결과를 내지만 tesserocr 설치 여부만 확인하고
+    OCR 라이브러리를 import하지 않는다.
+    """
+    tesserocr_available = importlib.util.find_spec("tesserocr") is not None
+    if engine == "auto" or (engine == "tesserocr" and not tesserocr_available):
+        return "tesserocr" if tesserocr_available else "pytesseract"
+    return engine
+
+class ExtractionError(Exception):
+    """텍스트 추출 실패 (메시지는 사용자에게 그대로 표시됨)"""
+
+class Backend:
+    """
+    텍스트 추출 방법 하나 (CLI와 GUI가 함께 사용)
+
+    문서를 한 번 열고(open) 페이지 단위로 추출(extract_page)한 뒤 닫는다(close).
+    필요한 라이브러리는 처음 사용할 때 불러오고, 설치 여부는 import 없이 확인한다.
+    page_cost는 페이지 하나를 추출하는 상대 비용(PyMuPDF = 1)으로, 여러 방법을
+    차례로 시도할 때 싼 방법부터 시도하는 데 사용한다.
+    """
+    name = None
+    # GUI에 표시할 이름
+    label = None
+    # 필요한 파이썬 모듈 (첫 번째가 추출에 사용하는 주 모듈)
+    modules = ()
+    # 필요한 외부 프로그램
+    executables = ()
+    # 지원 기능: "text" (텍스트 레이어 추출), "ocr" (이미지 인식), "tables" (표 추출)
+    capabilities = frozenset()
+    page_cost = 1.0
+    # True면 open에 파일 경로 대신 pdf_source.PdfSource를 전달 (메모리의 PDF를 임시 파일
+    # 없이 열 수 있음). False면 메모리의 PDF는 임시 파일에 한 번 써서 그 경로를 전달
+    accepts_source = False
+
+    _available = None
+
+    @classmethod
+    def is_available(cls):
+        """라이브러리와 외부 프로그램이 설치되어 있는지 확인 (import하지 않음)"""
+        if cls._available is None:
+            cls._available = (all(importlib.util.find_spec(module) is not None for module in cls.modules)
+                              and all(shutil.which(program) for program in cls.executables))
+        return cls._available
+
+    def load(self):
+        """라이브러리를 import하고 주 모듈 반환 (두 번째부터는 이미 불러온 모듈)"""
+        loaded = [importlib.import_module(module) for module in self.modules]
+        return loaded[0] if loaded else None
+
+    def estimate_cost(self, page_count):
+        """문서 전체를 추출하는 상대 비용"""
+        return self.page_cost * page_count
+
+    def open(self, pdf_path):
+        """문서를 열고 문서 객체 반환 (accepts_source면 pdf_path는 PdfSource)"""
+        raise NotImplementedError
+
+    def page_count(self, doc):
+        raise NotImplementedError
+
+    def extract_page(self, doc, page_num):
+        """페이지 하나의 텍스트 (page_num은 0부터, 텍스트가 없으면 빈 문자열)"""
+        raise NotImplementedError
+
+    def close(self, doc):
+        doc.close()
+
+_registry = {}
+
+def register_backend(backend_class):
+    """추출 방법 등록 (클래스 데코레이터로 사용)"""
+    _registry[backend_class.name] = backend_class
+    return backend_class
+
+def get_backend(name, **options):
+    """
+    이름으로 추출 방법 객체 생성
+
+    Raises:
+        ExtractionError: 등록되지 않았거나 설치되지 않은 방법
+    """
+    backend_class = _registry.get(name)
+    if backend_class is None:
+        raise ExtractionError(f"지원하지 않는 추출 방법: {name}")
+    if not backend_class.is_available():
+        raise ExtractionError(f"{backend_class.label or name}에 필요한 라이브러리가 설치되지 않았습니다.")
+    return backend_class(**options)
+
+def backend_names(capability="text", available_only=True):
+    """기능을 지원하는 추출 방법 이름 목록 (페이지당 비용이 싼 순서)"""
+    classes = [backend_class for backend_class in _registry.values()
+               if capability in backend_class.capabilities
+               and (not available_only or backend_class.is_available())]
+    return [backend_class.name for backend_class in sorted(classes, key=lambda cls: cls.page_cost)]
+
+def backend_label(name):
+    backend_class = _registry.get(name)
+    return backend_class.label if backend_class else name
+
+def is_available(name):
+    """추출 방법에 필요한 라이브러리가 설치되어 있는지 확인 (import하지 않음)"""
+    backend_class = _registry.get(name)
+    return backend_class is not None and backend_class.is_available()
+
+def load_backend(name):
+    """
+    추출 방법의 라이브러리를 import하고 주 모듈 반환
+
+    Raises:
+        ImportError: 라이브러리가 설치되지 않음
+    """
+    return _registry[name]().load()
+
+def _encrypted_error():
+    return ExtractionError("암호화된 PDF 파일입니다. 비밀번호가 필요합니다.")
+
+@register_backend
+class PyMuPDFBackend(Backend):
+    name = "pymupdf"
+    label = "PyMuPDF (가장 강력 - 권장)"
+    modules = ("fitz",)
+    capabilities = frozenset({"text"})
+    page_cost = 1.0
+    accepts_source = True
+
+    def open(self, source):
+        fitz = self.load()
+        # 메모리의 PDF는 버퍼를 복사하지 않고 그대로 열음
+        doc = fitz.open(source.path) if source.buffer is None else fitz.open(stream=source.buffer)
+        if doc.needs_pass:
+            doc.close()
+            raise _encrypted_error()
+        return doc
+
+    def page_count(self, doc):
+        return doc.page_count
+
+    def extract_page(self, doc, page_num):
+        page = doc[page_num]
+        page_text = page.get_text()
+        if page_text.strip():
+            return page_text
+        # 구조화된 텍스트 블록에서 다시 시도
+        return "\n".join(" ".join(span["text"] for span in line["spans"] if span.get("text", "").strip())
+                         for block in page.get_text("dict").get("blocks", []) if "lines" in block
+                         for line in block["lines"])
+
+@register_backend
+class Pypdfium2Backend(Backend):
+    name = "pypdfium2"
+    label = "pypdfium2 (빠름)"
+    modules = ("pypdfium2",)
+    capabilities = frozenset({"text"})
+    page_cost = 1.5
+    accepts_source = True
+
+    def open(self, source):
+        pdfium = self.load()
+        stream = source.stream() if source.buffer is not None else None
+        try:
+            doc = pdfium.PdfDocument(source.path if stream is None else stream)
+        except pdfium.PdfiumError as e:
+            if stream is not None:
+                stream.close()
+            if "password" in str(e).lower():
+                raise _encrypted_error()
+            raise
+        return doc, stream
+
+    def page_count(self, doc):
+        return len(doc[0])
+
+    def extract_page(self, doc, page_num):
+        page = doc[0][page_num]
+        text_page = page.get_textpage()
+        try:
+            return text_page.get_text_range().replace("\r\n", "\n")
+        finally:
+            text_page.close()
+            page.close()
+
+    def close(self, doc):
+        pdf, stream = doc
+        pdf.close()
+        if stream is not None:
+            stream.close()
+
+@register_backend
+class PyPDF2Backend(Backend):
+    name = "pypdf2"
+    label = "PyPDF2 (빠름)"
+    modules = ("PyPDF2",)
+    capabilities = frozenset({"text"})
+    page_cost = 4.0
+    accepts_source = True
+
+    def open(self, source):
+        file = source.stream()
+        try:
+            pdf_reader = self.load().PdfReader(file)
+            if pdf_reader.is_encrypted:
+                raise _encrypted_error()
+        except Exception:
+            file.close()
+            raise
+        # 파일은 문서 객체와 함께 닫아야 하므로 reader에 붙여 둠
+        pdf_reader.source_file = file
+        return pdf_reader
+
+    def page_count(self, doc):
+        return len(doc.pages)
+
+    def extract_page(self, doc, page_num):
+        return doc.pages[page_num].extract_text() or ""
+
+    def close(self, doc):
+        doc.source_file.close()
+
+@register_backend
+class PdfplumberBackend(Backend):
+    name = "pdfplumber"
+    label = "pdfplumber (권장 - 표 지원)"
+    modules = ("pdfplumber",)
+    capabilities = frozenset({"text", "tables"})
+    page_cost = 10.0
+    accepts_source = True
+
+    def open(self, source):
+        if source.buffer is None:
+            return self.load().open(source.path), None
+        stream = source.stream()
+        try:
+            return self.load().open(stream), stream
+        except Exception:
+            stream.close()
+            raise
+
+    def page_count(self, doc):
+        return len(doc[0].pages)
+
+    def extract_page(self, doc, page_num):
+        page = doc[0].pages[page_num]
+        try:
+            page_text = page.extract_text()
+            if not (page_text and page_text.strip()):
+                # 표 추출 시도
+                page_text = "".join(" ".join([cell if cell else "" for cell in row]) + "\n"
+                                    for table in page.extract_tables() for row in table if row)
+            return page_text
+        finally:
+            # 페이지별 캐시를 비워서 문서 전체의 객체가 메모리에 쌓이지 않도록 함
+            page.flush_cache()
+
+    def close(self, doc):
+        pdf, stream = doc
+        # pdfplumber는 직접 연 파일만 닫으므로 넘겨준 스트림은 따로 닫음
+        pdf.close()
+        if stream is not None:
+            stream.close()
+
+@register_backend
+class PdftotextBackend(Backend):
+    """Poppler의 pdftotext 프로그램 (페이지마다 프로그램을 실행)"""
+    name = "pdftotext"
+    label = "pdftotext (Poppler)"
+    executables = ("pdftotext", "pdfinfo")
+    capabilities = frozenset({"text"})
+    page_cost = 6.0
+
+    def open(self, pdf_path):
+        result = subprocess.run(["pdfinfo", pdf_path], capture_output=True, text=True, errors="replace")
+        if result.returncode != 0:
+            message = result.stderr.strip()
+            if "password" in message.lower():
+                raise _encrypted_error()
+            raise ExtractionError(message or "PDF 파일을 열 수 없습니다.")
+        pages = 0
+        for line in result.stdout.splitlines():
+            if line.startswith("Pages:"):
+                pages = int(line.split(":", 1)[1])
+        return {"path": pdf_path, "pages": pages}
+
+    def page_count(self, doc):
+        return doc["pages"]
+
+    def extract_page(self, doc, page_num):
+        page = str(page_num + 1)
+        result = subprocess.run(["pdftotext", "-enc", "UTF-8", "-f", page, "-l", page, doc["path"], "-"],
+                                capture_output=True, check=True)
+        # 페이지 끝의 폼 피드 문자 제거
+        return result.stdout.decode('utf-8', errors='replace').rstrip("\f")
+
+    def close(self, doc):
+        pass
+
+@register_backend
+class OcrBackend(Backend):
+    """Tesseract OCR (페이지를 이미지로 그린 뒤 인식, 가장 느림)"""
+    name = "ocr"
+    label = "OCR (이미지 기반 PDF용 - 느림)"
+    modules = ("pytesseract", "pdf2image", "PIL")
+    capabilities = frozenset({"ocr"})
+    page_cost = 200.0
+
+    def __init__(self, lang="kor+eng", quality="고품질", engine="auto", postprocess=None):
+        self.lang = lang
+        self.quality = quality
+        self.engine = engine
+        # ocr_postprocess.PostprocessRules (None이면 기본 규칙)
+        self.postprocess = postprocess
+
+    def open(self, pdf_path):
+        from pdf_ocr import count_pages, pick_renderer
+        renderer = pick_renderer(pdf_path)
+        return {"path": pdf_path, "renderer": renderer, "pages": count_pages(pdf_path, renderer)}
+
+    def page_count(self, doc):
+        return doc["pages"]
+
+    def extract_page(self, doc, page_num):
+        from pdf_ocr import ocr_page
+        return ocr_page(doc["path"], page_num, doc["pages"], self.lang, self.quality, doc["renderer"], self.engine,
+                        self.postprocess)
+
+    def close(self, doc):
+        pass
+
+def parse_page_ranges(pages):
+    """
+    '1-10,50' 형식의 페이지 범위를 ((시작, 끝), ...)으로 변환 (1부터, 끝 포함)
+
+    '5-'처럼 끝을 생략하면 마지막 페이지까지 선택한다. None이나 이미 변환한
+    범위는 그대로 반환한다.
+
+    Raises:
+        ValueError: 형식이 잘못됨
+    """
+    if pages is None or not isinstance(pages, str):
+        return pages
+    ranges = []
+    for part in filter(None, (part.strip() for part in pages.split(","))):
+        start, separator, end = part.partition("-")
+        try:
+            start = int(start)
+            end = (int(end) if end.strip() else None) if separator else start
+        except ValueError:
+            raise ValueError(f"페이지 범위는 '1-10,50' 형식이어야 합니다: {pages}") from None
+        if start < 1 or (end is not None and end < start):
+            raise ValueError(f"잘못된 페이지 범위: {part}")
+        ranges.append((start, end))
+    if not ranges:
+        raise ValueError(f"페이지 범위가 비어 있습니다: {pages!r}")
+    return tuple(ranges)
+
+def format_page_ranges(page_ranges):
+    """parse_page_ranges 결과를 다시 '1-10,50' 형식 문자열로 변환"""
+    return ",".join(str(start) if start == end else f"{start}-{end or ''}" for start, end in page_ranges)
+
+def select_pages(page_ranges, page_count):
+    """
+    페이지 범위에 해당하는 페이지 번호 목록 (0부터, 문서 순서, 중복 없음)
+
+    Raises:
+        ExtractionError: 범위에 해당하는 페이지가 문서에 없음
+    """
+    if page_ranges is None:
+        return list(range(page_count))
+    selected = set()
+    for start, end in page_ranges:
+        selected.update(range(start - 1, min(end or page_count, page_count)))
+    if not selected:
+        raise ExtractionError(f"페이지 범위({format_page_ranges(page_ranges)})에 해당하는 페이지가 "
+                              f"없습니다 (전체 {page_count}페이지).")
+    return sorted(selected)
+
+def check_max_chars(max_chars):
+    """
+    글자 수 제한 확인 (None이면 제한 없음)
+
+    Raises:
+        ValueError: 1보다 작은 값
+    """
+    if max_chars is not None and max_chars < 1:
+        raise ValueError(f"글자 수 제한은 1 이상이어야 합니다: {max_chars}")
+
+def limit_chars(pages, max_chars):
+    """
+    페이지 텍스트를 받는 대로 전달하다가 합계가 max_chars 글자가 되면 멈춤
+
+    마지막 페이지는 남은 글자 수만큼 잘라서 전달하고, 원래 제너레이터를 바로 닫아
+    나머지 페이지는 추출하지 않는다 (열린 문서와 OCR 작업도 정리됨).
+    max_chars가 None이면 pages를 그대로 반환한다.
+
+    Raises:
+        ValueError: max_chars가 1보다 작음
+    """
+    check_max_chars(max_chars)
+    if max_chars is None:
+        return pages
+    return _iter_limited(pages, max_chars)
+
+def _iter_limited(pages, max_chars):
+    pages = iter(pages)
+    remaining = max_chars
+    try:
+        for page_text in pages:
+            if len(page_text) >= remaining:
+                yield with_text(page_text, page_text[:remaining])
+                return
+            remaining -= len(page_text)
+            yield page_text
+    finally:
+        close = getattr(pages, "close", None)
+        if close is not None:
+            close()
+
+def iter_backend_pages(pdf_path, names, pages=None):
+    """
+    문서를 방법마다 한 번씩만 열고, 페이지마다 names 순서로 시도하여 텍스트를 반환
+
+    텍스트가 나오면 바로 다음 페이지로 넘어가고, 뒤쪽 방법은 필요한 페이지가
+    생겼을 때 처음 연다. 열기에 실패한 방법은 다시 시도하지 않는다.
+    pdf_path는 파일 경로 외에 bytes, 파일 객체, mmap, PdfSource도 받으며, 모든 방법이
+    같은 버퍼를 읽는다 (파일 경로만 받는 방법이 있을 때만 임시 파일을 한 번 만듦).
+    pages('1-10,50' 또는 parse_page_ranges 결과)를 지정하면 그 페이지만 추출한다.
+
+    Yields:
+        (page_num, page_count, page_text) - page_text는 텍스트를 추출한 방법과 시간이 담긴
+        PageText (모든 방법이 실패한 페이지는 빈 문자열)
+
+    Raises:
+        ExtractionError: 어떤 방법으로도 문서를 열 수 없거나 페이지가 없음
+        ValueError: 페이지 범위 형식이 잘못됨
+    """
+    page_ranges = parse_page_ranges(pages)
+    source = open_source(pdf_path)
+    backends = [get_backend(name) for name in names]
+    opened = {}
+    errors = []
+    temp_files = ExitStack()
+    temp_path = []
+
+    def backend_input(backend):
+        if backend.accepts_source:
+            return source
+        if not temp_path:
+            temp_path.append(temp_files.enter_context(source.temp_path()))
+        return temp_path[0]
+
+    def get_document(backend):
+        # 열기에 실패한 방법은 None으로 기록하여 다시 시도하지 않음
+        if backend.name not in opened:
+            try:
+                with metrics.timed("open", backend=backend.name):
+                    opened[backend.name] = backend.open(backend_input(backend))
+            except Exception as e:
+                print(f"{backend.name}로 PDF 열기 실패: {e}")
+                errors.append(e)
+                opened[backend.name] = None
+        return opened[backend.name]
+
+    try:
+        page_count = None
+        for backend in backends:
+            doc = get_document(backend)
+            if doc is not None:
+                page_count = backend.page_count(doc)
+                break
+        if page_count is None:
+            if errors and isinstance(errors[0], ExtractionError):
+                raise errors[0]
+            raise ExtractionError(str(errors[0]) if errors else "PDF 파일을 열 수 없습니다.")
+        if page_count == 0:
+            raise ExtractionError("페이지가 없는 PDF 파일입니다.")
+
+        for page_num in select_pages(page_ranges, page_count):
+            page_start = time.perf_counter()
+            page_text = ""
+            used_backend = None
+            for backend in backends:
+                doc = get_document(backend)
+                if doc is None:
+                    continue
+                try:
+                    with metrics.timed("extract", page=page_num + 1, backend=backend.name) as info:
+                        page_text = backend.extract_page(doc, page_num)
+                        info["chars"] = len(page_text or "")
+                except Exception as e:
+                    print(f"페이지 {page_num + 1}: {backend.name}로 텍스트 추출 중 오류 발생: {e}")
+                    continue
+                if page_text and page_text.strip():
+                    used_backend = backend.name
+                    break
+                page_text = ""
+            yield page_num, page_count, PageText(page_text, page_num + 1, used_backend,
+                                                 seconds=time.perf_counter() - page_start)
+    finally:
+        for backend in backends:
+            doc = opened.get(backend.name)
+            if doc is not None:
+                backend.close(doc)
+        temp_files.close()
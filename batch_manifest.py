@@ -0,0 +1,131 @@
+import json
+import os
+import time
+
+from extraction_cache import file_sha256
+
+# 출력 폴더에 저장되는 매니페스트 파일 이름
+MANIFEST_NAME = ".pdf_to_txt_manifest.jsonl"
+
+class BatchManifest:
+    """
+    일괄 변환 결과를 기록하는 매니페스트
+    
+    PDF마다 크기, 수정 시각, 내용 해시, 상태, 출력 경로를 기록한다.
+    파일 하나가 끝날 때마다 한 줄씩 덧붙여 쓰므로 변환 도중 프로그램이
+    종료되어도 그때까지의 결과는 남고, 다시 실행하면 새 파일, 바뀐 파일,
+    실패한 파일만 변환한다. 같은 파일의 기록이 여러 줄이면 마지막 줄이 유효하다.
+    """
+    def __init__(self, folder):
+        """
+        Args:
+            folder (str): 매니페스트를 저장할 폴더 (보통 출력 폴더)
+        """
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self.entries = {}
+        self._load()
+    
+    def _load(self):
+        """기존 매니페스트를 읽고 파일별 마지막 기록만 남겨서 다시 저장"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as manifest_file:
+            for line in manifest_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 무시
+                    continue
+                self.entries[entry["name"]] = entry
+        self.compact()
+    
+    def compact(self):
+        """중복 기록을 없애고 파일별 마지막 기록만 남김"""
+        temp_path = self.path + ".part"
+        with open(temp_path, 'w', encoding='utf-8') as manifest_file:
+            for entry in self.entries.values():
+                manifest_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.path)
+    
+    def needs_conversion(self, name, pdf_path, output_path, method):
+        """
+        다시 변환해야 하는지 확인
+        
+        성공 기록이 있고 크기와 수정 시각이 같으면 건너뛴다. 수정 시각만 바뀌고
+        내용 해시가 같으면 (복사, touch 등) 기록만 갱신하고 건너뛴다.
+        
+        Args:
+            name (str): 매니페스트 안에서 파일을 구분하는 이름 (입력 폴더 기준 경로)
+            pdf_path (str): 입력 PDF 파일 경로
+            output_path (str): 출력 파일 경로. None이면 기록된 출력 파일(출력 대상의 조각 파일 등)이
+                있는지만 확인
+            method (str): 추출 방법
+        """
+        entry = self.entries.get(name)
+        if (entry is None or entry["status"] != "success" or entry["method"] != method
+                or output_path not in (None, entry["output_path"]) or not entry["output_path"]
+                or not os.path.exists(entry["output_path"])):
+            return True
+        
+        stat = os.stat(pdf_path)
+        if stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"]:
+            return False
+        if stat.st_size != entry["size"] or file_sha256(pdf_path) != entry["sha256"]:
+            return True
+        
+        entry["mtime"] = stat.st_mtime
+        self._append(entry)
+        return False
+    
+    def record(self, name, result, method):
+        """
+        변환 결과 기록
+        
+        Args:
+            name (str): 매니페스트 안에서 파일을 구분하는 이름
+            result (ConversionResult): 변환 결과
+            method (str): 추출 방법
+        """
+        entry = self._make_entry(name, result, method)
+        self.entries[name] = entry
+        self._append(entry)
+    
+    def record_many(self, results, method):
+        """
+        여러 변환 결과를 한 번에 기록 (출력 대상이 묶음 하나를 기록할 때, fsync 한 번)
+        
+        Args:
+            results: (이름, ConversionResult) 목록
+            method (str): 추출 방법
+        """
+        entries = [self._make_entry(name, result, method) for name, result in results]
+        for entry in entries:
+            self.entries[entry["name"]] = entry
+        self._append(*entries)
+    
+    def _make_entry(self, name, result, method):
+        try:
+            stat = os.stat(result.pdf_path)
+            size, mtime = stat.st_size, stat.st_mtime
+            sha256 = file_sha256(result.pdf_path) if result.success else None
+        except OSError:
+            size, mtime, sha256 = None, None, None
+        
+        return {
+            "name": name,
+            "size": size,
+            "mtime": mtime,
+            "sha256": sha256,
+            "status": "success" if result.success else "failed",
+            "method": method,
+            "output_path": result.output_path,
+            "error": result.error,
+            "updated_at": time.time(),
+        }
+    
+    def _append(self, *entries):
+        # 한 줄씩 바로 디스크에 기록하여 비정상 종료 시에도 결과가 남도록 함
+        with open(self.path, 'a', encoding='utf-8') as manifest_file:
+            manifest_file.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+            manifest_file.flush()
+            os.fsync(manifest_file.fileno())
@@ -0,0 +1,359 @@
+"""
+추출 방법 비교 벤치마크
+
+PyMuPDF로 정답 텍스트를 알고 있는 합성 PDF 모음을 만들고, 각 추출 방법으로
+변환하여 초당 페이지 수, 최대 메모리 사용량(RSS), 정답 대비 문자 정확도를 잰다.
+결과를 JSON으로 저장해 두고 --baseline으로 이전 버전의 결과와 비교할 수 있다
+(속도나 정확도가 허용 범위보다 떨어지면 종료 코드 1).
+
+합성 문서:
+    text       영어 본문
+    mixed      한국어/영어 혼합 본문
+    tables     선으로 그린 표
+    image      텍스트를 이미지로만 넣은 스캔 문서 (OCR만 추출 가능)
+    large      페이지 수가 많은 문서
+
+추출 방법 (--methods로 선택):
+    cli:<방법>   pdf_to_txt.iter_pages (pdfplumber, pypdf2, pymupdf, pypdfium2, pdftotext, auto, ocr)
+    gui:<방법>   PDFConverter.iter_pages (fallback, hybrid 등)
+
+메모리 사용량이 서로 섞이지 않도록 측정마다 별도 프로세스에서 실행한다.
+
+사용법:
+    python benchmarks/bench_backends.py [--output results.json] [--baseline 이전.json]
+                                        [--methods cli:pymupdf,gui:hybrid] [--documents text,mixed]
+                                        [--repeat N] [--large-pages N] [--corpus-dir 폴더]
+"""
+import argparse
+import difflib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+try:
+    import resource
+except ImportError:
+    # Windows에서는 메모리 사용량을 재지 않음
+    resource = None
+
+# 합성 문서 내용을 바꾸면 이전 결과와 비교할 수 없으므로 버전을 올린다
+CORPUS_VERSION = 1
+DOCUMENTS = ("text", "mixed", "tables", "image", "large")
+
+ENGLISH_WORDS = ("document", "text", "page", "extract", "layout", "table", "value", "report",
+                 "quarterly", "summary", "revenue", "growth", "system", "process", "result",
+                 "analysis", "market", "customer", "product", "service", "quality", "data")
+KOREAN_WORDS = ("문서", "텍스트", "페이지", "추출", "보고서", "분기", "요약", "매출", "성장",
+                "시스템", "처리", "결과", "분석", "시장", "고객", "제품", "서비스", "품질", "자료")
+
+def make_lines(rng, words, count, min_words=6, max_words=10):
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(min_words, max_words)))
+            for _ in range(count)]
+
+def add_text_page(document, lines, fontname="helv"):
+    page = document.new_page()
+    for i, line in enumerate(lines):
+        page.insert_text((50, 60 + i * 16), line, fontname=fontname, fontsize=10)
+    return page
+
+def build_text(fitz, rng, pages):
+    document = fitz.open()
+    truth = []
+    for page_num in range(pages):
+        lines = [f"Page {page_num + 1}"] + make_lines(rng, ENGLISH_WORDS, 40)
+        add_text_page(document, lines)
+        truth.append("\n".join(lines))
+    return document, truth
+
+def build_mixed(fitz, rng, pages):
+    """한국어와 영어 단어가 섞인 본문 (PyMuPDF 내장 한글 글꼴 사용)"""
+    document = fitz.open()
+    truth = []
+    for page_num in range(pages):
+        lines = [f"페이지 {page_num + 1}"] + make_lines(rng, KOREAN_WORDS + ENGLISH_WORDS, 40)
+        add_text_page(document, lines, fontname="korea")
+        truth.append("\n".join(lines))
+    return document, truth
+
+def build_tables(fitz, rng, pages, rows=20, columns=5):
+    document = fitz.open()
+    truth = []
+    for _ in range(pages):
+        page = document.new_page()
+        cells = [["Item", "Region", "Units", "Price", "Total"]]
+        for _ in range(rows - 1):
+            units, price = rng.randint(1, 999), rng.randint(100, 9999)
+            cells.append([rng.choice(ENGLISH_WORDS), rng.choice(("North", "South", "East", "West")),
+                          str(units), str(price), str(units * price)])
+        left, top, width, height = 50, 60, 100, 24
+        for row_num, row in enumerate(cells):
+            for column_num, cell in enumerate(row):
+                x, y = left + column_num * width, top + row_num * height
+                page.draw_rect(fitz.Rect(x, y, x + width, y + height), color=(0, 0, 0), width=0.5)
+                page.insert_text((x + 4, y + 16), cell, fontsize=10)
+        truth.append("\n".join(" ".join(row) for row in cells))
+    return document, truth
+
+def build_image(fitz, rng, pages, dpi=200):
+    """텍스트 페이지를 그레이스케일 이미지로 그려서 이미지만 들어 있는 페이지로 만듦"""
+    text_document, truth = build_text(fitz, rng, pages)
+    document = fitz.open()
+    for text_page in text_document:
+        pix = text_page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        page = document.new_page(width=text_page.rect.width, height=text_page.rect.height)
+        page.insert_image(page.rect, pixmap=pix)
+    text_document.close()
+    return document, truth
+
+def build_corpus(corpus_dir, documents, large_pages):
+    """
+    합성 문서와 정답 텍스트(truth.json) 생성 (같은 설정으로 이미 만들었으면 재사용)
+    
+    Returns:
+        dict: 문서 이름 -> {"path": PDF 경로, "truth": 페이지별 정답 텍스트}
+    """
+    import fitz
+    
+    settings = {"version": CORPUS_VERSION, "large_pages": large_pages}
+    truth_path = os.path.join(corpus_dir, "truth.json")
+    corpus = {}
+    if os.path.exists(truth_path):
+        with open(truth_path, encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved.get("settings") == settings:
+            corpus = saved["documents"]
+    
+    builders = {
+        "text": lambda rng: build_text(fitz, rng, 20),
+        "mixed": lambda rng: build_mixed(fitz, rng, 20),
+        "tables": lambda rng: build_tables(fitz, rng, 10),
+        "image": lambda rng: build_image(fitz, rng, 5),
+        "large": lambda rng: build_text(fitz, rng, large_pages),
+    }
+    os.makedirs(corpus_dir, exist_ok=True)
+    changed = False
+    for name in documents:
+        path = os.path.join(corpus_dir, f"{name}.pdf")
+        if name in corpus and os.path.exists(path):
+            continue
+        # 문서마다 고정된 시드를 사용하여 어디서나 같은 문서가 만들어지도록 함
+        document, truth = builders[name](random.Random(f"{CORPUS_VERSION}:{name}"))
+        document.save(path, garbage=3, deflate=True)
+        document.close()
+        corpus[name] = {"path": path, "truth": truth}
+        changed = True
+    if changed:
+        with open(truth_path, 'w', encoding='utf-8') as f:
+            json.dump({"settings": settings, "documents": corpus}, f, ensure_ascii=False)
+    return {name: corpus[name] for name in documents}
+
+# 글자 단위로 비교할 최대 길이 (더 긴 구간은 단어끼리 짝지어 비교)
+MAX_CHAR_DIFF = 1000
+
+def char_accuracy(expected, actual):
+    """
+    공백을 무시한 문자 단위 일치율 (0~1, difflib ratio와 같은 정의)
+    
+    글자 단위 비교는 글자 수의 제곱에 비례하여 깨진 텍스트에서 매우 느리므로,
+    먼저 단어 단위로 맞춘 뒤 서로 다른 구간만 글자 단위로 비교한다.
+    """
+    expected_words = expected.split()
+    actual_words = actual.split()
+    total = sum(map(len, expected_words)) + sum(map(len, actual_words))
+    if not total:
+        return 1.0
+    matched = 0
+    words = difflib.SequenceMatcher(None, expected_words, actual_words, autojunk=False)
+    for tag, i1, i2, j1, j2 in words.get_opcodes():
+        if tag == "equal":
+            matched += sum(map(len, expected_words[i1:i2]))
+        elif tag == "replace":
+            expected_part = "".join(expected_words[i1:i2])
+            actual_part = "".join(actual_words[j1:j2])
+            if len(expected_part) <= MAX_CHAR_DIFF and len(actual_part) <= MAX_CHAR_DIFF:
+                pairs = [(expected_part, actual_part)]
+            else:
+                pairs = zip(expected_words[i1:i2], actual_words[j1:j2])
+            for expected_chars, actual_chars in pairs:
+                chars = difflib.SequenceMatcher(None, expected_chars, actual_chars, autojunk=False)
+                matched += sum(block.size for block in chars.get_matching_blocks())
+    return 2 * matched / total
+
+def document_accuracy(truth, pages):
+    """페이지별 정확도를 정답 길이로 가중 평균 (추출되지 않은 페이지는 0)"""
+    total = sum(len(page_truth) for page_truth in truth)
+    matched = sum(char_accuracy(page_truth, page_text) * len(page_truth)
+                  for page_truth, page_text in zip(truth, pages))
+    return matched / total if total else 1.0
+
+def peak_rss_mb(who):
+    """최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def open_pages(method, pdf_path):
+    """'cli:방법' 또는 'gui:방법'에 맞는 페이지별 텍스트 제너레이터"""
+    interface, _, name = method.partition(":")
+    if interface == "cli":
+        from pdf_to_txt import iter_pages
+        return iter_pages(pdf_path, name)
+    if interface == "gui":
+        from pdf_to_txt_gui import PDFConverter
+        return PDFConverter(method=name).iter_pages(name, pdf_path)
+    raise ValueError(f"알 수 없는 추출 방법: {method}")
+
+def run_worker(method, pdf_path, truth_path, document):
+    """
+    측정 프로세스: 추출 후 결과를 JSON 한 줄로 출력
+    
+    추출 라이브러리의 print 출력은 버리고, 정확도 계산 시간은 추출 시간에 넣지 않는다.
+    """
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    result = {"method": method, "document": document}
+    try:
+        start_time = time.perf_counter()
+        pages = list(open_pages(method, pdf_path))
+        elapsed = time.perf_counter() - start_time
+    except Exception as e:
+        result["error"] = str(e) or type(e).__name__
+    else:
+        with open(truth_path, encoding='utf-8') as f:
+            truth = json.load(f)["documents"][document]["truth"]
+        result.update(pages=len(truth), extracted_pages=len(pages), seconds=round(elapsed, 4),
+                      pages_per_sec=round(len(truth) / elapsed, 2) if elapsed else None,
+                      accuracy=round(document_accuracy(truth, pages), 4))
+    result["peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_SELF) if resource else None
+    # OCR 작업자 프로세스 중 가장 큰 것
+    result["children_peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None
+    stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+def measure(method, document, corpus_dir, corpus, timeout):
+    """별도 프로세스에서 한 번 측정한 결과"""
+    command = [sys.executable, os.path.abspath(__file__), "--worker", method, corpus[document]["path"],
+               os.path.join(corpus_dir, "truth.json"), document]
+    try:
+        completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, encoding='utf-8',
+                                   timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"method": method, "document": document, "error": f"{timeout}초 시간 초과"}
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        error = (completed.stderr.strip().splitlines() or [f"종료 코드 {completed.returncode}"])[-1]
+        return {"method": method, "document": document, "error": error}
+    return json.loads(lines[-1])
+
+def default_methods():
+    """설치된 라이브러리로 실행할 수 있는 추출 방법 목록"""
+    from backends import backend_names, is_available
+    methods = [f"cli:{name}" for name in backend_names("text")] + ["cli:auto", "gui:fallback"]
+    if is_available("ocr"):
+        methods.append("gui:hybrid")
+    if is_available("ocr") and shutil.which("tesseract"):
+        methods.append("cli:ocr")
+    else:
+        print("Tesseract를 사용할 수 없어 cli:ocr은 제외합니다.")
+    return methods
+
+def compare(results, baseline_path, tolerance):
+    """
+    이전 결과와 비교하여 나빠진 항목 목록 반환
+    
+    초당 페이지 수는 tolerance 비율보다 많이 줄면, 정확도는 0.01 넘게 떨어지면 나빠진 것으로 본다.
+    """
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(item["method"], item["document"]): item for item in json.load(f)["results"]}
+    regressions = []
+    for item in results:
+        old = baseline.get((item["method"], item["document"]))
+        if old is None or "error" in old:
+            continue
+        key = f"{item['method']} / {item['document']}"
+        if "error" in item:
+            regressions.append(f"{key}: 이전에는 성공했지만 실패함 ({item['error']})")
+            continue
+        if item["pages_per_sec"] < old["pages_per_sec"] * (1 - tolerance):
+            regressions.append(f"{key}: 초당 페이지 {old['pages_per_sec']} -> {item['pages_per_sec']}")
+        if item["accuracy"] < old["accuracy"] - 0.01:
+            regressions.append(f"{key}: 정확도 {old['accuracy']:.1%} -> {item['accuracy']:.1%}")
+    return regressions
+
+def format_number(value, spec):
+    return "-" if value is None else format(value, spec)
+
+def main():
+    if len(sys.argv) == 6 and sys.argv[1] == "--worker":
+        run_worker(*sys.argv[2:])
+        return
+    
+    parser = argparse.ArgumentParser(description="추출 방법 비교 벤치마크")
+    parser.add_argument("--methods", help="쉼표로 구분한 추출 방법 (기본값: 설치된 방법 모두)")
+    parser.add_argument("--documents", default=",".join(DOCUMENTS), help="쉼표로 구분한 합성 문서 이름")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (가장 빠른 결과 사용)")
+    parser.add_argument("--large-pages", type=int, default=300, help="large 문서의 페이지 수")
+    parser.add_argument("--corpus-dir", help="합성 문서를 만들어 둘 폴더 (기본값: 임시 폴더)")
+    parser.add_argument("--timeout", type=float, default=600, help="측정 하나의 제한 시간 (초)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용할 초당 페이지 수 감소 비율")
+    args = parser.parse_args()
+    
+    documents = [name.strip() for name in args.documents.split(",") if name.strip()]
+    unknown = [name for name in documents if name not in DOCUMENTS]
+    if unknown:
+        parser.error(f"알 수 없는 문서: {', '.join(unknown)} (사용 가능: {', '.join(DOCUMENTS)})")
+    methods = args.methods.split(",") if args.methods else default_methods()
+    
+    corpus_dir = args.corpus_dir or os.path.join(tempfile.gettempdir(), "pdf_to_txt_bench_corpus")
+    print(f"합성 문서 준비 중: {corpus_dir}")
+    corpus = build_corpus(corpus_dir, documents, args.large_pages)
+    
+    results = []
+    print(f"\n{'방법':<18}{'문서':<8}{'페이지':>7}{'페이지/초':>11}{'RSS(MB)':>9}{'정확도':>9}")
+    for method in methods:
+        for document in documents:
+            runs = [measure(method, document, corpus_dir, corpus, args.timeout) for _ in range(args.repeat)]
+            succeeded = [run for run in runs if "error" not in run]
+            result = max(succeeded, key=lambda run: run["pages_per_sec"] or 0) if succeeded else runs[-1]
+            results.append(result)
+            if "error" in result:
+                print(f"{method:<18}{document:<8}  실패: {result['error']}")
+                continue
+            print(f"{method:<18}{document:<8}{result['pages']:>7}{result['pages_per_sec']:>11.1f}"
+                  f"{format_number(result['peak_rss_mb'], '.0f'):>9}{result['accuracy']:>9.1%}")
+    
+    report = {
+        "corpus_version": CORPUS_VERSION,
+        "large_pages": args.large_pages,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        print(f"\n이전 결과({args.baseline})와 비교: " + ("나빠진 항목 없음" if not regressions else ""))
+        for regression in regressions:
+            print(f"  {regression}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+OCR 결과 정리 벤치마크
+
+줄마다 str.replace를 여러 번 호출하던 기존 정리 방식과 ocr_postprocess의
+방식(줄을 먼저 거른 뒤 페이지 전체에 치환표를 한 번 적용)의 페이지당 처리 시간을 비교한다.
+기본 규칙의 결과가 기존 방식과 똑같은지도 확인한다 (다르면 종료 코드 1).
+
+입력은 OCR 결과처럼 만든 페이지 텍스트(한국어/영어 문장, 전각 숫자, 세로선,
+표의 선을 읽은 쓰레기 줄, 줄 끝 하이픈)이다.
+
+사용법:
+    python benchmarks/bench_postprocess.py [--pages N] [--lines N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ocr_postprocess import DEFAULT_RULES, PostprocessRules, clean_ocr_text
+
+WORDS = ("문서", "텍스트", "페이지", "보고서", "분기", "매출", "결과", "분석", "document", "report",
+         "quarterly", "revenue", "growth", "analysis", "market", "|", "１２３", "２０２４년", "９월")
+JUNK_LINES = ("----------", "_____", ". . . .", "-", "  ", "|", "—")
+
+def make_page(rng, lines):
+    """OCR 결과처럼 만든 페이지 텍스트"""
+    page = []
+    for _ in range(lines):
+        if rng.random() < 0.15:
+            page.append(rng.choice(JUNK_LINES))
+            continue
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+        if rng.random() < 0.05:
+            line += " inter-"
+        page.append(("  " if rng.random() < 0.3 else "") + line)
+    return "\n".join(page)
+
+def clean_with_replace(page_text):
+    """기존 방식: 줄마다 쓰레기 줄 확인용 replace 4번 + 문자 치환 replace 11번"""
+    cleaned_lines = []
+    for line in page_text.strip().split('\n'):
+        line = line.strip()
+        if line and len(line) > 1 and not line.replace(' ', '').replace('.', '').replace('_', '').replace('-', '') == '':
+            line = line.replace('|', 'I')
+            line = line.replace('０', '0')
+            line = line.replace('１', '1')
+            line = line.replace('２', '2')
+            line = line.replace('３', '3')
+            line = line.replace('４', '4')
+            line = line.replace('５', '5')
+            line = line.replace('６', '6')
+            line = line.replace('７', '7')
+            line = line.replace('８', '8')
+            line = line.replace('９', '9')
+            cleaned_lines.append(line)
+    return cleaned_lines
+
+def time_per_page(func, pages, repeat):
+    """페이지 하나를 처리하는 평균 시간 (마이크로초, repeat번 중 가장 빠른 값)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        elapsed = (time.perf_counter() - start) / len(pages)
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 결과 정리 벤치마크")
+    parser.add_argument("--pages", type=int, default=200, help="입력 페이지 수")
+    parser.add_argument("--lines", type=int, default=60, help="페이지당 줄 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (가장 빠른 결과 사용)")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    pages = [make_page(rng, args.lines) for _ in range(args.pages)]
+    
+    mismatches = sum(clean_with_replace(page) != clean_ocr_text(page) for page in pages)
+    print(f"입력: {args.pages}페이지, 페이지당 {args.lines}줄")
+    print(f"기본 규칙 결과가 기존 방식과 다른 페이지: {mismatches}\n")
+    
+    variants = [
+        ("str.replace 연쇄 (기존)", clean_with_replace),
+        ("페이지 단위 치환 (기본 규칙)", lambda page: clean_ocr_text(page, DEFAULT_RULES)),
+        ("+ NFKC 정규화", lambda page: clean_ocr_text(page, PostprocessRules(nfkc=True))),
+        ("+ NFKC + 하이픈 연결", lambda page: clean_ocr_text(page, PostprocessRules(nfkc=True, join_hyphens=True))),
+    ]
+    baseline = None
+    print(f"{'방법':<30}{'페이지당(µs)':>14}{'속도':>8}")
+    for name, func in variants:
+        elapsed = time_per_page(func, pages, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<30}{elapsed:>14.1f}{baseline / elapsed:>7.2f}x")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+OCR 이미지 전처리 벤치마크
+
+기존 ImageEnhance 3단계 처리(enhance_image_pil)와 NumPy 한 단계 처리
+(preprocess_gray)의 속도를 비교한다. Tesseract가 설치되어 있으면 같은 이미지를
+OCR하여 정답 텍스트 대비 문자 정확도도 함께 비교한다.
+
+PyMuPDF로 텍스트가 들어 있는 페이지를 만들고 3배 크기로 그린 뒤,
+스캔 문서처럼 약간 기울이고 흐리게 한 이미지를 입력으로 사용한다.
+
+사용법:
+    python benchmarks/bench_preprocess.py [--repeat N] [--skew 각도] [--lang eng]
+"""
+import argparse
+import difflib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz
+from PIL import Image, ImageFilter
+
+from image_preprocess import NUMPY_AVAILABLE, enhance_image_pil, preprocess_gray
+
+SAMPLE_LINES = [
+    "PDF to TXT converter benchmark page {0}",
+    "The quick brown fox jumps over the lazy dog. 0123456789",
+    "Pack my box with five dozen liquor jugs, said the clerk.",
+    "Sphinx of black quartz, judge my vow; {0} times over.",
+    "How vexingly quick daft zebras jump across the field!",
+]
+
+def make_page_image(skew, line_count=45):
+    """정답 텍스트와 스캔한 것처럼 만든 그레이스케일 페이지 이미지"""
+    document = fitz.open()
+    page = document.new_page()
+    lines = [SAMPLE_LINES[i % len(SAMPLE_LINES)].format(i) for i in range(line_count)]
+    for i, line in enumerate(lines):
+        page.insert_text((50, 60 + i * 16), line, fontsize=10)
+    pix = page.get_pixmap(matrix=fitz.Matrix(3.0, 3.0), colorspace=fitz.csGRAY, alpha=False)
+    image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    document.close()
+    
+    # 스캔 문서처럼 흐리게, 어둡게, 기울어지게 만듦
+    image = image.filter(ImageFilter.GaussianBlur(1.2)).point(lambda value: int(value * 0.85 + 20))
+    if skew:
+        image = image.rotate(-skew, resample=Image.Resampling.BICUBIC, expand=True, fillcolor=235)
+    return "\n".join(lines), image
+
+def time_call(func, repeat):
+    """func를 repeat번 실행한 평균 시간(초)과 마지막 결과"""
+    result = func()  # 첫 실행은 준비 과정이 섞이므로 제외
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+def char_accuracy(expected, actual):
+    """공백을 무시한 문자 단위 일치율 (0~1)"""
+    expected = "".join(expected.split())
+    actual = "".join(actual.split())
+    return difflib.SequenceMatcher(None, expected, actual, autojunk=False).ratio()
+
+def check_ocr(lang):
+    """정확도 비교에 쓸 OCR 함수 (Tesseract를 사용할 수 없으면 None)"""
+    try:
+        from pdf_ocr import OCR_AVAILABLE, run_tesseract
+        if not OCR_AVAILABLE:
+            raise RuntimeError("pytesseract가 설치되지 않았습니다.")
+        run_tesseract(Image.new("L", (32, 32), 255), lang, "--psm 6")
+    except Exception as e:
+        print(f"OCR을 사용할 수 없어 정확도 비교는 생략합니다: {e}")
+        return None
+    return lambda image: run_tesseract(image, lang, "--psm 6")[0]
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 이미지 전처리 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="방법별 반복 횟수")
+    parser.add_argument("--skew", type=float, default=1.5, help="입력 이미지 기울기 (도)")
+    parser.add_argument("--lang", default="eng", help="정확도 비교에 사용할 OCR 언어")
+    args = parser.parse_args()
+    
+    if not NUMPY_AVAILABLE:
+        print("NumPy가 설치되지 않아 preprocess_gray가 ImageEnhance로 동작합니다.")
+    
+    ocr_text = check_ocr(args.lang)
+    expected, image = make_page_image(args.skew)
+    print(f"입력 이미지: {image.width}x{image.height}, 기울기 {args.skew}도, 반복 {args.repeat}회\n")
+    
+    variants = [
+        ("ImageEnhance 3단계 (기존)", lambda: enhance_image_pil(image)),
+        ("NumPy 한 단계", lambda: preprocess_gray(image)),
+        ("NumPy + Otsu 이진화", lambda: preprocess_gray(image, binarize=True)),
+        ("NumPy + 기울기 보정", lambda: preprocess_gray(image, deskew=True)),
+        ("NumPy + 이진화 + 기울기 보정", lambda: preprocess_gray(image, binarize=True, deskew=True)),
+    ]
+    
+    baseline = None
+    print(f"{'방법':<28}{'시간(ms)':>10}{'속도':>8}{'정확도':>10}")
+    for name, func in variants:
+        elapsed, processed = time_call(func, args.repeat)
+        baseline = baseline or elapsed
+        accuracy = f"{char_accuracy(expected, ocr_text(processed)) * 100:.1f}%" if ocr_text else "-"
+        print(f"{name:<28}{elapsed * 1000:>10.1f}{baseline / elapsed:>7.2f}x{accuracy:>10}")
+
+if __name__ == "__main__":
+    main()
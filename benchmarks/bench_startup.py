@@ -0,0 +1,112 @@
+"""
+시작 시간 벤치마크
+
+python -X importtime으로 각 모듈을 import하는 데 걸린 시간을 재고, 추출 라이브러리
+(PyPDF2, pdfplumber, PyMuPDF, OCR 라이브러리)가 시작할 때 불려 오지 않는지 확인한다.
+반대로 변환 서버의 작업자 프로세스는 시작할 때 설치된 추출 라이브러리를 모두 불러 두는지 확인한다.
+예산을 넘거나 라이브러리가 미리 불려 오거나 작업자가 불러 두지 않으면 종료 코드 1로 끝나므로
+CI에서 사용할 수 있다.
+
+사용법:
+    python benchmarks/bench_startup.py [--repeat N] [--scale 배수]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# 모듈별 import 시간 예산 (밀리초, 여러 번 잰 값 중 가장 짧은 시간 기준)
+IMPORT_BUDGETS_MS = {
+    "pdf_to_txt": 120,
+    "pdf_to_txt_gui": 250,
+}
+
+# 시작할 때 불려 오면 안 되는 추출 라이브러리
+HEAVY_MODULES = ("PyPDF2", "pdfplumber", "fitz", "pymupdf", "pytesseract", "pdf2image", "PIL", "tesserocr")
+
+def measure_import(module):
+    """
+    모듈 import 시간(초)과 함께 불려 온 무거운 라이브러리 목록
+    
+    Returns:
+        tuple: (import 시간, 불려 온 HEAVY_MODULES 목록)
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    
+    total_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name.split(".")[0] in HEAVY_MODULES:
+            loaded.add(name.split(".")[0])
+        if name == module:
+            total_us = int(cumulative)
+    return total_us / 1e6, sorted(loaded)
+
+def measure_usage():
+    """인자 없이 실행하여 사용법을 출력하는 데 걸린 시간(초)"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "pdf_to_txt.py"], cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - start
+
+def _loaded_modules(_):
+    return sorted(sys.modules)
+
+def check_server_warm_up():
+    """
+    변환 서버처럼 _warm_up_worker로 시작한 작업자 프로세스에서 불려 오지 않은 추출 라이브러리 목록
+    
+    설치된 텍스트 추출 방법의 라이브러리가 모두 작업자의 sys.modules에 있어야 한다.
+    """
+    from backends import _registry, backend_names
+    from pdf_to_txt_server import _warm_up_worker
+    with ProcessPoolExecutor(max_workers=1, initializer=_warm_up_worker, initargs=("kor+eng",)) as executor:
+        loaded = set(executor.submit(_loaded_modules, None).result())
+    return sorted(module for name in backend_names("text") for module in _registry[name].modules
+                  if module not in loaded)
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (가장 짧은 시간 사용)")
+    parser.add_argument("--scale", type=float, default=1.0, help="느린 컴퓨터에서 예산에 곱할 배수")
+    args = parser.parse_args()
+    
+    failed = False
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        try:
+            measurements = [measure_import(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{module}: import 실패 ({e}) - 건너뜀")
+            continue
+        elapsed_ms = min(elapsed for elapsed, _ in measurements) * 1000
+        loaded = measurements[0][1]
+        budget_ms *= args.scale
+        status = "통과" if elapsed_ms <= budget_ms and not loaded else "실패"
+        failed = failed or status == "실패"
+        print(f"{module}: import {elapsed_ms:.1f}ms (예산 {budget_ms:.0f}ms) - {status}")
+        if loaded:
+            print(f"  시작할 때 불려 온 추출 라이브러리: {', '.join(loaded)}")
+    
+    usage_ms = min(measure_usage() for _ in range(args.repeat)) * 1000
+    print(f"사용법 출력 (인터프리터 시작 포함): {usage_ms:.1f}ms")
+    
+    missing = check_server_warm_up()
+    failed = failed or bool(missing)
+    print(f"변환 서버 작업자 미리 불러오기 - {'실패' if missing else '통과'}")
+    if missing:
+        print(f"  작업자가 불러 두지 않은 추출 라이브러리: {', '.join(missing)}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
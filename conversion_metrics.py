@@ -0,0 +1,238 @@
+"""
+변환 단계별 시간 측정
+
+변환 과정의 각 단계(문서 열기, 페이지 추출, 이미지 변환, 전처리, Tesseract 실행,
+파일 기록)가 끝날 때마다 이벤트(dict) 하나를 만들어 등록된 출력 대상(sink)에 전달한다.
+
+    {"stage": "tesseract", "seconds": 0.82, "file": "a.pdf", "page": 3,
+     "config": "--psm 6", "retry": false, "confidence": 91.2, "chars": 1830, ...}
+
+출력 대상이 하나도 없으면 아무것도 기록하지 않으므로 측정 비용이 거의 없다.
+작업자 프로세스에서 생긴 이벤트는 iter_parallel이 결과와 함께 부모 프로세스로
+가져와서 부모의 출력 대상에 전달한다.
+
+    import conversion_metrics as metrics
+    metrics.add_sink(metrics.JsonLinesSink("metrics.jsonl"))
+    metrics.add_sink(metrics.PrometheusTextfileSink("/var/lib/node_exporter/pdf_to_txt.prom"))
+    metrics.add_sink(metrics.CallbackSink(lambda event: print(event)))
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 단계 이름
+STAGES = ("open", "extract", "rasterize", "preprocess", "tesseract", "write", "file")
+
+_sinks = []
+_sinks_lock = threading.Lock()
+
+# 작업자 프로세스에서 부모로 돌려보낼 이벤트를 모으는 목록 (모으는 중이 아니면 None)
+_collected = None
+
+# 이벤트에 함께 기록할 현재 처리 중인 파일/페이지 정보 (스레드마다 따로 보관)
+_local = threading.local()
+
+class JsonLinesSink:
+    """이벤트를 JSON 한 줄씩 파일 끝에 추가"""
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+    
+    def write(self, event):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        # 변환 도중에도 다른 프로그램이 읽을 수 있도록 파일 단위로 내보냄
+        if event["stage"] == "file":
+            self._file.flush()
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class PrometheusTextfileSink:
+    """
+    단계별 누적 시간과 파일별 변환 시간 분포를 Prometheus 텍스트 형식 파일로 기록
+    
+    node_exporter의 textfile collector가 읽을 수 있도록 파일 하나가 끝날 때마다
+    임시 파일에 쓴 뒤 교체한다 (읽는 쪽이 쓰다 만 파일을 보지 않음).
+    """
+    # 파일 하나의 변환 시간 히스토그램 구간 (초)
+    FILE_SECONDS_BUCKETS = (0.5, 1, 5, 10, 30, 60, 300, 900)
+    
+    def __init__(self, path, prefix="pdf_to_txt"):
+        self.path = path
+        self.prefix = prefix
+        self.stage_seconds = {}
+        self.stage_count = {}
+        self.stage_chars = {}
+        self.files = {}
+        self.file_buckets = [0] * len(self.FILE_SECONDS_BUCKETS)
+        self.file_seconds_sum = 0.0
+        self.file_seconds_count = 0
+        self.file_bytes = 0
+    
+    def write(self, event):
+        stage = event["stage"]
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + event["seconds"]
+        self.stage_count[stage] = self.stage_count.get(stage, 0) + 1
+        if "chars" in event:
+            self.stage_chars[stage] = self.stage_chars.get(stage, 0) + event["chars"]
+        if stage != "file":
+            return
+        status = "success" if event.get("success") else "failed"
+        self.files[status] = self.files.get(status, 0) + 1
+        for i, bound in enumerate(self.FILE_SECONDS_BUCKETS):
+            if event["seconds"] <= bound:
+                self.file_buckets[i] += 1
+        self.file_seconds_sum += event["seconds"]
+        self.file_seconds_count += 1
+        self.file_bytes += event.get("bytes", 0)
+        self.flush()
+    
+    def render(self):
+        """현재까지의 값을 Prometheus 텍스트 형식 문자열로 반환"""
+        p = self.prefix
+        lines = [f"# HELP {p}_stage_seconds_total 단계별 누적 처리 시간 (초)",
+                 f"# TYPE {p}_stage_seconds_total counter"]
+        lines += [f'{p}_stage_seconds_total{{stage="{stage}"}} {seconds:.6f}'
+                  for stage, seconds in sorted(self.stage_seconds.items())]
+        lines += [f"# HELP {p}_stage_events_total 단계별 실행 횟수",
+                  f"# TYPE {p}_stage_events_total counter"]
+        lines += [f'{p}_stage_events_total{{stage="{stage}"}} {count}'
+                  for stage, count in sorted(self.stage_count.items())]
+        lines += [f"# HELP {p}_stage_chars_total 단계별 누적 글자 수",
+                  f"# TYPE {p}_stage_chars_total counter"]
+        lines += [f'{p}_stage_chars_total{{stage="{stage}"}} {chars}'
+                  for stage, chars in sorted(self.stage_chars.items())]
+        lines += [f"# HELP {p}_files_total 변환한 파일 수",
+                  f"# TYPE {p}_files_total counter"]
+        lines += [f'{p}_files_total{{status="{status}"}} {count}' for status, count in sorted(self.files.items())]
+        lines += [f"# HELP {p}_input_bytes_total 변환한 PDF 파일 크기 합계",
+                  f"# TYPE {p}_input_bytes_total counter",
+                  f"{p}_input_bytes_total {self.file_bytes}",
+                  f"# HELP {p}_file_seconds 파일 하나의 변환 시간 (초)",
+                  f"# TYPE {p}_file_seconds histogram"]
+        lines += [f'{p}_file_seconds_bucket{{le="{bound}"}} {count}'
+                  for bound, count in zip(self.FILE_SECONDS_BUCKETS, self.file_buckets)]
+        lines += [f'{p}_file_seconds_bucket{{le="+Inf"}} {self.file_seconds_count}',
+                  f"{p}_file_seconds_sum {self.file_seconds_sum:.6f}",
+                  f"{p}_file_seconds_count {self.file_seconds_count}"]
+        return "\n".join(lines) + "\n"
+    
+    def flush(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temp_path, self.path)
+    
+    def close(self):
+        if self.stage_count:
+            self.flush()
+
+class CallbackSink:
+    """이벤트마다 함수 호출 (느린 문서 알림 등에 사용)"""
+    def __init__(self, callback):
+        self.callback = callback
+    
+    def write(self, event):
+        self.callback(event)
+    
+    def close(self):
+        pass
+
+def add_sink(sink):
+    """이벤트 출력 대상 등록 (write(event), close() 메서드가 있는 객체)"""
+    with _sinks_lock:
+        _sinks.append(sink)
+    return sink
+
+def close_sinks():
+    """등록된 출력 대상을 모두 닫고 등록 해제"""
+    with _sinks_lock:
+        for sink in _sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                print(f"측정 결과 저장 중 오류 발생: {e}")
+        _sinks.clear()
+
+def enabled():
+    """이벤트를 받을 곳이 있는지 (없으면 측정하지 않음)"""
+    return bool(_sinks) or _collected is not None
+
+def emit(event):
+    """이벤트를 출력 대상에 전달 (작업자 프로세스에서 모으는 중이면 목록에 추가)"""
+    if _collected is not None:
+        _collected.append(event)
+        return
+    with _sinks_lock:
+        for sink in _sinks:
+            try:
+                sink.write(event)
+            except Exception as e:
+                print(f"측정 결과 기록 중 오류 발생: {e}")
+
+def record(stage, seconds, **fields):
+    """단계 하나의 소요 시간 기록"""
+    if not enabled():
+        return
+    emit({"stage": stage, "seconds": round(seconds, 6), "time": round(time.time(), 3),
+          "pid": os.getpid(), **current_context(), **fields})
+
+@contextmanager
+def timed(stage, **fields):
+    """
+    with 블록의 소요 시간을 기록
+    
+    블록 안에서 돌려받은 dict에 글자 수(chars), 바이트 수(bytes) 등을 추가하면
+    함께 기록된다.
+    
+        with timed("extract", page=3, backend="pymupdf") as info:
+            text = ...
+            info["chars"] = len(text)
+    """
+    if not enabled():
+        yield {}
+        return
+    start_time = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        record(stage, time.perf_counter() - start_time, **fields)
+
+def current_context():
+    """현재 스레드에서 이벤트에 함께 기록하는 정보 (다른 스레드에 넘길 때 사용)"""
+    return getattr(_local, "context", {})
+
+@contextmanager
+def context(**fields):
+    """블록 안에서 이 스레드가 기록하는 이벤트에 file, page 등의 정보를 함께 기록"""
+    previous = current_context()
+    _local.context = {**previous, **fields}
+    try:
+        yield
+    finally:
+        _local.context = previous
+
+def call_collecting(func, *args):
+    """
+    작업자 프로세스에서 func(*args)를 실행하고 (결과, 이벤트 목록) 반환
+    
+    부모 프로세스는 replay로 이벤트를 자신의 출력 대상에 전달한다.
+    """
+    global _collected
+    previous = _collected
+    _collected = []
+    try:
+        return func(*args), _collected
+    finally:
+        _collected = previous
+
+def replay(events):
+    """작업자 프로세스에서 모은 이벤트를 출력 대상에 전달"""
+    for event in events or ():
+        emit(event)
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import sys
+
+from page_text import PageText
+
+# 추출 결과 형식이 바뀌면 올려서 이전 캐시를 무효화
+CACHE_VERSION = 2
+
+# 기본 캐시 최대 크기 (1GB)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+def default_cache_dir():
+    """운영체제별 기본 캐시 폴더"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pdf_to_txt")
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 해시 (큰 파일도 조금씩 읽어서 계산)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ExtractionCache:
+    """
+    PDF 내용 해시 + 추출 설정을 키로 페이지별 텍스트를 저장하는 디스크 캐시
+    
+    항목 하나는 페이지 텍스트를 한 줄에 하나씩 JSON 문자열로 저장한 파일이다.
+    읽을 때마다 파일 수정 시각을 갱신하고, 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용하지 않은 항목부터 지운다 (LRU).
+    
+    설정값만 보관하므로 작업자 프로세스로 전달할 수 있다.
+    """
+    # 이 횟수만큼 저장할 때마다 한 번씩 크기 확인 및 정리
+    EVICT_INTERVAL = 100
+    
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, refresh=False):
+        """
+        Args:
+            cache_dir (str, optional): 캐시 폴더. None이면 default_cache_dir()
+            max_bytes (int): 캐시 최대 크기 (바이트)
+            refresh (bool): True면 기존 캐시를 읽지 않고 새로 추출한 결과로 덮어씀
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._puts_since_evict = 0
+    
+    def make_key(self, pdf_path, **settings):
+        """
+        PDF 내용 해시와 추출 설정(method, ocr_lang, ocr_quality 등)으로 캐시 키 생성
+        
+        pdf_path는 파일 경로 또는 pdf_source.PdfSource (메모리의 PDF는 버퍼에서 바로 해시 계산)
+        """
+        content_hash = pdf_path.sha256() if hasattr(pdf_path, "sha256") else file_sha256(pdf_path)
+        settings_json = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+        key_source = f"{CACHE_VERSION}\n{content_hash}\n{settings_json}"
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".jsonl")
+    
+    def load(self, key):
+        """
+        캐시된 페이지별 텍스트를 하나씩 읽는 제너레이터 반환 (추출 정보가 있으면 PageText)
+        
+        Returns:
+            캐시에 없거나 refresh 모드면 None
+        """
+        if self.refresh:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            # 최근 사용 시각 갱신 (LRU 정리 기준)
+            os.utime(entry_path)
+        except OSError:
+            return None
+        return self._iter_entry(entry_path)
+    
+    def _iter_entry(self, entry_path):
+        with open(entry_path, 'r', encoding='utf-8') as entry_file:
+            for line in entry_file:
+                entry = json.loads(line)
+                yield PageText.from_cache_entry(entry) if isinstance(entry, dict) else entry
+    
+    def record(self, key, pages):
+        """
+        페이지를 그대로 전달하면서 캐시에 함께 기록하는 제너레이터
+        
+        모든 페이지가 정상적으로 끝났을 때만 캐시 항목이 만들어지고,
+        중간에 오류가 나거나 중단되면 임시 파일은 삭제된다.
+        """
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        temp_path = f"{entry_path}.{os.getpid()}.part"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as entry_file:
+                for page_text in pages:
+                    entry = page_text.cache_entry() if isinstance(page_text, PageText) else page_text
+                    entry_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    yield page_text
+            os.replace(temp_path, entry_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        self._puts_since_evict += 1
+        if self._puts_since_evict >= self.EVICT_INTERVAL:
+            self.evict()
+    
+    def evict(self):
+        """캐시 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 삭제"""
+        self._puts_since_evict = 0
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".jsonl"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+        
+        if total_size <= self.max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                # 다른 프로세스가 이미 지운 경우
+                continue
+            total_size -= size
+            if total_size <= self.max_bytes:
+                break
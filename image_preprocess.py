@@ -0,0 +1,140 @@
+from PIL import Image, ImageEnhance
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 기울기 추정 범위와 간격 (도)
+DESKEW_MAX_ANGLE = 5.0
+DESKEW_STEP = 0.25
+
+# 기울기 추정은 이 너비로 줄인 이미지로 계산 (정확도에 비해 충분히 빠름)
+DESKEW_SAMPLE_WIDTH = 1000
+
+def enhance_image_pil(image, contrast=1.5, sharpness=1.3, brightness=1.1):
+    """대비/선명도/밝기 향상 (ImageEnhance를 차례로 적용, NumPy가 없을 때 사용)"""
+    if contrast != 1.0:
+        image = ImageEnhance.Contrast(image).enhance(contrast)
+    if sharpness != 1.0:
+        image = ImageEnhance.Sharpness(image).enhance(sharpness)
+    if brightness != 1.0:
+        image = ImageEnhance.Brightness(image).enhance(brightness)
+    return image
+
+def _tone_lut(mean, contrast, brightness):
+    """대비(평균 밝기 기준)와 밝기 조정을 합친 0~255 변환표"""
+    levels = np.arange(256, dtype=np.float32)
+    levels = np.clip(mean + contrast * (levels - mean), 0, 255) * brightness
+    return np.clip(levels + 0.5, 0, 255).astype(np.uint8)
+
+def _sharpen(pixels, sharpness):
+    """
+    ImageEnhance.Sharpness와 같은 선명도 향상을 한 번의 3x3 합성곱으로 계산
+    
+    SMOOTH 필터(가운데 5, 주변 1, 합 13)로 흐린 이미지와의 차이를 키운다.
+    3x3 합은 가로/세로로 나누어 더하고, 가장자리 한 줄은 ImageEnhance처럼 그대로 둔다.
+    """
+    height, width = pixels.shape
+    if height < 3 or width < 3:
+        return pixels
+    
+    # 3x3 합의 최댓값(255*9)이 int16 범위 안이므로 int16으로 계산하여 메모리 절약
+    wide = pixels.astype(np.int16)
+    rows = wide[:, :-2] + wide[:, 1:-1]
+    rows += wide[:, 2:]
+    box = rows[:-2] + rows[1:-1]
+    box += rows[2:]
+    center = wide[1:-1, 1:-1]
+    
+    # 원본 - SMOOTH = (9 * 가운데 - 3x3 합) / 13
+    detail = (center * np.int16(9) - box).astype(np.float32)
+    detail *= np.float32((sharpness - 1.0) / 13.0)
+    detail += center
+    detail += 0.5
+    np.clip(detail, 0, 255, out=detail)
+    
+    result = pixels.copy()
+    result[1:-1, 1:-1] = detail
+    return result
+
+def otsu_threshold(image):
+    """그레이스케일 이미지의 Otsu 이진화 임계값 (PIL 히스토그램으로 계산)"""
+    histogram = np.array(image.histogram(), dtype=np.float64)
+    levels = np.arange(256)
+    weight_dark = np.cumsum(histogram)
+    weight_light = weight_dark[-1] - weight_dark
+    sum_dark = np.cumsum(histogram * levels)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_dark = sum_dark / weight_dark
+        mean_light = (sum_dark[-1] - sum_dark) / weight_light
+        between_variance = weight_dark * weight_light * (mean_dark - mean_light) ** 2
+    return int(np.nanargmax(between_variance))
+
+def estimate_skew(image):
+    """
+    문서 이미지의 기울기(도) 추정
+    
+    글자 픽셀을 여러 각도로 기울여 행별로 모았을 때 텍스트 줄이 가장 또렷하게
+    모이는(행별 개수의 제곱합이 가장 큰) 각도를 찾는다. 양수면 오른쪽 아래로 기운 것.
+    """
+    if image.width > DESKEW_SAMPLE_WIDTH:
+        scale = DESKEW_SAMPLE_WIDTH / image.width
+        image = image.resize((DESKEW_SAMPLE_WIDTH, max(1, int(image.height * scale))), Image.Resampling.BILINEAR)
+    ys, xs = np.nonzero(np.asarray(image) < otsu_threshold(image))
+    if len(ys) == 0:
+        return 0.0
+    
+    best_angle, best_score = 0.0, -1.0
+    offset = image.width * np.tan(np.radians(DESKEW_MAX_ANGLE))
+    for angle in np.arange(-DESKEW_MAX_ANGLE, DESKEW_MAX_ANGLE + DESKEW_STEP / 2, DESKEW_STEP):
+        rows = (ys - xs * np.tan(np.radians(angle)) + offset).astype(np.int64)
+        score = np.square(np.bincount(rows).astype(np.float64)).sum()
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    return best_angle
+
+def preprocess_gray(image, contrast=1.5, sharpness=1.3, brightness=1.1, binarize=False, deskew=False):
+    """
+    그레이스케일 이미지 전처리를 한 단계로 처리
+    
+    대비와 밝기는 변환표 하나로, 선명도는 합성곱 한 번으로 계산하므로
+    ImageEnhance를 세 번 거치며 매번 새 이미지를 만드는 것보다 빠르다.
+    NumPy가 없으면 ImageEnhance로 같은 처리를 한다.
+    
+    Args:
+        image (PIL.Image): 그레이스케일('L') 이미지
+        contrast, sharpness, brightness (float): ImageEnhance와 같은 의미의 계수
+        binarize (bool): Otsu 임계값으로 흑백 이진화
+        deskew (bool): 기울어진 스캔 이미지를 바로 세움
+    
+    Returns:
+        PIL.Image: 전처리된 새 이미지 (입력 이미지는 바뀌지 않음)
+    """
+    if not NUMPY_AVAILABLE:
+        image = enhance_image_pil(image, contrast, sharpness, brightness)
+        if binarize:
+            image = image.point(lambda value: 255 if value > 127 else 0)
+        if deskew:
+            print("기울기 보정에는 NumPy가 필요합니다. 보정 없이 진행합니다.")
+        return image
+    
+    image = image.convert('L')
+    if contrast != 1.0 or brightness != 1.0:
+        # 변환표 적용은 PIL의 point가 NumPy 인덱싱보다 빠름
+        image = image.point(_tone_lut(np.asarray(image).mean(), contrast, brightness).tolist())
+    pixels = np.asarray(image)
+    if sharpness != 1.0:
+        pixels = _sharpen(pixels, sharpness)
+    # np.asarray가 복사본을 만들므로 결과는 입력 이미지와 메모리를 공유하지 않음
+    result = Image.fromarray(pixels)
+    if binarize:
+        threshold = otsu_threshold(result)
+        result = result.point([255 if value > threshold else 0 for value in range(256)])
+    
+    if deskew:
+        angle = estimate_skew(result)
+        if abs(angle) >= DESKEW_STEP:
+            result = result.rotate(angle, resample=Image.Resampling.BILINEAR, expand=True, fillcolor=255)
+    return result
@@ -0,0 +1,200 @@
+"""
+단계별 OCR 파이프라인
+
+페이지 하나를 처리하는 과정을 이미지 변환(래스터화), 전처리, OCR 단계로 나누고
+단계마다 따로 정한 수의 스레드가 크기가 제한된 큐로 페이지를 넘겨받아 처리한다.
+마지막 단계(파일 기록)는 결과를 페이지 순서대로 받는 쪽(write_pages)이 담당한다.
+
+가장 느린 OCR 단계가 기다리지 않도록 앞 단계가 다음 페이지를 미리 준비해 두고,
+파일을 쓰는 동안에도 다른 단계는 계속 진행된다. Tesseract는 별도 프로세스
+(pytesseract)이거나 GIL을 풀고 실행되므로(tesserocr) 스레드로도 동시에 실행된다.
+동시에 처리 중인 페이지 수가 제한되므로 문서가 아무리 커도 메모리 사용량은 일정하다.
+
+    for page_text in iter_staged_ocr_pages("scan.pdf", stages=StageWorkers(rasterize=1, preprocess=2, ocr=4)):
+        ...
+"""
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+
+import conversion_metrics as metrics
+from pdf_ocr import (OcrConfigSelector, _open_fitz_document, count_pages, format_ocr_page, ocr_image,
+                     page_size_points, preprocess_image, rasterize_fitz_page, rasterize_pdf2image_page)
+
+# 큐에서 기다리다가 중단 여부를 확인하는 간격 (초)
+POLL_INTERVAL = 0.1
+
+@dataclass
+class StageWorkers:
+    """단계별 스레드 수"""
+    rasterize: int = 1
+    preprocess: int = 1
+    # None이면 CPU 코어 수
+    ocr: int = None
+    # 단계 사이 큐의 최대 길이. None이면 OCR 스레드 수
+    queue_size: int = None
+
+def parse_stage_workers(text):
+    """
+    '래스터화,전처리,OCR' 형식의 문자열(예: "1,2,4")을 StageWorkers로 변환
+    
+    Raises:
+        ValueError: 형식이 잘못됨
+    """
+    counts = [int(part) for part in text.split(",")]
+    if len(counts) != 3 or min(counts) < 1:
+        raise ValueError(f"단계별 스레드 수는 '래스터화,전처리,OCR' 형식의 양수 3개여야 합니다: {text}")
+    return StageWorkers(*counts)
+
+def _get(source, stop):
+    """큐에서 항목 하나를 꺼냄 (중단되면 None)"""
+    while not stop.is_set():
+        try:
+            return source.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            continue
+    return None
+
+def _put(target, item, stop):
+    """큐에 항목 하나를 넣음 (큐가 가득 차면 대기, 중단되면 False)"""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def iter_staged_ocr_pages(pdf_path, lang="kor+eng", quality="고품질", renderer="pdf2image",
+                          page_numbers=None, engine="auto", stages=None, postprocess=None):
+    """
+    단계별 스레드로 OCR 처리하고 페이지 순서대로 반환
+    
+    Args:
+        pdf_path (str): 입력 PDF 파일 경로
+        lang (str): Tesseract 언어
+        quality (str): OCR 품질 ('고품질', '표준', '빠름')
+        renderer (str): "pdf2image" 또는 "fitz"
+        page_numbers (list, optional): OCR할 페이지 번호 목록 (0부터). None이면 전체
+        engine (str): OCR 엔진 (OCR_ENGINES 참고)
+        stages (StageWorkers, optional): 단계별 스레드 수. None이면 기본값
+        postprocess (PostprocessRules, optional): OCR 결과 정리 규칙. None이면 기본 규칙
+    
+    Yields:
+        str: 페이지별 텍스트 (page_numbers 순서대로)
+    """
+    stages = stages or StageWorkers()
+    with metrics.timed("open", backend="ocr", renderer=renderer) as info:
+        page_count = count_pages(pdf_path, renderer)
+        info["pages"] = page_count
+    if page_numbers is None:
+        page_numbers = list(range(page_count))
+    if not page_numbers:
+        return
+    
+    ocr_workers = stages.ocr or os.cpu_count() or 1
+    # PyMuPDF는 여러 스레드에서 동시에 사용할 수 없으므로 래스터화 스레드는 하나만 사용
+    rasterize_workers = 1 if renderer == "fitz" else stages.rasterize
+    # pdf2image 렌더러도 DPI를 정할 때 PyMuPDF로 페이지 크기를 읽으므로, 래스터화 스레드가
+    # 같은 문서를 동시에 열지 않도록 모든 페이지 크기를 여기서 미리 구해 둠
+    page_sizes = ({} if renderer == "fitz"
+                  else {page_num: page_size_points(pdf_path, page_num) for page_num in page_numbers})
+    queue_size = stages.queue_size or ocr_workers
+    # 래스터화를 시작했지만 아직 반환하지 않은 페이지 수 제한 (앞 페이지가 늦어도 뒤 페이지가 쌓이지 않음)
+    in_flight = threading.Semaphore(rasterize_workers + stages.preprocess + ocr_workers + 2 * queue_size)
+    
+    pending_pages = queue.Queue()
+    for index, page_num in enumerate(page_numbers):
+        pending_pages.put((index, page_num))
+    rasterized = queue.Queue(maxsize=queue_size)
+    preprocessed = queue.Queue(maxsize=queue_size)
+    results = queue.Queue()
+    stop = threading.Event()
+    errors = []
+    selector = OcrConfigSelector(quality, engine=engine, workers=ocr_workers)
+    
+    def rasterize(item):
+        index, page_num = item
+        start_time = time.perf_counter()
+        if renderer == "fitz":
+            image, pix = rasterize_fitz_page(_open_fitz_document(pdf_path)[page_num], quality)
+        else:
+            image, pix = rasterize_pdf2image_page(pdf_path, page_num, quality, page_sizes[page_num]), None
+        # 튜플은 뒤쪽 항목부터 해제되므로 픽스맵 메모리를 참조하는 image를 pix 뒤에 두어
+        # 픽스맵보다 먼저 해제되도록 함
+        return index, page_num, start_time, pix, image
+    
+    def preprocess(item):
+        index, page_num, start_time, _, image = item
+        with metrics.timed("preprocess", page=page_num + 1, quality=quality):
+            return index, page_num, start_time, preprocess_image(image, quality)
+    
+    def recognize(item):
+        index, page_num, start_time, image = item
+        print(f"OCR 처리 중: 페이지 {page_num + 1}/{page_count}")
+        with metrics.context(page=page_num + 1):
+            text, confidence = ocr_image(image, lang, quality, selector, with_confidence=True)
+        # 페이지 시간은 래스터화 시작부터 OCR 끝까지 (단계 사이 큐에서 기다린 시간 포함)
+        page_text = format_ocr_page(page_num, text, postprocess, confidence, time.perf_counter() - start_time)
+        metrics.record("extract", page_text.seconds, page=page_num + 1, backend="ocr", chars=len(page_text))
+        return index, page_text
+    
+    def run_stage(func, source, target, limit_in_flight=False):
+        try:
+            while not stop.is_set():
+                if limit_in_flight:
+                    try:
+                        item = source.get_nowait()
+                    except queue.Empty:
+                        return
+                    while not in_flight.acquire(timeout=POLL_INTERVAL):
+                        if stop.is_set():
+                            return
+                else:
+                    item = _get(source, stop)
+                    if item is None:
+                        return
+                if not _put(target, func(item), stop):
+                    return
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+    
+    # 작업 스레드의 이벤트에도 파일 정보가 기록되도록 현재 측정 정보를 넘김
+    context = metrics.current_context()
+    
+    def start_stage(name, count, func, source, target, limit_in_flight=False):
+        def run():
+            with metrics.context(**context):
+                run_stage(func, source, target, limit_in_flight)
+        return [threading.Thread(target=run, name=f"ocr-{name}-{i}", daemon=True) for i in range(count)]
+    
+    threads = (start_stage("rasterize", rasterize_workers, rasterize, pending_pages, rasterized, True)
+               + start_stage("preprocess", stages.preprocess, preprocess, rasterized, preprocessed)
+               + start_stage("ocr", ocr_workers, recognize, preprocessed, results))
+    for thread in threads:
+        thread.start()
+    
+    # 끝난 순서대로 도착하는 결과를 페이지 순서대로 정렬하여 반환
+    finished = {}
+    next_index = 0
+    try:
+        while next_index < len(page_numbers):
+            if errors:
+                raise errors[0]
+            try:
+                index, page_text = results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            finished[index] = page_text
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+                in_flight.release()
+    finally:
+        # 중간에 중단되거나 오류가 나면 모든 단계를 멈춤 (진행 중인 Tesseract 호출은 끝까지 실행됨)
+        stop.set()
+        for thread in threads:
+            thread.join()
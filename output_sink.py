@@ -0,0 +1,298 @@
+"""
+일괄 변환 결과를 묶어서 저장하는 출력 대상 (sink)
+
+파일이 아주 많은 일괄 변환에서 PDF마다 TXT 파일을 만들면 작은 파일 생성과 쓰기가
+파일 시스템에 부담이 된다. 출력 대상을 지정하면 변환 결과를 메모리에 모았다가
+묶음(batch) 단위로 한 번에 기록한다.
+
+    ShardedJsonlSink  압축된 JSONL 조각 파일(shard-00001.jsonl.gz ...)에 문서마다 한 줄.
+                      조각 파일이 max_shard_bytes를 넘으면 다음 조각 파일로 넘어감
+    SqliteSink        SQLite 데이터베이스 하나 (documents/pages 테이블, 경로 색인)
+    
+    with open_sink("./shards", compression="zstd") as sink:
+        batch_convert("./pdfs", sink=sink)
+    for document in read_shards("./shards"):
+        print(document["file"], document["chars"])
+
+묶음 하나는 조각 파일에 독립된 gzip 멤버(zstd 프레임)로 덧붙이므로, 도중에 종료되어도
+그때까지 기록한 묶음은 그대로 읽을 수 있다. 다시 실행하면 기존 조각 파일에 덧붙이지 않고
+새 조각 파일부터 쓴다. 그래서 다시 변환한 문서는 여러 조각 파일에 기록될 수 있고,
+read_shards는 경로마다 마지막 기록만 반환한다.
+"""
+import gzip
+import io
+import json
+import os
+import re
+import sqlite3
+import time
+
+import conversion_metrics as metrics
+from page_text import page_record
+
+# 압축 방식과 조각 파일 확장자
+COMPRESSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst", "none": ".jsonl"}
+
+# 조각 파일 하나의 기본 최대 크기 (256MB, 압축된 크기 기준)
+DEFAULT_SHARD_BYTES = 256 * 1024 * 1024
+
+# 기본 묶음 크기 (문서 수, 텍스트의 UTF-8 바이트 수 중 먼저 도달하는 쪽에서 기록)
+DEFAULT_BATCH_DOCUMENTS = 1000
+DEFAULT_BATCH_BYTES = 16 * 1024 * 1024
+
+# SQLite 출력으로 보는 파일 확장자
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+_SHARD_NAME = re.compile(r"^shard-(\d+)\.jsonl(\.gz|\.zst)?$")
+
+def document_record(name, result, pages):
+    """
+    출력 대상에 기록할 문서 하나의 dict
+    
+    Args:
+        name (str): 문서 이름 (입력 폴더 기준 경로)
+        result (ConversionResult): 변환 결과
+        pages: 페이지별 텍스트 목록 (PageText면 추출 정보도 기록)
+    """
+    page_records = []
+    for index, page_text in enumerate(pages):
+        record = page_record(page_text, index + 1)
+        del record["type"], record["file"]
+        page_records.append(record)
+    return {"file": name, "success": result.success, "chars": result.text_length, "error": result.error,
+            "updated_at": time.time(), "pages": page_records}
+
+class OutputSink:
+    """
+    변환 결과를 묶음 단위로 기록하는 출력 대상의 공통 부분
+    
+    add()로 받은 문서는 묶음이 찰 때, flush() 또는 close()를 부를 때 한 번에 기록된다.
+    on_commit이 있으면 묶음 하나를 기록할 때마다 기록한 문서의 (name, result) 목록으로
+    호출하므로, 일괄 변환 매니페스트는 실제로 디스크에 기록된 문서만 성공으로 남긴다.
+    """
+    def __init__(self, path, batch_documents=DEFAULT_BATCH_DOCUMENTS, batch_bytes=DEFAULT_BATCH_BYTES):
+        self.path = path
+        self.batch_documents = batch_documents
+        self.batch_bytes = batch_bytes
+        self.on_commit = None
+        self._pending = []
+        self._pending_bytes = 0
+    
+    @property
+    def location(self):
+        """지금 추가하는 문서가 기록될 위치 (ConversionResult.output_path에 사용)"""
+        return self.path
+    
+    def add(self, name, result, pages):
+        """
+        변환한 문서 하나를 묶음에 추가 (묶음이 차면 기록)
+        
+        Args:
+            name (str): 문서 이름 (입력 폴더 기준 경로)
+            result (ConversionResult): 변환 결과. output_path는 기록될 위치로 바뀜
+            pages: 페이지별 텍스트 목록
+        """
+        result.output_path = self.location
+        record = document_record(name, result, pages)
+        self._pending.append((name, result, record))
+        # 한글은 UTF-8로 글자당 3바이트이므로 글자 수가 아니라 바이트 수로 셈
+        self._pending_bytes += sum(len(str(page_text).encode("utf-8")) for page_text in pages)
+        if len(self._pending) >= self.batch_documents or self._pending_bytes >= self.batch_bytes:
+            self.flush()
+    
+    def flush(self):
+        """모아 둔 문서를 기록"""
+        if not self._pending:
+            return
+        pending, self._pending, self._pending_bytes = self._pending, [], 0
+        start_time = time.perf_counter()
+        written = self._write([record for _, _, record in pending])
+        if metrics.enabled():
+            metrics.record("write", time.perf_counter() - start_time, documents=len(pending),
+                           chars=sum(result.text_length for _, result, _ in pending), bytes=written)
+        if self.on_commit:
+            self.on_commit([(name, result) for name, result, _ in pending])
+    
+    def _write(self, records):
+        """묶음 하나를 기록하고 기록한 바이트 수 반환 (알 수 없으면 None)"""
+        raise NotImplementedError
+    
+    def close(self):
+        self.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ShardedJsonlSink(OutputSink):
+    """
+    문서마다 JSON 한 줄을 압축된 조각 파일에 기록
+    
+    묶음 하나를 한 번에 압축하여 write 한 번으로 덧붙인다. 조각 파일이 max_shard_bytes 이상이
+    되면 다음 묶음부터 새 조각 파일에 기록한다 (조각 파일 크기는 최대 묶음 하나만큼 넘을 수 있음).
+    """
+    def __init__(self, folder, compression="gzip", max_shard_bytes=DEFAULT_SHARD_BYTES,
+                 batch_documents=DEFAULT_BATCH_DOCUMENTS, batch_bytes=DEFAULT_BATCH_BYTES, level=None):
+        """
+        Args:
+            folder (str): 조각 파일을 저장할 폴더
+            compression (str): 압축 방식 ("gzip", "zstd" 또는 "none")
+            max_shard_bytes (int): 조각 파일 하나의 최대 크기 (바이트)
+            batch_documents (int): 한 번에 기록할 문서 수
+            batch_bytes (int): 모아 둔 텍스트가 이 크기(UTF-8 바이트)에 이르면 문서 수와 관계없이 기록
+            level (int, optional): 압축 수준. None이면 gzip 6, zstd 3
+        
+        Raises:
+            ValueError: 지원하지 않는 압축 방식
+            ImportError: zstd를 지정했는데 zstandard 패키지가 없음
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression} (사용 가능: {', '.join(COMPRESSIONS)})")
+        super().__init__(folder, batch_documents, batch_bytes)
+        self.compression = compression
+        self.max_shard_bytes = max_shard_bytes
+        self._compress = _compressor(compression, level)
+        os.makedirs(folder, exist_ok=True)
+        # 이전 실행의 조각 파일은 끝이 잘렸을 수 있으므로 덧붙이지 않고 다음 번호부터 사용
+        self._shard_index = max(_shard_numbers(folder), default=0) + 1
+        self._shard_bytes = 0
+    
+    @property
+    def location(self):
+        return os.path.join(self.path, f"shard-{self._shard_index:05d}{COMPRESSIONS[self.compression]}")
+    
+    def _write(self, records):
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode("utf-8")
+        data = self._compress(data)
+        with open(self.location, 'ab') as shard_file:
+            shard_file.write(data)
+        self._shard_bytes += len(data)
+        if self._shard_bytes >= self.max_shard_bytes:
+            self._shard_index += 1
+            self._shard_bytes = 0
+        return len(data)
+
+class SqliteSink(OutputSink):
+    """
+    SQLite 데이터베이스 하나에 문서와 페이지를 기록
+    
+        documents(path PRIMARY KEY, success, chars, error, updated_at)
+        pages(path, page, backend, confidence, chars, seconds, cached, text)  (path, page) 색인
+    
+    묶음 하나를 트랜잭션 하나로 기록한다. 같은 경로의 문서를 다시 기록하면 이전 페이지는 지운다.
+    """
+    def __init__(self, path, batch_documents=DEFAULT_BATCH_DOCUMENTS, batch_bytes=DEFAULT_BATCH_BYTES):
+        super().__init__(path, batch_documents, batch_bytes)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        # 트랜잭션마다 fsync하는 대신 WAL 파일에 이어 씀
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (path TEXT PRIMARY KEY, success INTEGER, chars INTEGER,"
+                " error TEXT, updated_at REAL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages (path TEXT, page INTEGER, backend TEXT, confidence REAL,"
+                " chars INTEGER, seconds REAL, cached INTEGER, text TEXT, PRIMARY KEY (path, page))")
+    
+    def _write(self, records):
+        names = [(record["file"],) for record in records]
+        with self._connection:
+            self._connection.executemany("DELETE FROM pages WHERE path = ?", names)
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                [(record["file"], record["success"], record["chars"], record["error"], record["updated_at"])
+                 for record in records])
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(record["file"], page["page"], page["backend"], page["confidence"], page["chars"],
+                  page["seconds"], page["cached"], page["text"])
+                 for record in records for page in record["pages"]])
+        return None
+    
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._connection.close()
+
+def _compressor(compression, level):
+    """묶음 하나를 독립된 gzip 멤버/zstd 프레임으로 압축하는 함수"""
+    if compression == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다: pip install zstandard")
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress
+    return lambda data: data
+
+def _shard_numbers(folder):
+    for name in os.listdir(folder):
+        match = _SHARD_NAME.match(name)
+        if match:
+            yield int(match.group(1))
+
+def open_sink(path, compression="gzip", max_shard_bytes=DEFAULT_SHARD_BYTES, **options):
+    """
+    경로에 맞는 출력 대상 생성 (.sqlite/.sqlite3/.db면 SqliteSink, 그 외에는 조각 파일 폴더)
+    
+    Raises:
+        ValueError: 지원하지 않는 압축 방식
+        ImportError: zstd를 지정했는데 zstandard 패키지가 없음
+    """
+    if path.lower().endswith(SQLITE_SUFFIXES):
+        return SqliteSink(path, **options)
+    return ShardedJsonlSink(path, compression, max_shard_bytes, **options)
+
+def read_shards(folder, latest_only=True):
+    """
+    조각 파일 폴더의 문서 기록을 기록한 순서대로 하나씩 반환
+    
+    비정상 종료로 끝이 잘린 조각 파일은 읽을 수 있는 묶음까지만 반환한다.
+    
+    Args:
+        latest_only (bool): True면 같은 경로의 문서는 마지막 기록만 반환 (조각 파일을 두 번
+            읽음). 묶음을 기록한 뒤 매니페스트에 남기기 전에 종료되었거나, 바뀐 파일을 다시
+            변환하면 같은 경로가 여러 번 기록됨
+    """
+    if not latest_only:
+        yield from _iter_shard_records(folder)
+        return
+    
+    # 첫 번째로 읽을 때는 경로별 마지막 기록 위치만 기억하여 문서 내용을 메모리에 모으지 않음
+    latest = {}
+    for position, record in enumerate(_iter_shard_records(folder, warn=False)):
+        latest[record["file"]] = position
+    for position, record in enumerate(_iter_shard_records(folder)):
+        if latest.get(record["file"]) == position:
+            yield record
+
+def _iter_shard_records(folder, warn=True):
+    names = sorted((name for name in os.listdir(folder) if _SHARD_NAME.match(name)),
+                   key=lambda name: int(_SHARD_NAME.match(name).group(1)))
+    for name in names:
+        path = os.path.join(folder, name)
+        try:
+            with _open_shard(path) as shard_file:
+                for line in shard_file:
+                    yield json.loads(line)
+        except (EOFError, OSError, ValueError) as e:
+            if warn:
+                print(f"조각 파일 끝이 잘려 있어 나머지는 건너뜁니다: {path} ({e})")
+
+def _open_shard(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if path.endswith(".zst"):
+        import zstandard
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True,
+                                                         closefd=True)
+        return io.TextIOWrapper(raw, encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
@@ -0,0 +1,70 @@
+"""
+페이지 단위 추출 결과
+
+추출 방법들은 페이지마다 PageText를 반환한다. PageText는 str이므로 TXT 파일 기록,
+캐시, GUI 등 문자열을 받는 곳에는 그대로 쓰이고, 구조화된 출력(JSONL)에는 페이지
+번호, 추출 방법, OCR 신뢰도, 처리 시간을 함께 기록한다.
+
+    {"type": "page", "file": "a.pdf", "page": 3, "backend": "ocr", "confidence": 91.2,
+     "chars": 1830, "seconds": 0.82, "cached": false, "text": "..."}
+"""
+
+class PageText(str):
+    """
+    페이지 하나의 텍스트와 추출 정보
+    
+    문자열 연산(+, 슬라이스 등)의 결과는 일반 str이 되므로, 정보를 유지하려면
+    with_text로 새 텍스트에 옮긴다.
+    """
+    def __new__(cls, text, page=None, backend=None, confidence=None, seconds=None, cached=False):
+        """
+        Args:
+            text (str): 페이지 텍스트 (TXT 파일에 기록되는 그대로)
+            page (int, optional): 페이지 번호 (1부터)
+            backend (str, optional): 텍스트를 추출한 방법 이름 (모두 실패했으면 None)
+            confidence (float, optional): OCR 평균 단어 신뢰도 (0~100, OCR이 아니면 None)
+            seconds (float, optional): 페이지를 추출하는 데 걸린 시간 (초)
+            cached (bool): 추출 결과 캐시에서 읽은 페이지인지
+        """
+        page_text = super().__new__(cls, text)
+        page_text.page = page
+        page_text.backend = backend
+        page_text.confidence = confidence
+        page_text.seconds = seconds
+        page_text.cached = cached
+        return page_text
+    
+    def cache_entry(self):
+        """추출 결과 캐시에 저장할 값 (처리 시간은 저장하지 않음)"""
+        return {"text": str(self), "page": self.page, "backend": self.backend, "confidence": self.confidence}
+    
+    @classmethod
+    def from_cache_entry(cls, entry):
+        return cls(entry["text"], entry.get("page"), entry.get("backend"), entry.get("confidence"), cached=True)
+
+def with_text(page_text, text):
+    """page_text의 추출 정보를 text에 옮김 (page_text가 일반 str이면 text를 그대로 반환)"""
+    if not isinstance(page_text, PageText):
+        return text
+    return PageText(text, page_text.page, page_text.backend, page_text.confidence, page_text.seconds,
+                    page_text.cached)
+
+def page_record(page_text, index, file=None):
+    """
+    구조화된 출력에 기록할 페이지 하나의 dict
+    
+    Args:
+        page_text (str): 페이지 텍스트 (PageText가 아니면 추출 정보는 None)
+        index (int): 출력에서의 순서 (1부터, 페이지 번호를 모를 때 대신 사용)
+        file (str, optional): 입력 파일 이름
+    """
+    record = {"type": "page", "file": file, "page": index, "backend": None, "confidence": None,
+              "chars": len(page_text), "seconds": None, "cached": False, "text": str(page_text)}
+    if isinstance(page_text, PageText):
+        if page_text.page is not None:
+            record["page"] = page_text.page
+        record["backend"] = page_text.backend
+        record["confidence"] = None if page_text.confidence is None else round(page_text.confidence, 1)
+        record["seconds"] = None if page_text.seconds is None else round(page_text.seconds, 6)
+        record["cached"] = page_text.cached
+    return record
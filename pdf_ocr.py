@@ -0,0 +1,615 @@
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import conversion_metrics as metrics
+from backends import OCR_ENGINES  # 기존 import 경로(pdf_ocr.OCR_ENGINES)도 계속 사용 가능
+from ocr_postprocess import DEFAULT_RULES, clean_ocr_text
+from page_text import PageText
+from pdf_to_txt import iter_parallel
+
+try:
+    import fitz  # PyMuPDF
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+try:
+    import pytesseract
+    from pdf2image import convert_from_path, pdfinfo_from_path
+    from PIL import Image
+    from image_preprocess import preprocess_gray
+    
+    # Tesseract 경로 설정 (Windows의 일반적인 설치 경로들을 시도)
+    # 작업자 프로세스에서도 이 모듈을 import하면서 같은 설정이 적용됨
+    tesseract_paths = [
+        r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+        r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+        r"C:\Users\User\AppData\Local\Tesseract-OCR\tesseract.exe"
+    ]
+    
+    # tesserocr도 같은 설치 폴더의 언어 데이터를 사용하도록 경로를 기억
+    TESSDATA_PATH = None
+    for path in tesseract_paths:
+        if os.path.exists(path):
+            pytesseract.pytesseract.tesseract_cmd = path
+            TESSDATA_PATH = os.path.join(os.path.dirname(path), "tessdata")
+            break
+    
+    OCR_AVAILABLE = True
+except ImportError:
+    OCR_AVAILABLE = False
+
+try:
+    # Tesseract C++ API 바인딩 - 프로세스 안에서 언어 모델을 계속 올려둔 채 사용
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+def get_ocr_configs(quality):
+    """품질 설정에 따라 순서대로 시도할 Tesseract 설정 목록"""
+    if quality.startswith('고품질'):
+        return [
+            '--psm 6 -c preserve_interword_spaces=1 -c textord_really_old_xheight=1',  # 단일 텍스트 블록
+            '--psm 4 -c preserve_interword_spaces=1 -c textord_really_old_xheight=1',  # 단일 열, 공백 보존
+            '--psm 1 -c preserve_interword_spaces=1',  # 자동 페이지 분할
+            '--psm 3 -c textord_really_old_xheight=1',  # 완전 자동
+            '--psm 8 -c preserve_interword_spaces=1',  # 단일 단어
+        ]
+    elif quality == '표준':
+        return [
+            '--psm 6 -c preserve_interword_spaces=1',  # 단일 텍스트 블록
+            '--psm 4 -c preserve_interword_spaces=1',  # 단일 열
+            '--psm 3',  # 완전 자동
+        ]
+    else:  # 빠름
+        return [
+            '--psm 6',  # 단일 텍스트 블록만
+        ]
+
+def enhance_image(image, contrast=1.5, sharpness=1.3, brightness=1.1, binarize=False, deskew=False):
+    """대비/선명도/밝기 향상 (image_preprocess.preprocess_gray로 한 번에 처리)"""
+    return preprocess_gray(image, contrast, sharpness, brightness, binarize, deskew)
+
+def preprocess_image(image, quality, binarize=False, deskew=False):
+    """
+    품질 설정에 따른 이미지 전처리
+    
+    이미지는 plan_render_dpi로 정한 해상도로 이미 그려져 있으므로 크기는 바꾸지 않는다.
+    binarize/deskew는 Otsu 이진화와 기울기 보정 (image_preprocess.preprocess_gray 참고)
+    """
+    image = image.convert('L')  # 그레이스케일 변환
+    
+    if quality.startswith('고품질'):
+        # 고품질: 최대한 정확한 OCR
+        factors = (1.5, 1.3, 1.1)
+    elif quality == '표준':
+        # 표준: 균형잡힌 처리
+        factors = (1.2, 1.1, 1.0)
+    else:  # 빠름
+        # 빠름: 그레이스케일 변환만
+        factors = (1.0, 1.0, 1.0)
+        if not (binarize or deskew):
+            return image
+    
+    return enhance_image(image, *factors, binarize=binarize, deskew=deskew)
+
+# 품질별 렌더링 기준: (기본 DPI, 최소 가로 픽셀)
+# 작은 페이지는 가로가 최소 픽셀이 되도록 DPI를 올리고, A4보다 큰 페이지는
+# A4를 기본 DPI로 그렸을 때의 픽셀 수를 넘지 않도록 DPI를 낮춤
+RENDER_PRESETS = {
+    '고품질': (300, 2000),
+    '표준': (250, 1500),
+    '빠름': (200, 1000),
+}
+A4_SIZE_INCHES = (8.27, 11.69)
+MIN_RENDER_DPI = 150
+
+def plan_render_dpi(width_pt, height_pt, quality):
+    """
+    페이지 실제 크기(포인트, 1/72인치)와 품질 설정으로 렌더링 DPI 계산
+    
+    정한 DPI로 한 번만 그리므로 그린 뒤 다시 확대/축소할 필요가 없다.
+    """
+    if quality.startswith('고품질'):
+        quality = '고품질'
+    base_dpi, min_width = RENDER_PRESETS.get(quality, RENDER_PRESETS['빠름'])
+    width_in, height_in = width_pt / 72.0, height_pt / 72.0
+    if width_in <= 0 or height_in <= 0:
+        return base_dpi
+    
+    dpi = max(base_dpi, min_width / width_in)
+    # A3 등 큰 페이지는 비트맵이 지나치게 커지지 않도록 픽셀 수 제한
+    max_pixels = A4_SIZE_INCHES[0] * A4_SIZE_INCHES[1] * base_dpi * base_dpi
+    dpi = min(dpi, (max_pixels / (width_in * height_in)) ** 0.5)
+    return max(MIN_RENDER_DPI, int(dpi))
+
+# 작업자 프로세스마다 마지막으로 읽은 문서의 페이지 크기 목록을 재사용
+_page_size_cache = {}
+
+def page_size_points(pdf_path, page_num):
+    """
+    페이지가 화면에 보이는 크기 (가로, 세로 포인트, 회전 반영)
+    
+    Poppler처럼 CropBox 기준으로 계산한다. PyMuPDF가 있으면 사용하고 없으면 PyPDF2
+    """
+    if FITZ_AVAILABLE:
+        rect = _open_fitz_document(pdf_path)[page_num].rect
+        return rect.width, rect.height
+    
+    stat = os.stat(pdf_path)
+    key = (os.path.abspath(pdf_path), stat.st_size, stat.st_mtime)
+    sizes = _page_size_cache.get(key)
+    if sizes is None:
+        import PyPDF2
+        sizes = []
+        with open(pdf_path, 'rb') as file:
+            for page in PyPDF2.PdfReader(file).pages:
+                width, height = float(page.cropbox.width), float(page.cropbox.height)
+                if (page.get('/Rotate') or 0) % 180:
+                    width, height = height, width
+                sizes.append((width, height))
+        _page_size_cache.clear()
+        _page_size_cache[key] = sizes
+    return sizes[page_num]
+
+# 이 신뢰도(0~100) 이상이면 다른 설정을 시도하지 않고 결과를 바로 사용
+OCR_ACCEPT_CONFIDENCE = 75
+# 이 문서에서 모든 설정을 시도해 얻은 최고 신뢰도와 이만큼 이내이면 다시 시도하지 않음
+# (잡음이 많은 스캔본은 어떤 설정도 OCR_ACCEPT_CONFIDENCE에 닿지 못함)
+OCR_CONFIDENCE_MARGIN = 5
+
+def resolve_ocr_engine(engine):
+    """'auto'를 실제 사용할 엔진 이름으로 바꿈"""
+    if engine == "auto":
+        return "tesserocr" if TESSEROCR_AVAILABLE else "pytesseract"
+    if engine == "tesserocr" and not TESSEROCR_AVAILABLE:
+        print("tesserocr가 설치되지 않아 pytesseract를 사용합니다.")
+        return "pytesseract"
+    if engine not in OCR_ENGINES:
+        print(f"지원하지 않는 OCR 엔진이라 pytesseract를 사용합니다: {engine}")
+        return "pytesseract"
+    return engine
+
+def parse_tesseract_config(config):
+    """'--psm 6 -c 이름=값' 형식의 설정 문자열을 (psm, {이름: 값})으로 변환"""
+    parts = config.split()
+    psm = 3
+    variables = {}
+    for i, part in enumerate(parts):
+        if part == "--psm" and i + 1 < len(parts):
+            psm = int(parts[i + 1])
+        elif part == "-c" and i + 1 < len(parts):
+            name, _, value = parts[i + 1].partition("=")
+            variables[name] = value
+    return psm, variables
+
+# 스레드마다 언어별 tesserocr API 객체를 보관 (API 객체는 스레드 간에 공유할 수 없음)
+# defaults는 API별로 설정 문자열의 -c 변수를 처음 바꾸기 전의 값
+_tesserocr_local = threading.local()
+
+def _get_tesserocr_api(lang):
+    """
+    현재 스레드의 언어별 tesserocr API 반환 (처음 한 번만 언어 모델을 읽음)
+    
+    Returns:
+        tuple: (API, {변수 이름: 처음 값})
+    """
+    apis = getattr(_tesserocr_local, "apis", None)
+    if apis is None:
+        apis = _tesserocr_local.apis = {}
+    entry = apis.get(lang)
+    if entry is None:
+        if TESSDATA_PATH:
+            api = tesserocr.PyTessBaseAPI(path=TESSDATA_PATH, lang=lang)
+        else:
+            api = tesserocr.PyTessBaseAPI(lang=lang)
+        entry = apis[lang] = (api, {})
+    return entry
+
+def _run_tesserocr(image, lang, config):
+    api, defaults = _get_tesserocr_api(lang)
+    psm, variables = parse_tesseract_config(config)
+    api.SetPageSegMode(psm)
+    # SetVariable 값은 API에 계속 남으므로 이번 설정에 없는 변수는 처음 값으로 되돌림
+    for name, value in defaults.items():
+        if name not in variables:
+            api.SetVariable(name, value)
+    for name, value in variables.items():
+        if name not in defaults:
+            defaults[name] = api.GetVariableAsString(name)
+        api.SetVariable(name, value)
+    try:
+        api.SetImage(image)
+        text = api.GetUTF8Text()
+        confidences = [confidence for confidence in api.AllWordConfidences() if confidence >= 0]
+    finally:
+        api.Clear()
+    return text, (sum(confidences) / len(confidences) if confidences else 0.0)
+
+def _run_pytesseract(image, lang, config):
+    # Tesseract를 한 번 실행하여 image_to_string과 같은 텍스트(txt, 공백과 빈 줄 유지)와
+    # image_to_data와 같은 단어별 신뢰도(tsv)를 함께 얻음
+    with tempfile.TemporaryDirectory() as folder:
+        input_path = os.path.join(folder, "page.png")
+        output_base = os.path.join(folder, "page")
+        image.save(input_path)
+        pytesseract.pytesseract.run_tesseract(input_path, output_base, "txt tsv", lang,
+                                              f"-c tessedit_create_tsv=1 {config}")
+        with open(output_base + ".txt", encoding="utf-8") as text_file:
+            text = text_file.read()
+        with open(output_base + ".tsv", encoding="utf-8") as tsv_file:
+            data = pytesseract.pytesseract.file_to_dict(tsv_file.read(), "\t", -1)
+    weighted_confidence = 0.0
+    char_count = 0
+    for word, confidence in zip(data.get("text", []), data.get("conf", [])):
+        word = str(word).strip()
+        if word and float(confidence) >= 0:
+            weighted_confidence += float(confidence) * len(word)
+            char_count += len(word)
+    return text, (weighted_confidence / char_count if char_count else 0.0)
+
+def run_tesseract(image, lang, config, engine="auto"):
+    """
+    Tesseract를 한 번 실행하여 텍스트와 신뢰도를 함께 반환
+    
+    Args:
+        engine (str): OCR_ENGINES 중 하나
+    
+    Returns:
+        tuple: (텍스트, 평균 단어 신뢰도 0~100)
+    """
+    if resolve_ocr_engine(engine) == "tesserocr":
+        return _run_tesserocr(image, lang, config)
+    return _run_pytesseract(image, lang, config)
+
+class OcrConfigSelector:
+    """
+    문서 단위로 가장 잘 맞는 Tesseract 설정을 기억하는 선택기
+    
+    먼저 지난 페이지에서 가장 좋았던 설정 하나만 실행하고, 신뢰도가
+    accept_confidence 이상이면 그대로 사용한다. 부족하면 나머지 설정을 실행하여
+    신뢰도가 가장 높은 결과를 고르고, 그 설정을 다음 페이지에 먼저 쓴다.
+    마지막으로 모든 설정을 시도한 페이지의 최고 신뢰도(best_confidence)와
+    OCR_CONFIDENCE_MARGIN 이내인 결과도 그대로 사용하므로, 어떤 설정으로도
+    accept_confidence에 닿지 못하는 문서도 대부분의 페이지는 Tesseract 한 번으로 끝난다.
+    
+    workers는 이 선택기와 동시에 OCR을 실행하는 작업자 수로, 다시 시도할 때 동시에
+    실행하는 Tesseract 수를 CPU 코어 수 // workers로 제한한다.
+    """
+    def __init__(self, quality, accept_confidence=OCR_ACCEPT_CONFIDENCE, engine="auto", workers=1):
+        self.configs = get_ocr_configs(quality)
+        self.preferred = self.configs[0]
+        self.accept_confidence = accept_confidence
+        self.engine = resolve_ocr_engine(engine)
+        self.retry_workers = max(1, (os.cpu_count() or 1) // max(1, workers))
+        self.best_confidence = None
+    
+    def _good_enough(self, confidence):
+        """다른 설정을 시도하지 않고 사용할 만한 신뢰도인지 확인"""
+        if confidence >= self.accept_confidence:
+            return True
+        return self.best_confidence is not None and confidence >= self.best_confidence - OCR_CONFIDENCE_MARGIN
+    
+    def _run(self, image, lang, config, retry, context=None):
+        """
+        Tesseract를 한 번 실행 (retry: 첫 설정의 신뢰도가 부족해서 다른 설정으로 다시 실행)
+        
+        context는 다른 스레드에서 실행할 때 호출한 스레드의 측정 정보(파일, 페이지)
+        """
+        with metrics.context(**(context or {})), \
+             metrics.timed("tesseract", engine=self.engine, config=config, retry=retry) as info:
+            text, confidence = run_tesseract(image, lang, config, self.engine)
+            info.update(confidence=round(confidence, 1), chars=len(text))
+        return text, confidence
+    
+    def recognize(self, image, lang):
+        """이미지 하나를 OCR 처리하여 텍스트 반환"""
+        return self.recognize_with_confidence(image, lang)[0]
+    
+    def recognize_with_confidence(self, image, lang):
+        """이미지 하나를 OCR 처리하여 (텍스트, 평균 단어 신뢰도) 반환 (실패하면 신뢰도 -1)"""
+        try:
+            text, confidence = self._run(image, lang, self.preferred, False)
+        except Exception as e:
+            print(f"OCR 설정 {self.preferred} 실패: {e}")
+            text, confidence = "", -1.0
+        if text.strip() and self._good_enough(confidence):
+            return text, confidence
+        
+        candidates = [config for config in self.configs if config != self.preferred]
+        if not candidates:
+            return text, confidence
+        
+        best = (confidence if text.strip() else -1.0, text, self.preferred)
+        for config, (candidate_text, candidate_confidence) in self._iter_retries(image, lang, candidates):
+            if candidate_text.strip() and candidate_confidence > best[0]:
+                best = (candidate_confidence, candidate_text, config)
+        
+        self.preferred = best[2]
+        if best[0] >= 0:
+            self.best_confidence = best[0]
+        return best[1], best[0]
+    
+    def _iter_retries(self, image, lang, candidates):
+        """나머지 설정을 실행하여 (설정, (텍스트, 신뢰도))를 순서대로 반환 (실패한 설정은 건너뜀)"""
+        if self.engine == "tesserocr":
+            # tesserocr는 스레드마다 언어 모델을 따로 읽으므로 새 스레드를 만들지 않고
+            # 호출한 스레드의 API로 차례로 실행
+            for config in candidates:
+                try:
+                    yield config, self._run(image, lang, config, True)
+                except Exception as e:
+                    print(f"OCR 설정 {config} 실패: {e}")
+            return
+        
+        # pytesseract는 설정마다 별도 Tesseract 프로세스이므로 스레드로 동시에 실행
+        with ThreadPoolExecutor(max_workers=min(len(candidates), self.retry_workers)) as executor:
+            context = metrics.current_context()
+            futures = [(config, executor.submit(self._run, image, lang, config, True, context))
+                       for config in candidates]
+            for config, future in futures:
+                try:
+                    yield config, future.result()
+                except Exception as e:
+                    print(f"OCR 설정 {config} 실패: {e}")
+
+# 작업자 프로세스마다 처리 중인 문서의 설정 선택기를 보관
+_selector_cache = {}
+
+def get_config_selector(pdf_path, lang, quality, engine="auto", workers=1):
+    """문서별 설정 선택기 반환 (같은 문서의 다음 페이지는 같은 선택기를 사용, workers는 OcrConfigSelector 참고)"""
+    key = (os.path.abspath(pdf_path), lang, quality, engine, workers)
+    selector = _selector_cache.get(key)
+    if selector is None:
+        _selector_cache.clear()
+        selector = _selector_cache[key] = OcrConfigSelector(quality, engine=engine, workers=workers)
+    return selector
+
+def ocr_image(image, lang, quality, selector=None, engine="auto", with_confidence=False):
+    """
+    이미지 하나를 OCR 처리하여 텍스트 반환
+    
+    Args:
+        selector (OcrConfigSelector, optional): 문서 단위 설정 선택기.
+            None이면 이 이미지만을 위한 선택기를 새로 만듦
+        engine (str): selector가 없을 때 사용할 OCR 엔진
+        with_confidence (bool): True면 (텍스트, 평균 단어 신뢰도) 반환
+    """
+    if selector is None:
+        selector = OcrConfigSelector(quality, engine=engine)
+    text, confidence = selector.recognize_with_confidence(image, lang)
+    return (text, confidence) if with_confidence else text
+
+def format_ocr_page(page_num, page_text, postprocess=None, confidence=None, seconds=None):
+    """
+    OCR 결과를 정리하여 '[페이지 N]' 표시가 붙은 텍스트(PageText)로 반환
+    
+    Args:
+        postprocess (PostprocessRules, optional): 정리 규칙. None이면 기본 규칙
+        confidence (float, optional): OCR 평균 단어 신뢰도 (구조화된 출력에 기록)
+        seconds (float, optional): 페이지 처리 시간 (구조화된 출력에 기록)
+    """
+    cleaned_lines = clean_ocr_text(page_text, postprocess or DEFAULT_RULES)
+    if cleaned_lines:
+        text = f"[페이지 {page_num + 1}]\n" + '\n'.join(cleaned_lines) + "\n\n"
+    else:
+        text = f"[페이지 {page_num + 1}: OCR로 텍스트를 추출할 수 없음]\n\n"
+    if confidence is not None and confidence < 0:
+        confidence = None
+    return PageText(text, page_num + 1, "ocr", confidence, seconds)
+
+def count_pages(pdf_path, renderer="pdf2image"):
+    """페이지 수 확인 (pdf2image 렌더러는 Poppler가 필요)"""
+    if renderer == "fitz":
+        return _open_fitz_document(pdf_path).page_count
+    return pdfinfo_from_path(pdf_path)["Pages"]
+
+# 작업자 프로세스마다 마지막으로 연 문서를 재사용 (페이지마다 다시 파싱하지 않도록)
+_fitz_document_cache = {}
+
+def _open_fitz_document(pdf_path):
+    """같은 파일이면 이미 열린 PyMuPDF 문서를 반환"""
+    stat = os.stat(pdf_path)
+    key = (os.path.abspath(pdf_path), stat.st_size, stat.st_mtime)
+    doc = _fitz_document_cache.get(key)
+    if doc is None:
+        for old_doc in _fitz_document_cache.values():
+            old_doc.close()
+        _fitz_document_cache.clear()
+        doc = _fitz_document_cache[key] = fitz.open(pdf_path)
+    return doc
+
+def rasterize_fitz_page(page, quality="고품질"):
+    """
+    PyMuPDF 페이지를 전처리 전 그레이스케일 이미지로 변환
+    
+    Returns:
+        tuple: (image, pix) - image는 pix의 메모리를 그대로 참조하므로, 전처리로 새 이미지를
+            만들 때까지 pix를 보관하고 image를 먼저 지운 뒤 pix를 해제해야 함
+    """
+    # plan_render_dpi로 정한 해상도의 그레이스케일 이미지로 바로 변환
+    # RGB로 그린 뒤 변환하는 것보다 메모리를 1/3만 사용
+    dpi = plan_render_dpi(page.rect.width, page.rect.height, quality)
+    with metrics.timed("rasterize", page=page.number + 1, renderer="fitz", dpi=dpi) as info:
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi / 72.0, dpi / 72.0), colorspace=fitz.csGRAY, alpha=False)
+        info["bytes"] = pix.stride * pix.height
+    # PNG 인코딩/디코딩 없이 픽스맵 메모리를 그대로 PIL 이미지로 감쌈 (복사 없음)
+    image = Image.frombuffer("L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1)
+    return image, pix
+
+def render_fitz_page(page, quality="고품질"):
+    """PyMuPDF 페이지를 OCR용 이미지로 변환"""
+    image, pix = rasterize_fitz_page(page, quality)
+    with metrics.timed("preprocess", page=page.number + 1, quality=quality):
+        processed = preprocess_image(image, quality)
+    # 픽스맵보다 먼저 버퍼 참조를 해제해야 픽스맵 메모리를 정상적으로 반환할 수 있음
+    del image
+    return processed
+
+def render_page(pdf_path, page_num, quality, renderer="pdf2image"):
+    """페이지 하나만 이미지로 변환하고 전처리 (page_num은 0부터)"""
+    if renderer == "fitz":
+        return render_fitz_page(_open_fitz_document(pdf_path)[page_num], quality)
+    
+    image = rasterize_pdf2image_page(pdf_path, page_num, quality)
+    with metrics.timed("preprocess", page=page_num + 1, quality=quality):
+        return preprocess_image(image, quality)
+
+def rasterize_pdf2image_page(pdf_path, page_num, quality, page_size=None):
+    """
+    pdf2image(Poppler)로 페이지 하나를 전처리 전 이미지로 변환 (page_num은 0부터)
+    
+    page_size는 미리 구한 page_size_points 결과. None이면 여기서 구함
+    """
+    dpi = plan_render_dpi(*(page_size or page_size_points(pdf_path, page_num)), quality)
+    # first_page/last_page로 해당 페이지만 변환하여 문서 전체를 메모리에 올리지 않음
+    with metrics.timed("rasterize", page=page_num + 1, renderer="pdf2image", dpi=dpi) as info:
+        try:
+            images = convert_from_path(pdf_path, dpi=dpi, fmt='jpeg',
+                                       first_page=page_num + 1, last_page=page_num + 1)
+        except Exception as e:
+            retry_dpi = max(MIN_RENDER_DPI, dpi * 2 // 3)
+            print(f"페이지 {page_num + 1}: {dpi} DPI 변환 실패, {retry_dpi} DPI로 재시도: {e}")
+            info["dpi"] = retry_dpi
+            images = convert_from_path(pdf_path, dpi=retry_dpi,
+                                       first_page=page_num + 1, last_page=page_num + 1)
+        info["bytes"] = images[0].width * images[0].height * len(images[0].getbands())
+    return images[0]
+
+def iter_page_images(pdf_path, quality, renderer="pdf2image", first_page=1, last_page=None, page_numbers=None):
+    """
+    페이지를 한 장씩 이미지로 변환하여 반환하는 제너레이터
+    
+    한 번에 한 페이지만 메모리에 있으므로 페이지 수와 관계없이 메모리 사용량이
+    일정하고, 첫 페이지 OCR을 바로 시작할 수 있다.
+    
+    Args:
+        page_numbers (list, optional): 변환할 페이지 번호 목록 (0부터).
+            지정하면 first_page/last_page 대신 사용
+    
+    Yields:
+        (page_num, image) - page_num은 0부터
+    """
+    if page_numbers is None:
+        if last_page is None:
+            last_page = count_pages(pdf_path, renderer)
+        page_numbers = range(first_page - 1, last_page)
+    for page_num in page_numbers:
+        yield page_num, render_page(pdf_path, page_num, quality, renderer)
+
+def ocr_page(pdf_path, page_num, page_count, lang, quality, renderer="pdf2image", engine="auto",
+             postprocess=None, workers=1):
+    """
+    페이지 하나를 변환+전처리+OCR+정리 (page_num은 0부터, postprocess는 format_ocr_page 참고)
+    
+    workers는 동시에 페이지를 처리하는 작업자 수 (OcrConfigSelector 참고)
+    """
+    print(f"OCR 처리 중: 페이지 {page_num + 1}/{page_count}")
+    page_start = time.perf_counter()
+    with metrics.context(file=pdf_path, page=page_num + 1), \
+         metrics.timed("extract", page=page_num + 1, backend="ocr") as info:
+        image = render_page(pdf_path, page_num, quality, renderer)
+        selector = get_config_selector(pdf_path, lang, quality, engine, workers)
+        text, confidence = ocr_image(image, lang, quality, selector, with_confidence=True)
+        page_text = format_ocr_page(page_num, text, postprocess, confidence, time.perf_counter() - page_start)
+        info["chars"] = len(page_text)
+    return page_text
+
+def _ocr_page_job(job):
+    """작업자 프로세스에서 실행되는 페이지 OCR 작업"""
+    return ocr_page(*job)
+
+# 문서가 바뀌어도 계속 사용하는 OCR 작업자 프로세스 풀
+# 작업자가 살아 있는 동안 tesserocr 언어 모델과 import한 라이브러리가 유지됨
+_ocr_executor = None
+_ocr_executor_workers = 0
+_ocr_executor_lock = threading.Lock()
+
+def get_ocr_executor(workers):
+    """작업자 수가 같으면 기존 OCR 프로세스 풀을 재사용"""
+    global _ocr_executor, _ocr_executor_workers
+    with _ocr_executor_lock:
+        if _ocr_executor is None or _ocr_executor_workers != workers:
+            if _ocr_executor is not None:
+                _ocr_executor.shutdown(wait=False)
+            _ocr_executor = ProcessPoolExecutor(max_workers=workers)
+            _ocr_executor_workers = workers
+        return _ocr_executor
+
+def pick_renderer(pdf_path):
+    """pdf2image(Poppler)를 쓸 수 있으면 'pdf2image', 아니면 PyMuPDF 렌더러 'fitz'"""
+    try:
+        count_pages(pdf_path)
+        return "pdf2image"
+    except Exception as e:
+        if not FITZ_AVAILABLE:
+            raise
+        print(f"pdf2image 변환 실패, PyMuPDF로 변환합니다: {e}")
+        return "fitz"
+
+def iter_ocr_pages(pdf_path, lang="kor+eng", quality="고품질", workers=None, renderer="pdf2image",
+                   page_numbers=None, engine="auto", stages=None, postprocess=None):
+    """
+    페이지 단위로 작업자 프로세스에 나누어 OCR 처리하고 페이지 순서대로 반환
+    
+    Args:
+        pdf_path (str): 입력 PDF 파일 경로
+        lang (str): Tesseract 언어
+        quality (str): OCR 품질 ('고품질', '표준', '빠름')
+        workers (int, optional): 작업자 수. None이면 CPU 코어 수
+        renderer (str): "pdf2image" 또는 "fitz"
+        page_numbers (list, optional): OCR할 페이지 번호 목록 (0부터). None이면 전체
+        engine (str): OCR 엔진 (OCR_ENGINES 참고). 작업자 프로세스는 풀이 유지되는
+            동안 tesserocr 언어 모델을 계속 재사용
+        stages (StageWorkers, optional): 지정하면 작업자 프로세스 대신 래스터화/전처리/OCR
+            단계별 스레드 파이프라인으로 처리 (ocr_pipeline 참고). OCR 스레드 수를
+            정하지 않았으면 workers 사용
+        postprocess (PostprocessRules, optional): OCR 결과 정리 규칙. None이면 기본 규칙
+    
+    Yields:
+        str: 페이지별 텍스트 (page_numbers 순서대로)
+    """
+    if stages is not None:
+        from dataclasses import replace
+        from ocr_pipeline import iter_staged_ocr_pages
+        if stages.ocr is None:
+            stages = replace(stages, ocr=workers)
+        yield from iter_staged_ocr_pages(pdf_path, lang, quality, renderer, page_numbers, engine, stages,
+                                         postprocess)
+        return
+    
+    with metrics.timed("open", backend="ocr", renderer=renderer) as info:
+        page_count = count_pages(pdf_path, renderer)
+        info["pages"] = page_count
+    if page_numbers is None:
+        page_numbers = list(range(page_count))
+    pool_workers = workers or os.cpu_count() or 1
+    workers = min(pool_workers, len(page_numbers))
+    
+    if workers <= 1:
+        selector = OcrConfigSelector(quality, engine=engine)
+        # 페이지 시간은 이미지 변환부터 OCR까지 (소비하는 쪽에서 기다린 시간은 제외)
+        page_start = time.perf_counter()
+        for page_num, image in iter_page_images(pdf_path, quality, renderer, page_numbers=page_numbers):
+            print(f"OCR 처리 중: 페이지 {page_num + 1}/{page_count}")
+            with metrics.context(page=page_num + 1):
+                text, confidence = ocr_image(image, lang, quality, selector, with_confidence=True)
+            page_text = format_ocr_page(page_num, text, postprocess, confidence, time.perf_counter() - page_start)
+            metrics.record("extract", page_text.seconds, page=page_num + 1, backend="ocr", chars=len(page_text))
+            yield page_text
+            page_start = time.perf_counter()
+        return
+    
+    jobs = [(pdf_path, page_num, page_count, lang, quality, renderer, engine, postprocess, workers)
+            for page_num in page_numbers]
+    # 페이지마다 처리 시간이 크게 다르므로 한 페이지씩 분배
+    # (동시에 변환 중인 페이지는 작업자 수의 2배로 제한됨)
+    yield from iter_parallel(_ocr_page_job, jobs, workers, chunksize=1, executor=get_ocr_executor(pool_workers))
+
+def ocr_pages(pdf_path, lang="kor+eng", quality="고품질", workers=None, renderer="pdf2image", engine="auto"):
+    """페이지별 OCR 결과를 목록으로 반환 (iter_ocr_pages 참고)"""
+    return list(iter_ocr_pages(pdf_path, lang, quality, workers, renderer, engine=engine))
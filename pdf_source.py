@@ -0,0 +1,195 @@
+"""
+PDF 입력 (파일 경로, 메모리의 내용, 파일 객체, 메모리 맵)
+
+변환 함수는 파일 경로 대신 bytes, 파일 객체(BytesIO 등), mmap도 받는다.
+입력은 PdfSource 하나로 감싸서 모든 추출 방법이 같은 버퍼를 공유하므로,
+업로드된 내용을 임시 파일에 쓰거나 방법마다 같은 파일을 다시 읽지 않는다.
+
+    with open_source(pdf_bytes) as source:
+        doc = fitz.open(stream=source.buffer)
+        reader = PdfReader(source.stream())
+
+파일 경로만 받는 도구(pdftotext, pdf2image/OCR)에는 temp_path()로 필요할 때만
+임시 파일을 한 번 만들어 전달한다.
+"""
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+
+from extraction_cache import file_sha256
+
+# 이름이 없는 메모리 입력을 메시지와 측정 이벤트에 표시할 이름
+MEMORY_LABEL = "<메모리>"
+
+class BufferStream(io.RawIOBase):
+    """
+    버퍼를 복사하지 않고 읽는 파일 객체
+    
+    같은 버퍼에 여러 개를 만들어도 읽는 위치는 각자 따로 관리하므로
+    추출 방법마다 하나씩 만들어 사용한다.
+    """
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer).cast("B")
+        self._position = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def readinto(self, target):
+        end = min(self._position + len(target), len(self._buffer))
+        count = max(0, end - self._position)
+        target[:count] = self._buffer[self._position:end]
+        self._position += count
+        return count
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = (0, self._position, len(self._buffer))[whence]
+        self._position = max(0, base + offset)
+        return self._position
+    
+    def tell(self):
+        return self._position
+    
+    def close(self):
+        # 버퍼를 참조하는 memoryview를 풀어야 원래 mmap을 닫을 수 있음
+        if not self.closed:
+            self._buffer.release()
+        super().close()
+
+class PdfSource:
+    """
+    변환할 PDF 하나 (파일 경로 또는 메모리의 내용)
+    
+    path와 buffer 중 하나 이상이 있다. use_mmap=True로 만든 경로 입력은 처음
+    buffer를 사용할 때 파일을 메모리 맵으로 열고, close()에서 닫는다.
+    """
+    def __init__(self, path=None, buffer=None, name=None, use_mmap=False):
+        """
+        Args:
+            path (str, optional): PDF 파일 경로
+            buffer (optional): PDF 내용 (bytes, bytearray, memoryview, mmap)
+            name (str, optional): 메시지와 기본 출력 파일 이름에 사용할 이름. None이면 path
+            use_mmap (bool): path를 메모리 맵으로 열어 buffer로 사용
+        """
+        self.path = os.fspath(path) if path is not None else None
+        self.name = name or self.path
+        # PyMuPDF는 mmap 객체를 직접 받지 않으므로 복사 없이 memoryview로 감쌈 (close에서 해제)
+        self._view = memoryview(buffer) if isinstance(buffer, mmap.mmap) else None
+        self._buffer = self._view if self._view is not None else buffer
+        self._use_mmap = use_mmap and buffer is None and path is not None
+        self._mapped = None
+    
+    @property
+    def label(self):
+        """메시지와 측정 이벤트에 표시할 이름"""
+        return self.name or MEMORY_LABEL
+    
+    @property
+    def buffer(self):
+        """PDF 내용 버퍼 (경로만 있고 메모리 맵을 사용하지 않으면 None)"""
+        if self._buffer is None and self._use_mmap:
+            self._use_mmap = False
+            self._buffer = self._map()
+        return self._buffer
+    
+    def _map(self):
+        try:
+            with open(self.path, 'rb') as file:
+                self._mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            # 빈 파일 등 메모리 맵으로 열 수 없으면 경로로 읽음 (오류는 추출 방법이 알려줌)
+            print(f"메모리 맵을 사용할 수 없어 파일 경로로 읽습니다: {e}")
+            return None
+        return memoryview(self._mapped)
+    
+    def exists(self):
+        return self._buffer is not None or (self.path is not None and os.path.exists(self.path))
+    
+    @property
+    def size(self):
+        """PDF 내용 크기 (바이트, 파일이 없으면 0)"""
+        if self._buffer is not None:
+            return memoryview(self._buffer).nbytes
+        return os.path.getsize(self.path) if self.exists() else 0
+    
+    def stream(self):
+        """처음부터 읽는 새 파일 객체 (버퍼가 있으면 복사하지 않음, 사용 후 닫아야 함)"""
+        if self.buffer is not None:
+            return io.BufferedReader(BufferStream(self.buffer))
+        return open(self.path, 'rb')
+    
+    def sha256(self):
+        """PDF 내용의 SHA-256 해시"""
+        if self.buffer is not None:
+            return hashlib.sha256(self.buffer).hexdigest()
+        return file_sha256(self.path)
+    
+    @contextmanager
+    def temp_path(self):
+        """
+        파일 경로를 받는 도구에 넘길 경로
+        
+        경로가 있으면 그대로, 메모리의 내용이면 임시 파일에 한 번 써서 반환하고
+        블록이 끝나면 지운다.
+        """
+        if self.path is not None:
+            yield self.path
+            return
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(self.buffer)
+        try:
+            yield temp_file.name
+        finally:
+            os.remove(temp_file.name)
+    
+    def close(self):
+        """메모리 맵으로 열었으면 닫음 (받은 버퍼는 닫지 않음)"""
+        try:
+            if self._view is not None:
+                self._view.release()
+            if self._mapped is not None:
+                self._buffer.release()
+                self._mapped.close()
+        except BufferError:
+            # 닫지 않은 문서 객체가 버퍼를 참조하고 있으면 그 객체가 사라질 때 해제됨
+            pass
+        if self._view is not None or self._mapped is not None:
+            self._buffer = self._view = self._mapped = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+def open_source(pdf, use_mmap=False):
+    """
+    변환 함수가 받은 입력을 PdfSource로 변환
+    
+    Args:
+        pdf: 파일 경로(str, Path), PDF 내용(bytes, bytearray, memoryview, mmap),
+            읽기용 파일 객체 또는 PdfSource
+        use_mmap (bool): 파일 경로를 메모리 맵으로 열어 추출 방법들이 공유
+    
+    Raises:
+        TypeError: 지원하지 않는 입력
+    """
+    if isinstance(pdf, PdfSource):
+        return pdf
+    if isinstance(pdf, (str, os.PathLike)):
+        return PdfSource(path=pdf, use_mmap=use_mmap)
+    if isinstance(pdf, (bytes, bytearray, memoryview, mmap.mmap)):
+        return PdfSource(buffer=pdf)
+    if hasattr(pdf, "read"):
+        name = getattr(pdf, "name", None)
+        name = name if isinstance(name, str) else None
+        # BytesIO는 내용을 복사하지 않고 그대로 사용
+        buffer = pdf.getbuffer() if hasattr(pdf, "getbuffer") else pdf.read()
+        return PdfSource(buffer=buffer, name=name)
+    raise TypeError(f"지원하지 않는 PDF 입력: {type(pdf).__name__}")
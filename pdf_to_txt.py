@@ -1,90 +1,556 @@
+import json
 import os
 import sys
-import PyPDF2
-import pdfplumber
+import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass, replace
 from pathlib import Path
+import conversion_metrics as metrics
+from backends import (ExtractionError, backend_label, backend_names, check_max_chars, format_page_ranges,
+                      iter_backend_pages, limit_chars, parse_page_ranges, select_pages)
+from batch_manifest import BatchManifest
+from extraction_cache import ExtractionCache
+from page_text import page_record, with_text
+from pdf_source import open_source
+
+
+@dataclass
+class ConversionResult:
+    """파일 하나의 변환 결과"""
+    pdf_path: str
+    output_path: str
+    success: bool
+    text_length: int = 0
+    error: str = None
+    elapsed: float = 0.0
+    skipped: bool = False
+
+@dataclass
+class OcrOptions:
+    """OCR 설정 (추출 방법이 "ocr" 또는 "hybrid"일 때 사용)"""
+    lang: str = "kor+eng"
+    quality: str = "고품질"
+    engine: str = "auto"
+    workers: int = None
+    # ocr_pipeline.StageWorkers - 지정하면 래스터화/전처리/OCR 단계별 스레드 파이프라인 사용
+    stages: object = None
+    # ocr_postprocess.PostprocessRules - OCR 결과 정리 규칙 (None이면 기본 규칙)
+    postprocess: object = None
+
+# 하이브리드 방식에서 텍스트 레이어 글자 수가 이보다 적은 페이지는 OCR 처리
+HYBRID_MIN_CHARS = 20
+
+# 출력 형식과 기본 출력 파일 확장자
+# jsonl은 페이지마다 JSON 한 줄 (page_text.page_record), text를 이어 붙이면 txt 출력과 같음
+OUTPUT_FORMATS = {"txt": ".txt", "jsonl": ".jsonl"}
+
+def iter_text_with_backends(pdf_path, names, pages=None):
+    """
+    backends에 등록된 추출 방법으로 페이지별 텍스트를 하나씩 반환
+    
+    names가 여러 개면 페이지마다 앞의 방법부터 시도하여 텍스트가 나온 결과를 사용.
+    pages(페이지 범위)를 지정하면 그 페이지만 추출
+    """
+    for _, _, page_text in iter_backend_pages(pdf_path, names, pages):
+        yield with_text(page_text, page_text + "\n")
+
+def iter_text_with_pypdf2(pdf_path):
+    """PyPDF2를 사용하여 페이지별 텍스트를 하나씩 반환"""
+    return iter_text_with_backends(pdf_path, ["pypdf2"])
+
+def iter_text_with_pdfplumber(pdf_path):
+    """pdfplumber를 사용하여 페이지별 텍스트를 하나씩 반환 (더 정확함)"""
+    return iter_text_with_backends(pdf_path, ["pdfplumber"])
+
+def iter_text_with_ocr(pdf_path, ocr=None, pages=None):
+    """OCR을 사용하여 페이지별 텍스트를 하나씩 반환 (이미지 기반 PDF용, pages는 페이지 범위)"""
+    # pdf_ocr가 이 모듈을 import하므로 순환 import를 피하기 위해 여기서 import
+    from pdf_ocr import OCR_AVAILABLE, count_pages, iter_ocr_pages, pick_renderer
+    if not OCR_AVAILABLE:
+        raise ExtractionError("OCR 라이브러리(pytesseract, pdf2image)가 설치되지 않았습니다.")
+    ocr = ocr or OcrOptions()
+    # OCR 작업자 프로세스는 파일 경로로 페이지를 다시 열므로 메모리의 PDF는 임시 파일에 한 번 기록
+    with open_source(pdf_path).temp_path() as path:
+        renderer = pick_renderer(path)
+        page_numbers = None
+        if pages is not None:
+            page_numbers = select_pages(parse_page_ranges(pages), count_pages(path, renderer))
+        yield from iter_ocr_pages(path, ocr.lang, ocr.quality, ocr.workers, renderer, page_numbers=page_numbers,
+                                  engine=ocr.engine, stages=ocr.stages, postprocess=ocr.postprocess)
+
+def iter_text_with_hybrid(pdf_path, ocr=None, pages=None):
+    """
+    텍스트 레이어를 사용하고, 텍스트가 없거나 너무 적은 페이지만 OCR 처리 (pages는 페이지 범위)
+    
+    텍스트 페이지와 스캔 페이지가 섞인 PDF에서 스캔 페이지를 놓치지 않으면서
+    텍스트 페이지에는 OCR 비용을 들이지 않는다. 페이지를 나눌 때 추출한 텍스트를
+    그대로 출력에 사용하므로 텍스트 레이어는 한 번만 추출한다.
+    OCR 페이지는 작업자 프로세스에서 처리하는 동안 다음 페이지 추출을 계속하며, 앞쪽의
+    OCR 페이지를 기다리는 텍스트 페이지만 보관하고 나머지는 바로 반환한다.
+    (ocr.stages는 사용하지 않고 페이지마다 OCR 작업자 프로세스에 맡김)
+    """
+    from pdf_ocr import OCR_AVAILABLE, get_ocr_executor, ocr_page, pick_renderer
+    if not OCR_AVAILABLE:
+        raise ExtractionError("OCR 라이브러리(pytesseract, pdf2image)가 설치되지 않았습니다.")
+    ocr = ocr or OcrOptions()
+    source = open_source(pdf_path)
+    workers = ocr.workers or os.cpu_count() or 1
+    max_pending = max(workers * 2, 8)
+    pending = deque()
+    submitted = []
+    ocr_count = 0
+    
+    def cancel_submitted():
+        # 중간에 멈추면 공용 OCR 프로세스 풀은 두고 아직 시작하지 않은 페이지만 취소
+        for future in submitted:
+            future.cancel()
+    
+    with ExitStack() as stack:
+        path = renderer = executor = None
+        text_pages = iter_backend_pages(source, backend_names("text"), pages)
+        stack.callback(text_pages.close)
+        for page_num, page_count, page_text in text_pages:
+            if len(page_text.strip()) >= HYBRID_MIN_CHARS:
+                pending.append(with_text(page_text, page_text + "\n"))
+            else:
+                if path is None:
+                    # OCR 작업자 프로세스는 파일 경로로 페이지를 다시 열므로 메모리의 PDF는
+                    # 처음 OCR할 페이지를 만났을 때 임시 파일에 한 번 기록
+                    path = stack.enter_context(source.temp_path())
+                    stack.callback(cancel_submitted)
+                    renderer = pick_renderer(path)
+                ocr_count += 1
+                job = (path, page_num, page_count, ocr.lang, ocr.quality, renderer, ocr.engine, ocr.postprocess,
+                       workers)
+                if workers <= 1:
+                    pending.append(ocr_page(*job))
+                else:
+                    if executor is None:
+                        executor = get_ocr_executor(workers)
+                    future = executor.submit(ocr_page, *job)
+                    pending.append(future)
+                    submitted.append(future)
+            
+            # 앞쪽 페이지가 끝났으면 바로 내보내고, 대기 중인 페이지가 너무 많으면 기다림
+            # (pending에는 완성된 페이지 텍스트와 OCR 중인 페이지의 Future가 섞여 있음)
+            while pending and (isinstance(pending[0], str) or pending[0].done() or len(pending) > max_pending):
+                item = pending.popleft()
+                yield item if isinstance(item, str) else item.result()
+        
+        while pending:
+            item = pending.popleft()
+            yield item if isinstance(item, str) else item.result()
+    print(f"하이브리드: {ocr_count}페이지 OCR 처리")
+
+def iter_pages(pdf_path, method="pdfplumber", ocr=None, pages=None, max_chars=None):
+    """
+    추출 방법에 맞는 페이지별 텍스트 제너레이터 반환
+    
+    Args:
+        pdf_path: PDF 파일 경로, PDF 내용(bytes, mmap), 파일 객체 또는 PdfSource
+        method (str): 추출 방법. backends에 등록된 텍스트 추출 방법("pdfplumber",
+            "pypdf2", "pymupdf" 등), "auto" (설치된 방법을 페이지마다 싼 순서로 시도)
+            "ocr" 또는 "hybrid" (텍스트 레이어가 부족한 페이지만 OCR)
+        ocr (OcrOptions, optional): OCR 설정. None이면 기본값
+        pages (str, optional): 추출할 페이지 범위 (예: "1-10,50"). None이면 전체
+        max_chars (int, optional): 텍스트가 이 글자 수에 이르면 나머지 페이지는 추출하지 않음
+    
+    Raises:
+        ExtractionError: 지원하지 않거나 설치되지 않은 추출 방법
+        ValueError: 페이지 범위 형식이 잘못됨
+    """
+    page_ranges = parse_page_ranges(pages)
+    if method == "ocr":
+        text_pages = iter_text_with_ocr(pdf_path, ocr, page_ranges)
+    elif method == "hybrid":
+        text_pages = iter_text_with_hybrid(pdf_path, ocr, page_ranges)
+    elif method == "auto":
+        text_pages = iter_text_with_backends(pdf_path, backend_names("text"), page_ranges)
+    elif method in backend_names("text", available_only=False):
+        # 설치되지 않은 방법이면 iter_backend_pages에서 ExtractionError 발생
+        text_pages = iter_text_with_backends(pdf_path, [method], page_ranges)
+    else:
+        raise ExtractionError(f"지원하지 않는 추출 방법: {method}")
+    return limit_chars(text_pages, max_chars)
 
 def extract_text_with_pypdf2(pdf_path):
     """PyPDF2를 사용하여 PDF에서 텍스트 추출"""
-    text = ""
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
+        return "".join(iter_text_with_pypdf2(pdf_path))
     except Exception as e:
         print(f"PyPDF2로 텍스트 추출 중 오류 발생: {e}")
         return None
-    return text
 
 def extract_text_with_pdfplumber(pdf_path):
     """pdfplumber를 사용하여 PDF에서 텍스트 추출 (더 정확함)"""
-    text = ""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        return "".join(iter_text_with_pdfplumber(pdf_path))
     except Exception as e:
         print(f"pdfplumber로 텍스트 추출 중 오류 발생: {e}")
         return None
-    return text
 
-def pdf_to_txt(pdf_path, output_path=None, method="pdfplumber"):
+def write_pages(pages, output_path):
+    """
+    페이지별 텍스트를 받는 대로 파일에 기록
+    
+    임시 파일에 먼저 쓰고 끝까지 성공했을 때만 출력 경로로 옮기므로,
+    추출 중 오류가 나도 반쪽짜리 출력 파일이 남지 않는다.
+    
+    Args:
+        pages: 페이지별 텍스트를 반환하는 이터러블
+        output_path (str): 출력 TXT 파일 경로
+    
+    Returns:
+        tuple: (기록한 문자 수, 공백이 아닌 내용이 있었는지 여부)
+    """
+    temp_path = output_path + ".part"
+    text_length = 0
+    page_count = 0
+    has_content = False
+    # 추출 시간을 빼고 파일에 쓰는 데 걸린 시간만 합산
+    write_seconds = 0.0
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as txt_file:
+            for page_text in pages:
+                write_start = time.perf_counter()
+                txt_file.write(page_text)
+                write_seconds += time.perf_counter() - write_start
+                text_length += len(page_text)
+                page_count += 1
+                if not has_content and page_text.strip():
+                    has_content = True
+            write_start = time.perf_counter()
+        os.replace(temp_path, output_path)
+        write_seconds += time.perf_counter() - write_start
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    if metrics.enabled():
+        metrics.record("write", write_seconds, pages=page_count, chars=text_length,
+                       bytes=os.path.getsize(output_path))
+    return text_length, has_content
+
+def write_page_records(pages, output_path, file=None):
+    """
+    페이지별 텍스트를 받는 대로 JSON 한 줄씩(JSONL) 파일에 기록
+    
+    색인기 등이 변환 중인 파일을 바로 읽을 수 있도록 임시 파일 없이 출력 경로에
+    페이지마다 기록하고 flush한다. 마지막 줄은 끝 표시이며, 이 줄이 없으면 아직
+    변환 중이거나 중단된 파일이다.
+    
+        {"type": "page", "file": ..., "page": 1, "backend": "pdfplumber", ..., "text": "..."}
+        {"type": "end", "file": ..., "success": true, "pages": 12, "chars": 30512}
+    
+    추출 중 오류가 나면 success가 false이고 error가 담긴 끝 표시를 기록한 뒤 예외를 다시 발생시킨다.
+    
+    Args:
+        pages: 페이지별 텍스트를 반환하는 이터러블 (PageText면 추출 정보도 기록)
+        output_path (str): 출력 JSONL 파일 경로
+        file (str, optional): 레코드에 기록할 입력 파일 이름
+    
+    Returns:
+        tuple: (기록한 문자 수, 공백이 아닌 내용이 있었는지 여부)
+    """
+    text_length = 0
+    page_count = 0
+    has_content = False
+    write_seconds = 0.0
+    with open(output_path, 'w', encoding='utf-8') as jsonl_file:
+        def write_record(record):
+            jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            jsonl_file.flush()
+        
+        end = {"type": "end", "file": file, "success": True}
+        try:
+            for page_text in pages:
+                write_start = time.perf_counter()
+                page_count += 1
+                write_record(page_record(page_text, page_count, file))
+                write_seconds += time.perf_counter() - write_start
+                text_length += len(page_text)
+                if not has_content and page_text.strip():
+                    has_content = True
+        except Exception as e:
+            end.update(success=False, error=str(e))
+            raise
+        finally:
+            write_record({**end, "pages": page_count, "chars": text_length})
+    if metrics.enabled():
+        metrics.record("write", write_seconds, pages=page_count, chars=text_length,
+                       bytes=os.path.getsize(output_path))
+    return text_length, has_content
+
+def pdf_to_txt(pdf_path, output_path=None, method="pdfplumber", cache=None, ocr=None, use_mmap=False,
+               pages=None, max_chars=None, output_format="txt"):
     """
     PDF 파일을 TXT 파일로 변환
     
     Args:
-        pdf_path (str): 입력 PDF 파일 경로
+        pdf_path: 입력 PDF 파일 경로. PDF 내용(bytes, mmap)이나 파일 객체도 가능
         output_path (str, optional): 출력 TXT 파일 경로. None이면 자동 생성
-        method (str): 추출 방법 ("pdfplumber" 또는 "pypdf2")
+        method (str): 추출 방법 ("pdfplumber", "pypdf2" 또는 "ocr")
+        cache (ExtractionCache, optional): 추출 결과 캐시. None이면 캐시 사용 안 함
+        ocr (OcrOptions, optional): OCR 설정. None이면 기본값
+        use_mmap (bool): 입력 파일을 메모리 맵으로 한 번 열어 캐시 해시 계산과 추출 방법들이 공유
+        pages (str, optional): 변환할 페이지 범위 (예: "1-10,50"). None이면 전체
+        max_chars (int, optional): 텍스트가 이 글자 수에 이르면 나머지 페이지는 추출하지 않음
+        output_format (str): 출력 형식 ("txt" 또는 페이지마다 JSON 한 줄인 "jsonl")
     
     Returns:
         bool: 변환 성공 여부
     """
+    return convert_file(pdf_path, output_path, method, cache, ocr, use_mmap, pages, max_chars,
+                        output_format).success
+
+def convert_file(pdf_path, output_path=None, method="pdfplumber", cache=None, ocr=None, use_mmap=False,
+                 pages=None, max_chars=None, output_format="txt"):
+    """
+    PDF 파일을 TXT 파일로 변환하고 결과 객체를 반환
     
-    # PDF 파일 존재 확인
-    if not os.path.exists(pdf_path):
-        print(f"오류: PDF 파일을 찾을 수 없습니다: {pdf_path}")
-        return False
+    Args:
+        pdf_path: 입력 PDF 파일 경로. PDF 내용(bytes, bytearray, memoryview, mmap),
+            읽기용 파일 객체(BytesIO 등) 또는 pdf_source.PdfSource도 가능하며,
+            이름이 없는 입력은 output_path를 지정해야 함
+        output_path (str, optional): 출력 TXT 파일 경로. None이면 자동 생성
+        method (str): 추출 방법 ("pdfplumber", "pypdf2" 또는 "ocr")
+        cache (ExtractionCache, optional): 추출 결과 캐시. None이면 캐시 사용 안 함
+        ocr (OcrOptions, optional): OCR 설정. None이면 기본값
+        use_mmap (bool): 입력 파일을 메모리 맵으로 한 번 열어 캐시 해시 계산과 추출 방법들이 공유
+        pages (str, optional): 변환할 페이지 범위 (예: "1-10,50"). None이면 전체
+        max_chars (int, optional): 텍스트가 이 글자 수에 이르면 나머지 페이지는 추출하지 않음
+            (분류 등에 앞부분만 필요할 때). 잘린 결과는 캐시에 저장하지 않음
+        output_format (str): 출력 형식. "txt"는 텍스트 파일 하나, "jsonl"은 페이지마다
+            페이지 번호, 추출 방법, OCR 신뢰도, 글자 수, 처리 시간, 텍스트를 담은 JSON 한 줄
+            (write_page_records 참고). 출력 경로를 정하지 않으면 확장자도 형식을 따름
+    
+    Returns:
+        ConversionResult: 변환 결과
+    """
+    return _convert(pdf_path, output_path, method, cache, ocr, use_mmap, pages, max_chars, output_format)
+
+def convert_to_pages(pdf_path, output_path, method="pdfplumber", cache=None, ocr=None, use_mmap=False,
+                     pages=None, max_chars=None):
+    """
+    PDF 파일을 변환하여 파일에 쓰지 않고 페이지 목록으로 반환 (일괄 변환 출력 대상용)
+    
+    Args:
+        output_path (str): 결과에 기록할 출력 위치 (출력 대상 경로)
+        나머지는 convert_file과 같음
+    
+    Returns:
+        tuple: (ConversionResult, 페이지별 텍스트 목록)
+    """
+    collected = []
+    result = _convert(pdf_path, output_path, method, cache, ocr, use_mmap, pages, max_chars, "txt", collected)
+    return result, collected
+
+def _convert(pdf_path, output_path, method, cache, ocr, use_mmap, pages, max_chars, output_format,
+             collected=None):
+    source = open_source(pdf_path, use_mmap)
+    with source, metrics.context(file=source.label):
+        result = _convert_file(source, output_path, method, cache, ocr, pages, max_chars, output_format,
+                               collected)
+        size = source.size
+    if metrics.enabled():
+        metrics.record("file", result.elapsed, file=source.label, method=method, success=result.success,
+                       chars=result.text_length, error=result.error, bytes=size)
+    return result
+
+def _convert_file(source, output_path, method, cache, ocr, pages, max_chars, output_format, collected):
+    start_time = time.perf_counter()
     
     # 출력 파일 경로 설정
+    if output_path is None and source.name is not None and output_format in OUTPUT_FORMATS:
+        pdf_name = Path(source.name).stem
+        output_path = pdf_name + OUTPUT_FORMATS[output_format]
+    
+    def result(success, text_length=0, error=None):
+        return ConversionResult(source.label, output_path, success, text_length, error,
+                                time.perf_counter() - start_time)
+    
+    if output_format not in OUTPUT_FORMATS:
+        print(f"오류: 지원하지 않는 출력 형식입니다. 다음 중 하나를 사용하세요: {', '.join(OUTPUT_FORMATS)}")
+        return result(False, error=f"지원하지 않는 출력 형식: {output_format}")
+    
     if output_path is None:
-        pdf_name = Path(pdf_path).stem
-        output_path = f"{pdf_name}.txt"
+        print("오류: 메모리의 PDF를 변환할 때는 출력 파일 경로를 지정해야 합니다.")
+        return result(False, error="출력 파일 경로가 없습니다")
+    
+    # PDF 파일 존재 확인
+    if not source.exists():
+        print(f"오류: PDF 파일을 찾을 수 없습니다: {source.label}")
+        return result(False, error="PDF 파일을 찾을 수 없습니다")
     
     # 텍스트 추출
-    print(f"PDF 파일에서 텍스트 추출 중: {pdf_path}")
+    print(f"PDF 파일에서 텍스트 추출 중: {source.label}")
     
-    if method == "pdfplumber":
-        extracted_text = extract_text_with_pdfplumber(pdf_path)
-    elif method == "pypdf2":
-        extracted_text = extract_text_with_pypdf2(pdf_path)
-    else:
-        print("오류: 지원하지 않는 추출 방법입니다. 'pdfplumber' 또는 'pypdf2'를 사용하세요.")
-        return False
+    ocr = ocr or OcrOptions()
+    try:
+        page_ranges = parse_page_ranges(pages)
+        check_max_chars(max_chars)
+    except ValueError as e:
+        print(f"오류: {e}")
+        return result(False, error=str(e))
+    try:
+        pages = iter_pages(source, method, ocr, page_ranges)
+    except ExtractionError as e:
+        methods = ", ".join(["auto", *backend_names("text"), "ocr", "hybrid"])
+        print(f"오류: 지원하지 않는 추출 방법입니다. 다음 중 하나를 사용하세요: {methods}")
+        return result(False, error=str(e))
+    
+    # 내용과 설정이 같은 PDF를 이미 추출한 적이 있으면 캐시된 결과 사용
+    if cache is not None:
+        pages = cached_pages(cache, source, pages, **cache_settings(method, ocr, page_ranges))
+    # 글자 수 제한은 캐시 뒤에 적용 (중간에 멈춘 추출은 캐시에 저장되지 않음)
+    pages = limit_chars(pages, max_chars)
     
-    if extracted_text is None:
+    # 페이지를 추출하는 대로 파일에 저장 (문서 전체를 메모리에 모으지 않음)
+    try:
+        if collected is not None:
+            collected.extend(pages)
+            text_length = sum(map(len, collected))
+            has_content = any(page_text.strip() for page_text in collected)
+        elif output_format == "jsonl":
+            text_length, has_content = write_page_records(pages, output_path, source.label)
+        else:
+            text_length, has_content = write_pages(pages, output_path)
+    except OSError as e:
+        print(f"파일 저장 중 오류 발생: {e}")
+        return result(False, error=str(e))
+    except Exception as e:
+        print(f"{method}로 텍스트 추출 중 오류 발생: {e}")
         print("텍스트 추출에 실패했습니다.")
-        return False
+        return result(False, error=str(e))
     
-    if not extracted_text.strip():
+    if not has_content:
         print("경고: 추출된 텍스트가 비어있습니다. PDF가 이미지 기반이거나 보호되어 있을 수 있습니다.")
     
-    # TXT 파일로 저장
+    print(f"변환 완료: {output_path}")
+    print(f"추출된 텍스트 길이: {text_length} 문자")
+    return result(True, text_length)
+
+def cache_settings(method, ocr=None, pages=None):
+    """캐시 키에 포함할 추출 설정 (OCR이면 언어/품질/엔진, 일부 페이지만 추출하면 페이지 범위 포함)"""
+    settings = {"method": method}
+    if pages is not None:
+        settings["page_range"] = format_page_ranges(parse_page_ranges(pages))
+    if method in ("ocr", "hybrid"):
+        from pdf_ocr import resolve_ocr_engine
+        ocr = ocr or OcrOptions()
+        settings.update(ocr_lang=ocr.lang, ocr_quality=ocr.quality, ocr_engine=resolve_ocr_engine(ocr.engine))
+        # 기본 정리 규칙이면 키에 넣지 않아 기존 캐시를 그대로 사용
+        if ocr.postprocess is not None and ocr.postprocess.cache_key() is not None:
+            settings["ocr_postprocess"] = ocr.postprocess.cache_key()
+    return settings
+
+def cached_pages(cache, pdf_path, pages, **settings):
+    """
+    캐시에 추출 결과가 있으면 캐시된 페이지를, 없으면 캐시에 기록하면서
+    원래 페이지를 그대로 전달하는 이터러블 반환
+    
+    Args:
+        cache (ExtractionCache): 추출 결과 캐시
+        pdf_path: 입력 PDF 파일 경로 또는 pdf_source.PdfSource
+        pages: 캐시가 없을 때 사용할 페이지별 텍스트 제너레이터
+        **settings: 캐시 키에 포함할 추출 설정 (method, ocr_lang 등)
+    """
     try:
-        with open(output_path, 'w', encoding='utf-8') as txt_file:
-            txt_file.write(extracted_text)
-        print(f"변환 완료: {output_path}")
-        print(f"추출된 텍스트 길이: {len(extracted_text)} 문자")
-        return True
-    except Exception as e:
-        print(f"파일 저장 중 오류 발생: {e}")
-        return False
+        cache_key = cache.make_key(pdf_path, **settings)
+        cached = cache.load(cache_key)
+    except OSError as e:
+        print(f"캐시를 사용할 수 없습니다: {e}")
+        return pages
+    
+    if cached is not None:
+        print("캐시된 추출 결과를 사용합니다.")
+        return cached
+    return cache.record(cache_key, pages)
+
+def _convert_job(job):
+    """프로세스 풀 작업자에서 실행되는 변환 작업 (pickle 가능해야 함)"""
+    return convert_file(*job)
+
+def _collect_job(job):
+    """출력 대상에 기록할 페이지를 부모 프로세스로 돌려보내는 변환 작업"""
+    return convert_to_pages(*job)
+
+def _run_all(func, chunk):
+    return [func(item) for item in chunk]
+
+def _run_chunk(job):
+    """
+    작업 묶음을 작업자 프로세스에서 순서대로 실행
+    
+    Returns:
+        tuple: (결과 목록, 측정 이벤트 목록). 부모 프로세스가 측정 중이 아니면 이벤트는 None
+    """
+    func, chunk, collect = job
+    if collect:
+        return metrics.call_collecting(_run_all, func, chunk)
+    return _run_all(func, chunk), None
+
+def _chunk_results(future):
+    """작업 묶음의 결과 목록 (작업자에서 생긴 측정 이벤트는 이 프로세스의 출력 대상으로 전달)"""
+    results, events = future.result()
+    metrics.replay(events)
+    return results
 
-def batch_convert(input_folder, output_folder=None, method="pdfplumber"):
+def iter_parallel(func, jobs, workers=None, chunksize=None, max_in_flight=None, executor=None):
+    """
+    작업들을 프로세스 풀에서 병렬 실행하고 입력 순서대로 결과를 반환
+    
+    한 번에 제출하는 작업 수를 제한하므로 작업이 아무리 많아도 대기 중인
+    결과가 메모리에 쌓이지 않고, 첫 번째 결과는 바로 받을 수 있다.
+    
+    Args:
+        func: 모듈 최상위 함수 (작업자 프로세스로 전달 가능해야 함)
+        jobs (list): func에 전달할 인자 목록
+        workers (int, optional): 작업자 수. None이면 CPU 코어 수
+        chunksize (int, optional): 작업자에게 한 번에 보낼 작업 수. None이면 자동
+        max_in_flight (int, optional): 동시에 제출해 둘 묶음 수. None이면 작업자 수의 2배
+        executor (ProcessPoolExecutor, optional): 재사용할 프로세스 풀. 지정하면
+            새 풀을 만들지 않고, 끝난 뒤에도 종료하지 않음
+    
+    Yields:
+        func(job)의 결과 (jobs와 같은 순서)
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            yield func(job)
+        return
+    
+    # 작은 파일이 많을 때 프로세스 간 통신 비용을 줄이기 위해 묶어서 전달
+    if chunksize is None:
+        chunksize = max(1, min(len(jobs) // (workers * 8), 32))
+    chunks = (jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize))
+    max_in_flight = max_in_flight or workers * 2
+    
+    own_executor = executor is None
+    if own_executor:
+        # multiprocessing은 불러오는 데 시간이 걸리므로 병렬 실행할 때만 import
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+    collect = metrics.enabled()
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(_run_chunk, (func, chunk, collect)))
+            if len(pending) >= max_in_flight:
+                yield from _chunk_results(pending.popleft())
+        while pending:
+            yield from _chunk_results(pending.popleft())
+    finally:
+        # 중간에 중단되면 아직 시작하지 않은 작업은 취소
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+def batch_convert(input_folder, output_folder=None, method="pdfplumber", workers=None,
+                  progress_callback=None, cache=None, incremental=True, ocr=None, use_mmap=False,
+                  pages=None, max_chars=None, output_format="txt", sink=None):
     """
     폴더 내 모든 PDF 파일을 일괄 변환
     
@@ -92,10 +558,40 @@ def batch_convert(input_folder, output_folder=None, method="pdfplumber"):
         input_folder (str): PDF 파일들이 있는 폴더
         output_folder (str, optional): 출력 폴더. None이면 입력 폴더와 동일
         method (str): 추출 방법
+        workers (int, optional): 동시에 변환할 프로세스 수. None이면 CPU 코어 수
+        progress_callback (callable, optional): 파일 하나가 끝날 때마다
+            (완료 개수, 전체 개수, ConversionResult)로 호출. 입력 순서대로 호출됨
+        cache (ExtractionCache, optional): 추출 결과 캐시. 내용이 바뀌지 않은 PDF는
+            다시 추출하지 않고 캐시된 텍스트를 사용
+        incremental (bool): True면 출력 폴더의 매니페스트를 보고 이전 실행 이후
+            새로 생기거나 바뀌었거나 실패했던 파일만 변환. 중단된 실행도 이어서 진행
+        ocr (OcrOptions, optional): OCR 설정. 파일 단위 병렬 처리 후 남는 코어를
+            OCR 페이지 병렬 처리에 배분
+        use_mmap (bool): 각 PDF를 메모리 맵으로 한 번 열어 캐시 해시 계산과 추출 방법들이 공유
+        pages (str, optional): 파일마다 변환할 페이지 범위 (예: "1-3"). None이면 전체
+        max_chars (int, optional): 파일마다 텍스트가 이 글자 수에 이르면 나머지 페이지는 추출하지 않음
+        output_format (str): 출력 형식 ("txt" 또는 "jsonl"). 출력 파일 확장자도 형식을 따름
+        sink (output_sink.OutputSink, optional): 파일마다 출력 파일을 만드는 대신 결과를 묶음
+            단위로 기록할 출력 대상 (압축된 JSONL 조각 파일, SQLite). output_format은 무시하며,
+            매니페스트는 출력 대상에 실제로 기록된 파일만 성공으로 남김. 출력 대상은 호출한 쪽에서 닫음
+    
+    Returns:
+        list: 파일별 ConversionResult 목록 (건너뛴 파일은 skipped=True)
     """
+    try:
+        page_ranges = parse_page_ranges(pages)
+        check_max_chars(max_chars)
+    except ValueError as e:
+        print(f"오류: {e}")
+        return []
+    
+    if output_format not in OUTPUT_FORMATS:
+        print(f"오류: 지원하지 않는 출력 형식입니다. 다음 중 하나를 사용하세요: {', '.join(OUTPUT_FORMATS)}")
+        return []
+    
     if not os.path.exists(input_folder):
         print(f"오류: 입력 폴더를 찾을 수 없습니다: {input_folder}")
-        return
+        return []
     
     if output_folder and not os.path.exists(output_folder):
         os.makedirs(output_folder)
@@ -104,76 +600,315 @@ def batch_convert(input_folder, output_folder=None, method="pdfplumber"):
     
     if not pdf_files:
         print("PDF 파일을 찾을 수 없습니다.")
-        return
+        return []
     
     print(f"{len(pdf_files)}개의 PDF 파일을 발견했습니다.")
     
-    success_count = 0
+    manifest = BatchManifest(output_folder or input_folder) if incremental else None
+    # 결과에 영향을 주는 설정(캐시 키와 같은 OCR 언어/품질/엔진/정리 규칙, 페이지 범위 등)을
+    # 추출 방법에 붙여 기록 (설정을 바꿔 다시 실행하면 이전 결과를 건너뛰지 않도록)
+    manifest_method = " ".join([method, *(f"{name}={value}"
+                                          for name, value in cache_settings(method, ocr, page_ranges).items()
+                                          if name != "method")])
+    if max_chars is not None:
+        manifest_method += f" max_chars={max_chars}"
+    if sink is not None:
+        manifest_method += f" sink={sink.path}"
+    
+    jobs = []
+    names = []
+    results = []
     for pdf_file in pdf_files:
         pdf_path = os.path.join(input_folder, pdf_file)
-        txt_filename = Path(pdf_file).stem + ".txt"
+        txt_filename = Path(pdf_file).stem + OUTPUT_FORMATS[output_format]
         
         if output_folder:
             output_path = os.path.join(output_folder, txt_filename)
         else:
             output_path = os.path.join(input_folder, txt_filename)
         
-        if pdf_to_txt(pdf_path, output_path, method):
-            success_count += 1
-        print("-" * 50)
+        if sink is not None:
+            # 출력 대상에서는 기록될 조각 파일을 미리 알 수 없으므로 매니페스트에 기록된 위치를 확인
+            output_path = None
+        
+        # 이전 실행에서 성공했고 그 뒤로 바뀌지 않은 파일은 건너뜀
+        if manifest is not None and not manifest.needs_conversion(pdf_file, pdf_path, output_path, manifest_method):
+            output_path = output_path or manifest.entries[pdf_file]["output_path"]
+            results.append(ConversionResult(pdf_path, output_path, True, skipped=True))
+            continue
+        
+        if sink is not None:
+            jobs.append((pdf_path, sink.path, method, cache, ocr, use_mmap, page_ranges, max_chars))
+        else:
+            jobs.append((pdf_path, output_path, method, cache, ocr, use_mmap, page_ranges, max_chars,
+                         output_format))
+        names.append(pdf_file)
+    
+    if method in ("ocr", "hybrid") and jobs:
+        # 파일 단위 병렬 처리 후 남는 코어만 각 파일의 OCR 페이지 병렬 처리에 배분
+        total_workers = workers or os.cpu_count() or 1
+        ocr = replace(ocr or OcrOptions(), workers=max(1, total_workers // min(total_workers, len(jobs))))
+        jobs = [job[:4] + (ocr,) + job[5:] for job in jobs]
+    
+    if results:
+        print(f"{len(results)}개 파일은 이전 변환 이후 바뀌지 않아 건너뜁니다.")
+        if progress_callback:
+            for index, result in enumerate(results):
+                progress_callback(index + 1, len(pdf_files), result)
+    
+    if sink is None:
+        for name, result in zip(names, iter_parallel(_convert_job, jobs, workers)):
+            results.append(result)
+            # 파일 하나가 끝날 때마다 기록하므로 중단되어도 다음 실행에서 이어서 진행
+            if manifest is not None:
+                manifest.record(name, result, manifest_method)
+            if progress_callback:
+                progress_callback(len(results), len(pdf_files), result)
+            print("-" * 50)
+    else:
+        _convert_to_sink(names, jobs, workers, sink, manifest, manifest_method, results, len(pdf_files),
+                         progress_callback)
+    
+    if cache is not None:
+        cache.evict()
     
+    success_count = sum(1 for result in results if result.success)
     print(f"변환 완료: {success_count}/{len(pdf_files)} 파일 성공")
+    return results
+
+def _convert_to_sink(names, jobs, workers, sink, manifest, manifest_method, results, total, progress_callback):
+    """작업자가 돌려준 페이지를 출력 대상에 모아 묶음 단위로 기록 (batch_convert의 sink 모드)"""
+    on_commit = sink.on_commit
+    if manifest is not None:
+        # 묶음이 디스크에 기록된 뒤에 한 번에 성공으로 기록 (중단되면 기록되지 않은 파일은 다시 변환)
+        sink.on_commit = lambda committed: manifest.record_many(committed, manifest_method)
+    try:
+        for name, (result, pages) in zip(names, iter_parallel(_collect_job, jobs, workers)):
+            if result.success:
+                sink.add(name, result, pages)
+            elif manifest is not None:
+                manifest.record(name, result, manifest_method)
+            results.append(result)
+            if progress_callback:
+                progress_callback(len(results), total, result)
+            print("-" * 50)
+    finally:
+        sink.flush()
+        sink.on_commit = on_commit
+
+def _pop_option(args, name, default=None):
+    """명령행 인자 목록에서 '--이름 값' 옵션을 꺼내고 값을 반환"""
+    if name not in args:
+        return default
+    index = args.index(name)
+    if index + 1 >= len(args):
+        print(f"오류: {name} 옵션에 값이 필요합니다.")
+        sys.exit(1)
+    value = args[index + 1]
+    del args[index:index + 2]
+    return value
+
+def _int_option(name, value, minimum=1):
+    """
+    옵션 값을 정수로 변환 (값이 없으면 None)
+    
+    Raises:
+        ValueError: 정수가 아니거나 minimum보다 작음
+    """
+    if value is None:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        raise ValueError(f"{name}는 {minimum} 이상의 정수여야 합니다: {value}")
+    return number
+
+def _pop_flag(args, name):
+    """명령행 인자 목록에서 '--이름' 플래그를 꺼내고 있었는지 반환"""
+    if name not in args:
+        return False
+    args.remove(name)
+    return True
 
 def main():
     """메인 함수 - 명령행 인터페이스"""
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    try:
+        workers = _int_option("--workers", _pop_option(args, "--workers"))
+    except ValueError as e:
+        print(f"오류: {e}")
+        return
+    cache_dir = _pop_option(args, "--cache-dir")
+    rebuild_cache = _pop_flag(args, "--rebuild-cache")
+    cache = None if _pop_flag(args, "--no-cache") else ExtractionCache(cache_dir, refresh=rebuild_cache)
+    force = _pop_flag(args, "--force")
+    use_mmap = _pop_flag(args, "--mmap")
+    pages = _pop_option(args, "--pages")
+    max_chars = _pop_option(args, "--max-chars")
+    try:
+        pages = parse_page_ranges(pages)
+        max_chars = _int_option("--max-chars", max_chars)
+    except ValueError as e:
+        print(f"오류: {e}")
+        return
+    output_format = _pop_option(args, "--format", "txt")
+    if output_format not in OUTPUT_FORMATS:
+        print(f"오류: 지원하지 않는 출력 형식입니다. 다음 중 하나를 사용하세요: {', '.join(OUTPUT_FORMATS)}")
+        return
+    ocr = OcrOptions(lang=_pop_option(args, "--ocr-lang", "kor+eng"),
+                     quality=_pop_option(args, "--ocr-quality", "고품질"),
+                     engine=_pop_option(args, "--ocr-engine", "auto"))
+    host = _pop_option(args, "--host")
+    port = _pop_option(args, "--port")
+    socket_path = _pop_option(args, "--socket")
+    ocr_stages = _pop_option(args, "--ocr-stages")
+    if ocr_stages:
+        from ocr_pipeline import parse_stage_workers
+        try:
+            ocr.stages = parse_stage_workers(ocr_stages)
+        except ValueError as e:
+            print(f"오류: {e}")
+            return
+    ocr_rules = _pop_option(args, "--ocr-rules")
+    if ocr_rules:
+        from ocr_postprocess import parse_rules
+        try:
+            ocr.postprocess = parse_rules(ocr_rules)
+        except ValueError as e:
+            print(f"오류: {e}")
+            return
+    metrics_log = _pop_option(args, "--metrics-log")
+    metrics_prom = _pop_option(args, "--metrics-prom")
+    sink_path = _pop_option(args, "--sink")
+    sink_compression = _pop_option(args, "--sink-compression", "gzip")
+    try:
+        shard_size = _int_option("--shard-size", _pop_option(args, "--shard-size"))
+    except ValueError as e:
+        print(f"오류: {e}")
+        return
+    
+    if len(args) < 1:
         print("=" * 60)
         print("               PDF to TXT 변환기")
         print("=" * 60)
         print("\n사용법:")
         print("  단일 파일 변환: python pdf_to_txt.py <PDF파일경로> [출력파일경로] [방법]")
-        print("  일괄 변환: python pdf_to_txt.py --batch <입력폴더> [출력폴더] [방법]")
+        print("  표준 입력 변환: python pdf_to_txt.py - <출력파일경로> [방법] < 문서.pdf")
+        print("  일괄 변환: python pdf_to_txt.py --batch <입력폴더> [출력폴더] [방법] [--workers N]")
         print("  GUI 실행: python pdf_to_txt.py --gui")
+        print("  변환 서버: python pdf_to_txt.py --serve [--port 8765 | --socket 경로] [--workers N]")
         print("\n방법:")
         print("  pdfplumber (기본값) - 더 정확한 텍스트 추출")
-        print("  pypdf2 - 빠른 텍스트 추출")
+        print("  auto - 설치된 방법을 페이지마다 빠른 순서로 시도")
+        for name in backend_names("text", available_only=False):
+            if name != "pdfplumber":
+                print(f"  {name} - {backend_label(name)}")
+        print("  ocr - 이미지 기반(스캔) PDF용 OCR (pytesseract, pdf2image 필요)")
+        print("  hybrid - 텍스트 레이어를 사용하고 텍스트가 없는 스캔 페이지만 OCR")
+        print("\n옵션:")
+        print("  --workers N - 일괄 변환 시 동시에 변환할 프로세스 수 (기본값: CPU 코어 수)")
+        print("  --no-cache - 추출 결과 캐시를 사용하지 않음")
+        print("  --rebuild-cache - 기존 캐시를 무시하고 다시 추출하여 캐시 갱신")
+        print("  --cache-dir 폴더 - 캐시 폴더 지정")
+        print("  --force - 일괄 변환 시 이전 변환 기록과 관계없이 모든 파일을 다시 변환")
+        print("  --mmap - PDF 파일을 메모리 맵으로 한 번 열어 추출 방법들이 함께 읽음")
+        print("  --pages 범위 - 지정한 페이지만 변환 (예: 1-10,50 또는 5-)")
+        print("  --max-chars N - 텍스트가 N자에 이르면 나머지 페이지는 추출하지 않고 멈춤")
+        print("  --format 형식 - 출력 형식: txt, jsonl (페이지마다 번호/추출 방법/신뢰도/시간/텍스트를 JSON 한 줄로)")
+        print("  --sink 경로 - 일괄 변환 결과를 파일마다 저장하지 않고 묶어서 저장:")
+        print("               폴더면 압축된 JSONL 조각 파일, .sqlite/.db 파일이면 SQLite 데이터베이스")
+        print("  --sink-compression 방식 - 조각 파일 압축: gzip, zstd, none (기본값: gzip)")
+        print("  --shard-size MB - 조각 파일 하나의 최대 크기 (기본값: 256)")
+        print("  --ocr-lang 언어 - OCR 언어 (기본값: kor+eng)")
+        print("  --ocr-quality 품질 - OCR 품질: 고품질, 표준, 빠름 (기본값: 고품질)")
+        print("  --ocr-engine 엔진 - OCR 엔진: auto, tesserocr, pytesseract (기본값: auto)")
+        print("  --ocr-rules 규칙 - OCR 결과 정리 규칙 변경: nfkc, join-hyphens, no-fix-chars, no-drop-junk")
+        print("  --ocr-stages R,P,O - OCR을 래스터화/전처리/OCR 단계별 스레드 수로 나누어 동시에 처리 (예: 1,2,4)")
+        print("  --host 주소, --port 번호 - 변환 서버 주소 (기본값: 127.0.0.1:8765)")
+        print("  --socket 경로 - 변환 서버를 TCP 대신 Unix 소켓으로 실행")
+        print("  --metrics-log 파일 - 단계별 처리 시간을 JSON 한 줄씩 기록 (JSONL)")
+        print("  --metrics-prom 파일 - 단계별 처리 시간을 Prometheus 텍스트 형식으로 기록")
         print("\n예시:")
         print("  python pdf_to_txt.py document.pdf")
         print("  python pdf_to_txt.py document.pdf output.txt pdfplumber")
         print("  python pdf_to_txt.py --batch ./pdfs ./texts")
+        print("  python pdf_to_txt.py --batch ./pdfs ./texts --workers 8")
+        print("  python pdf_to_txt.py --batch ./pdfs ./triage auto --pages 1-2 --max-chars 2000")
+        print("  python pdf_to_txt.py --batch ./pdfs ./index auto --format jsonl")
+        print("  python pdf_to_txt.py --batch ./pdfs ./state auto --sink ./shards --sink-compression zstd")
         print("  python pdf_to_txt.py --gui")
         print("\n" + "=" * 60)
         return
     
-    if sys.argv[1] == "--gui":
-        # GUI 모드 실행
+    sink = None
+    if sink_path:
+        if args[0] != "--batch":
+            print("오류: --sink는 일괄 변환(--batch)에서만 사용할 수 있습니다.")
+            return
+        from output_sink import DEFAULT_SHARD_BYTES, open_sink
         try:
-            import subprocess
-            subprocess.run(["python", "pdf_to_txt_gui.py"], check=True)
-        except ImportError:
-            print("GUI 실행을 위해 tkinter가 필요합니다.")
-        except FileNotFoundError:
-            print("pdf_to_txt_gui.py 파일을 찾을 수 없습니다.")
+            max_shard_bytes = shard_size * 1024 * 1024 if shard_size else DEFAULT_SHARD_BYTES
+            sink = open_sink(sink_path, sink_compression, max_shard_bytes)
+        except (ValueError, ImportError) as e:
+            print(f"오류: {e}")
+            return
+    
+    if metrics_log:
+        metrics.add_sink(metrics.JsonLinesSink(metrics_log))
+    if metrics_prom:
+        metrics.add_sink(metrics.PrometheusTextfileSink(metrics_prom))
+    try:
+        _run_command(args, workers, cache, force, ocr, host, port, socket_path, use_mmap, pages, max_chars,
+                     output_format, sink)
+    finally:
+        if sink is not None:
+            sink.close()
+        metrics.close_sinks()
+
+def _run_command(args, workers, cache, force, ocr, host, port, socket_path, use_mmap, pages, max_chars,
+                 output_format, sink=None):
+    if args[0] == "--serve":
+        # 변환 서버 모드 (작업자 프로세스를 띄워 두고 HTTP 요청으로 변환)
+        from pdf_to_txt_server import DEFAULT_HOST, DEFAULT_PORT, serve
+        serve(host=host or DEFAULT_HOST, port=int(port) if port else DEFAULT_PORT, socket_path=socket_path,
+              workers=workers, cache=cache, ocr_lang=ocr.lang)
+        return
+    
+    if args[0] == "--gui":
+        # GUI 모드 실행 (새 파이썬 프로세스를 띄우지 않고 이 프로세스에서 실행)
+        try:
+            import pdf_to_txt_gui
+        except ImportError as e:
+            print(f"GUI 실행을 위해 tkinter가 필요합니다: {e}")
+            return
+        pdf_to_txt_gui.main()
         return
     
-    if sys.argv[1] == "--batch":
+    if args[0] == "--batch":
         # 일괄 변환 모드
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("오류: 입력 폴더를 지정해주세요.")
             return
         
-        input_folder = sys.argv[2]
-        output_folder = sys.argv[3] if len(sys.argv) > 3 else None
-        method = sys.argv[4] if len(sys.argv) > 4 else "pdfplumber"
+        input_folder = args[1]
+        output_folder = args[2] if len(args) > 2 else None
+        method = args[3] if len(args) > 3 else "pdfplumber"
         
-        batch_convert(input_folder, output_folder, method)
+        batch_convert(input_folder, output_folder, method, workers=workers, cache=cache,
+                      incremental=not force, ocr=ocr, use_mmap=use_mmap, pages=pages, max_chars=max_chars,
+                      output_format=output_format, sink=sink)
     else:
         # 단일 파일 변환 모드
-        pdf_path = sys.argv[1]
-        output_path = sys.argv[2] if len(sys.argv) > 2 else None
-        method = sys.argv[3] if len(sys.argv) > 3 else "pdfplumber"
+        pdf_path = args[0]
+        output_path = args[1] if len(args) > 1 else None
+        method = args[2] if len(args) > 2 else "pdfplumber"
         
-        pdf_to_txt(pdf_path, output_path, method)
+        if pdf_path == "-":
+            # 표준 입력의 PDF 내용을 임시 파일 없이 메모리에서 바로 변환
+            pdf_path = sys.stdin.buffer.read()
+        pdf_to_txt(pdf_path, output_path, method, cache, ocr, use_mmap, pages, max_chars, output_format)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,197 @@
+"""
+asyncio 이벤트 루프에서 사용하는 변환 API
+
+추출 작업은 모두 별도 프로세스에서 실행되므로 이벤트 루프가 막히지 않고,
+작업자 프로세스의 출력은 버려지므로 stdout에 아무것도 출력하지 않는다.
+오류는 ConversionResult.error 또는 ExtractionError로 전달된다.
+
+    import asyncio
+    from pdf_to_txt_async import convert, convert_many, iter_pages
+    
+    async def main():
+        result = await convert("document.pdf", "document.txt")
+        
+        # 동시에 4개씩 변환 (결과는 끝난 순서대로)
+        async for result in convert_many(pdf_paths, "./texts", concurrency=4):
+            print(result.pdf_path, result.success)
+        
+        # 페이지별 텍스트 (소비가 느리면 추출도 대기)
+        async for page_text in iter_pages("document.pdf"):
+            ...
+    
+    asyncio.run(main())
+"""
+import asyncio
+import multiprocessing
+import os
+import queue as queue_module
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+import conversion_metrics as metrics
+from pdf_to_txt import ExtractionError, OcrOptions, convert_file, iter_pages as iter_sync_pages
+
+# iter_pages에서 소비되지 않은 페이지를 최대 이만큼만 미리 추출
+DEFAULT_MAX_QUEUED_PAGES = 8
+
+def _silence_output():
+    """작업자 프로세스의 print 출력을 버림"""
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+
+# 여러 호출이 함께 사용하는 작업자 프로세스 풀 (처음 사용할 때 생성)
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """출력을 버리는 공유 작업자 프로세스 풀 (CPU 코어 수만큼)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(initializer=_silence_output)
+        return _executor
+
+def shutdown_executor():
+    """공유 작업자 프로세스 풀 종료 (서비스 종료 시 호출)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
+
+async def convert(pdf_path, output_path=None, method="pdfplumber", cache=None, ocr=None, executor=None):
+    """
+    PDF 파일 하나를 작업자 프로세스에서 TXT로 변환
+    
+    Args:
+        pdf_path (str): 입력 PDF 파일 경로
+        output_path (str, optional): 출력 TXT 파일 경로. None이면 PDF와 같은 폴더
+        method (str): 추출 방법 ("pdfplumber", "pypdf2", "ocr" 또는 "hybrid" 등, pdf_to_txt.iter_pages 참고)
+        cache (ExtractionCache, optional): 추출 결과 캐시
+        ocr (OcrOptions, optional): OCR 설정
+        executor (Executor, optional): 사용할 작업자 풀. None이면 get_executor()
+    
+    Returns:
+        ConversionResult: 변환 결과
+    """
+    if output_path is None:
+        output_path = str(Path(pdf_path).with_suffix(".txt"))
+    loop = asyncio.get_running_loop()
+    if metrics.enabled():
+        # 작업자 프로세스에서 생긴 측정 이벤트를 이 프로세스의 출력 대상으로 전달
+        result, events = await loop.run_in_executor(executor or get_executor(), metrics.call_collecting,
+                                                    convert_file, pdf_path, output_path, method, cache, ocr)
+        metrics.replay(events)
+        return result
+    return await loop.run_in_executor(executor or get_executor(), convert_file,
+                                      pdf_path, output_path, method, cache, ocr)
+
+async def _aiter(items):
+    """일반 이터러블과 비동기 이터러블을 모두 비동기로 순회"""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+async def convert_many(pdf_paths, output_folder=None, method="pdfplumber", concurrency=None,
+                       cache=None, ocr=None, executor=None):
+    """
+    여러 PDF를 동시에 최대 concurrency개씩 변환하고 끝난 순서대로 결과를 반환
+    
+    pdf_paths는 필요한 만큼만 읽으므로 (비동기) 제너레이터로 수천 개의 파일을
+    넘겨도 진행 중인 작업과 결과가 메모리에 쌓이지 않는다.
+    
+    Args:
+        pdf_paths: PDF 파일 경로의 이터러블 또는 비동기 이터러블
+        output_folder (str, optional): 출력 폴더. None이면 각 PDF와 같은 폴더
+        concurrency (int, optional): 동시에 변환할 파일 수. None이면 CPU 코어 수
+        나머지 인자는 convert와 동일
+    
+    Yields:
+        ConversionResult: 파일별 변환 결과 (끝난 순서대로)
+    """
+    concurrency = concurrency or os.cpu_count() or 1
+    if output_folder:
+        os.makedirs(output_folder, exist_ok=True)
+    if method in ("ocr", "hybrid"):
+        # 동시에 변환하는 파일들이 OCR 페이지 작업자를 나누어 사용
+        ocr = replace(ocr or OcrOptions(), workers=max(1, (os.cpu_count() or 1) // concurrency))
+    
+    pending = set()
+    try:
+        async for pdf_path in _aiter(pdf_paths):
+            output_path = None
+            if output_folder:
+                output_path = os.path.join(output_folder, Path(pdf_path).stem + ".txt")
+            pending.add(asyncio.ensure_future(convert(pdf_path, output_path, method, cache, ocr, executor)))
+            # 진행 중인 작업이 가득 차면 하나가 끝날 때까지 다음 파일을 읽지 않음
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+        if cache is not None:
+            await asyncio.get_running_loop().run_in_executor(None, cache.evict)
+    finally:
+        for task in pending:
+            task.cancel()
+
+def _produce_pages(queue, pdf_path, method, ocr):
+    """별도 프로세스에서 페이지를 추출하여 큐에 넣음 (큐가 가득 차면 대기)"""
+    _silence_output()
+    try:
+        for page_text in iter_sync_pages(pdf_path, method, ocr):
+            queue.put(("page", page_text))
+    except Exception as e:
+        queue.put(("error", str(e)))
+        return
+    queue.put(("done", None))
+
+def _next_item(queue, producer):
+    """추출 프로세스가 넣은 다음 항목 (프로세스가 비정상 종료되면 오류 항목)"""
+    while True:
+        try:
+            return queue.get(timeout=0.5)
+        except queue_module.Empty:
+            if not producer.is_alive() and queue.empty():
+                return ("error", f"추출 프로세스가 비정상 종료되었습니다 (종료 코드 {producer.exitcode})")
+
+async def iter_pages(pdf_path, method="pdfplumber", ocr=None, max_queued=DEFAULT_MAX_QUEUED_PAGES):
+    """
+    페이지별 텍스트를 추출되는 대로 반환하는 비동기 이터레이터
+    
+    추출은 별도 프로세스에서 진행되고, 소비되지 않은 페이지가 max_queued개가
+    되면 추출도 멈추고 기다린다 (역압). 중간에 순회를 멈추면 추출 프로세스도 종료된다.
+    
+    Raises:
+        ExtractionError: 추출 실패
+    """
+    if not os.path.exists(pdf_path):
+        raise ExtractionError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+    context = multiprocessing.get_context()
+    queue = context.Queue(maxsize=max_queued)
+    producer = context.Process(target=_produce_pages, args=(queue, pdf_path, method, ocr))
+    producer.start()
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            # 큐 읽기는 블로킹이므로 스레드에서 실행하여 이벤트 루프를 막지 않음
+            kind, value = await loop.run_in_executor(None, _next_item, queue, producer)
+            if kind == "page":
+                yield value
+            elif kind == "error":
+                raise ExtractionError(value)
+            else:
+                break
+    finally:
+        if producer.is_alive():
+            producer.terminate()
+        await loop.run_in_executor(None, producer.join)
+        queue.close()
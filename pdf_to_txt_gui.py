@@ -2,39 +2,22 @@ import os
 import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+import itertools
 import threading
-import PyPDF2
-import pdfplumber
+import time
+from collections import deque
 from pathlib import Path
+from backends import (OCR_ENGINES, ExtractionError, backend_label, backend_names, format_page_ranges,
+                      is_available, iter_backend_pages, limit_chars, ocr_engine_name,
+                      parse_page_ranges, select_pages)
+from page_text import with_text
+from pdf_to_txt import (ConversionResult, OcrOptions, cached_pages, iter_parallel, iter_text_with_hybrid,
+                        write_pages)
+from extraction_cache import ExtractionCache
 
-try:
-    import fitz  # PyMuPDF
-    FITZ_AVAILABLE = True
-except ImportError:
-    FITZ_AVAILABLE = False
-
-try:
-    import pytesseract
-    from pdf2image import convert_from_path
-    from PIL import Image
-    from PIL import ImageEnhance, ImageFilter, ImageOps
-    
-    # Tesseract 경로 설정 (Windows의 일반적인 설치 경로들을 시도)
-    import os
-    tesseract_paths = [
-        r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-        r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-        r"C:\Users\User\AppData\Local\Tesseract-OCR\tesseract.exe"
-    ]
-    
-    for path in tesseract_paths:
-        if os.path.exists(path):
-            pytesseract.pytesseract.tesseract_cmd = path
-            break
-    
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+# 설치 여부만 확인하고, 라이브러리는 해당 추출 방법을 처음 사용할 때 불러옴
+FITZ_AVAILABLE = is_available("pymupdf")
+OCR_AVAILABLE = is_available("ocr")
 
 # from pykospacing import Spacing
 # spacing = Spacing()
@@ -42,6 +25,304 @@ except ImportError:
 def correct_korean_spacing(text):
     return text
 
+class PDFConverter:
+    """Tk 위젯과 분리된 변환기 - 작업자 프로세스로 전달할 수 있도록 설정값만 보관"""
+    # backends의 텍스트 추출 방법 외에 선택할 수 있는 방법
+    EXTRA_METHODS = ("ocr", "hybrid", "fallback")
+    
+    def __init__(self, method="pdfplumber", ocr_lang="kor+eng", ocr_quality="고품질", ocr_workers=None,
+                 cache=None, ocr_engine="auto", pages=None, max_chars=None):
+        """
+        Raises:
+            ValueError: 지원하지 않는 추출 방법이거나 페이지 범위 형식이 잘못됨
+        """
+        methods = [*backend_names("text", available_only=False), *self.EXTRA_METHODS]
+        if method not in methods:
+            raise ValueError(f"지원하지 않는 추출 방법: {method} (사용 가능: {', '.join(methods)})")
+        self.method = method
+        self.ocr_lang = ocr_lang
+        self.ocr_quality = ocr_quality
+        # OCR 엔진 (auto, tesserocr, pytesseract)
+        self.ocr_engine = ocr_engine
+        # OCR 페이지 병렬 처리 작업자 수 (None이면 CPU 코어 수)
+        self.ocr_workers = ocr_workers
+        # 추출 결과 캐시 (None이면 사용 안 함)
+        self.cache = cache
+        # 변환할 페이지 범위 (예: "1-10,50", None이면 전체)
+        self.pages = parse_page_ranges(pages)
+        # 텍스트가 이 글자 수에 이르면 나머지 페이지는 추출하지 않음 (None이면 제한 없음)
+        self.max_chars = max_chars
+    
+    def convert_file(self, pdf_path, output_path):
+        """단일 파일 변환 후 ConversionResult 반환"""
+        start_time = time.perf_counter()
+        success, text_length, error = self._convert(pdf_path, output_path)
+        return ConversionResult(pdf_path, output_path, success, text_length, error,
+                                time.perf_counter() - start_time)
+    
+    def convert_single_file(self, pdf_path, output_path):
+        """단일 파일 변환"""
+        return self.convert_file(pdf_path, output_path).success
+    
+    def _convert(self, pdf_path, output_path):
+        """단일 파일 변환 - (성공 여부, 텍스트 길이, 오류 메시지) 반환"""
+        try:
+            method = self.method
+            
+            # 텍스트 추출 방법은 문서를 한 번만 열고 페이지마다 다른 방법으로 대체하는
+            # 통합 추출기로 처리. OCR/하이브리드가 실패하면 통합 추출기로 재시도
+            if method in backend_names("text"):
+                methods_to_try = ["fallback"]
+            else:
+                methods_to_try = [method, "fallback"]
+            
+            error_msg = "알 수 없는 오류"
+            for method_name in methods_to_try:
+                if method_name != method and method_name != methods_to_try[0]:
+                    print(f"시도 중: {method_name}")
+                try:
+                    pages = self.iter_pages(method_name, pdf_path)
+                    if self.cache is not None:
+                        pages = cached_pages(self.cache, pdf_path, pages, **self.cache_settings(method_name))
+                    # 글자 수 제한은 캐시 뒤에 적용 (중간에 멈춘 추출은 캐시에 저장되지 않음)
+                    pages = limit_chars(pages, self.max_chars)
+                    
+                    # 페이지를 추출하는 대로 파일에 기록 (실패하면 출력 파일은 만들어지지 않음)
+                    text_length, has_content = write_pages(pages, output_path)
+                    if not has_content:
+                        os.remove(output_path)
+                        raise ExtractionError("추출된 텍스트가 없습니다. 이미지 기반 PDF이거나 텍스트가 없는 파일일 수 있습니다.")
+                except ExtractionError as e:
+                    error_msg = str(e)
+                except Exception as e:
+                    print(f"{method_name}로 텍스트 추출 중 오류 발생: {e}")
+                    error_msg = str(e)
+                else:
+                    if method_name != methods_to_try[0]:
+                        print(f"{method_name}로 성공!")
+                    return True, text_length, None
+                
+                if method_name == methods_to_try[0] and len(methods_to_try) > 1:
+                    print(f"첫 번째 방법({method}) 실패, 다른 방법으로 재시도: {pdf_path}")
+            
+            # 모든 방법이 실패한 경우
+            with open(output_path, 'w', encoding='utf-8') as txt_file:
+                txt_file.write(f"PDF 텍스트 추출 실패\n")
+                txt_file.write(f"파일: {pdf_path}\n")
+                txt_file.write(f"오류: {error_msg}\n")
+                txt_file.write(f"\n이 파일은 다음 중 하나일 수 있습니다:\n")
+                txt_file.write(f"- 이미지 기반 PDF (OCR 방법을 시도해보세요)\n")
+                txt_file.write(f"- 암호화된 PDF (비밀번호 필요)\n")
+                txt_file.write(f"- 손상된 PDF 파일\n")
+                txt_file.write(f"- 특수 포맷이나 복잡한 레이아웃\n")
+                txt_file.write(f"- 폰트가 임베드되지 않은 PDF\n")
+                if OCR_AVAILABLE:
+                    txt_file.write(f"\n* 이미지 기반 PDF인 경우 'OCR' 방법을 선택하여 다시 시도해보세요.\n")
+                else:
+                    txt_file.write(f"\n* OCR 기능을 사용하려면 다음 패키지를 설치하세요:\n")
+                    txt_file.write(f"  pip install pytesseract pdf2image pillow\n")
+                    txt_file.write(f"  그리고 Tesseract OCR 엔진을 설치하세요.\n")
+            return False, 0, error_msg
+        except Exception as e:
+            print(f"변환 오류: {e}")
+            # 오류 정보를 파일로 저장
+            try:
+                with open(output_path, 'w', encoding='utf-8') as txt_file:
+                    txt_file.write(f"PDF 변환 중 오류 발생\n")
+                    txt_file.write(f"파일: {pdf_path}\n")
+                    txt_file.write(f"오류: {str(e)}\n")
+            except:
+                pass
+            return False, 0, str(e)
+    
+    def cache_settings(self, method):
+        """캐시 키에 포함할 추출 설정 (OCR은 언어와 품질에 따라 결과가 달라짐)"""
+        # 일부 페이지만 추출한 결과는 페이지 범위별로 따로 저장
+        page_settings = {"page_range": format_page_ranges(self.pages)} if self.pages is not None else {}
+        if method not in ("ocr", "hybrid", "fallback"):
+            return {"method": method, **page_settings}
+        # 텍스트 추출 방법도 통합 추출기로 처리하므로, OCR 라이브러리를 불러오지 않고 엔진 이름만 확인
+        # (OCR이 설치되지 않았으면 OCR 페이지는 안내 문구가 되므로 엔진 없이 따로 저장)
+        ocr_settings = {"ocr_lang": self.ocr_lang, "ocr_quality": self.ocr_quality,
+                        "ocr_engine": ocr_engine_name(self.ocr_engine) if OCR_AVAILABLE else None,
+                        **page_settings}
+        if method == "fallback":
+            return {"method": f"fallback:{self.fallback_order()[0]}", **ocr_settings}
+        return {"method": method, **ocr_settings}
+    
+    def iter_pages(self, method, pdf_path):
+        """
+        추출 방법에 맞는 페이지별 텍스트 제너레이터 반환
+        
+        텍스트 추출 방법은 backends의 추출기를 CLI와 함께 사용한다.
+        
+        Raises:
+            ExtractionError: 지원하지 않는 추출 방법
+        """
+        if method == "ocr":
+            return self.iter_text_with_ocr(pdf_path)
+        if method == "hybrid":
+            return self.iter_text_with_hybrid(pdf_path)
+        if method == "fallback":
+            return self.iter_text_with_fallback(pdf_path)
+        if method in backend_names("text", available_only=False):
+            return self.iter_text_with_backend(method, pdf_path)
+        raise ExtractionError(f"지원하지 않는 추출 방법: {method}")
+    
+    def page_numbers(self, page_count):
+        """추출할 페이지 번호 목록 (0부터, 페이지 범위를 지정하지 않았으면 전체)"""
+        return select_pages(self.pages, page_count)
+    
+    def fallback_order(self):
+        """통합 추출기의 방법 순서 - 선택한 텍스트 추출 방법을 먼저, 나머지는 페이지당 비용이 싼 순서"""
+        order = backend_names("text")
+        if self.method in order:
+            order.remove(self.method)
+            order.insert(0, self.method)
+        return order
+    
+    def iter_text_with_fallback(self, pdf_path):
+        """
+        문서를 한 번만 열고 페이지마다 추출 방법을 바꿔 가며 텍스트를 반환하는 통합 추출기
+        
+        페이지마다 fallback_order() 순서로 시도하여 텍스트가 나오면 바로 다음 페이지로
+        넘어간다 (backends.iter_backend_pages). 모든 방법이 실패한 페이지만 OCR 처리한다.
+        OCR 페이지는 작업자 프로세스에서 처리하는 동안 다음 페이지 추출을 계속하며,
+        출력 순서는 페이지 순서를 유지한다.
+        """
+        pages = iter_backend_pages(pdf_path, self.fallback_order(), self.pages)
+        try:
+            first_page = next(pages)
+        except ExtractionError:
+            if not OCR_AVAILABLE:
+                raise
+            # 텍스트 추출 라이브러리로 열 수 없으면 OCR로 처리
+            yield from self.iter_text_with_ocr(pdf_path)
+            return
+        
+        ocr_workers = self.ocr_workers or os.cpu_count() or 1
+        ocr_renderer = "fitz" if FITZ_AVAILABLE else "pdf2image"
+        max_pending = max(ocr_workers * 2, 8)
+        executor = None
+        pending = deque()
+        submitted = []
+        try:
+            for page_num, page_count, page_text in itertools.chain([first_page], pages):
+                if page_text:
+                    pending.append(page_text + "\n")
+                elif not OCR_AVAILABLE:
+                    pending.append(f"[페이지 {page_num + 1}: 텍스트 추출 불가 - 이미지 기반일 수 있음]\n")
+                else:
+                    # OCR 라이브러리는 텍스트가 없는 페이지를 처음 만났을 때 불러옴
+                    from pdf_ocr import get_ocr_executor, ocr_page
+                    if ocr_workers <= 1:
+                        pending.append(ocr_page(pdf_path, page_num, page_count, self.ocr_lang,
+                                                self.ocr_quality, ocr_renderer, self.ocr_engine))
+                    else:
+                        if executor is None:
+                            executor = get_ocr_executor(ocr_workers)
+                        future = executor.submit(ocr_page, pdf_path, page_num, page_count,
+                                                 self.ocr_lang, self.ocr_quality, ocr_renderer, self.ocr_engine,
+                                                 workers=ocr_workers)
+                        pending.append(future)
+                        submitted.append(future)
+                
+                # 앞쪽 페이지가 끝났으면 바로 내보내고, 대기 중인 페이지가 너무 많으면 기다림
+                # (pending에는 완성된 페이지 텍스트와 OCR 중인 페이지의 Future가 섞여 있음)
+                while pending and (isinstance(pending[0], str) or pending[0].done()
+                                   or len(pending) > max_pending):
+                    item = pending.popleft()
+                    yield item if isinstance(item, str) else item.result()
+            
+            while pending:
+                item = pending.popleft()
+                yield item if isinstance(item, str) else item.result()
+        finally:
+            # 공용 OCR 프로세스 풀은 종료하지 않고, 아직 시작하지 않은 페이지만 취소
+            for future in submitted:
+                future.cancel()
+            pages.close()
+    
+    def _extract_text(self, pages, library_name):
+        """페이지 제너레이터의 결과를 하나의 문자열로 합쳐서 반환 (실패 시 '오류:' 문자열)"""
+        try:
+            text = "".join(pages)
+        except ExtractionError as e:
+            return f"오류: {e}"
+        except Exception as e:
+            print(f"{library_name}로 텍스트 추출 중 오류 발생: {e}")
+            return f"오류: {str(e)}"
+        
+        if not text.strip():
+            return "오류: 추출된 텍스트가 없습니다. 이미지 기반 PDF이거나 텍스트가 없는 파일일 수 있습니다."
+        
+        return text
+    
+    def extract_text_with_ocr(self, pdf_path):
+        """OCR을 사용하여 이미지 기반 PDF에서 텍스트 추출"""
+        return self._extract_text(self.iter_text_with_ocr(pdf_path), "OCR")
+    
+    def extract_text_with_fitz_ocr(self, pdf_path):
+        """PyMuPDF로 이미지를 추출한 후 OCR 처리"""
+        return self._extract_text(self.iter_text_with_fitz_ocr(pdf_path), "PyMuPDF OCR")
+    
+    def iter_text_with_backend(self, method, pdf_path):
+        """backends에 등록된 텍스트 추출 방법 하나로 페이지별 텍스트를 하나씩 반환 (CLI와 같은 추출기)"""
+        for page_num, _, page_text in iter_backend_pages(pdf_path, [method], self.pages):
+            if page_text.strip():
+                yield with_text(page_text, page_text + "\n")
+            else:
+                yield f"[페이지 {page_num + 1}: 텍스트 추출 불가 - 이미지 기반일 수 있음]\n"
+    
+    def iter_text_with_ocr(self, pdf_path):
+        """OCR을 사용하여 페이지별 텍스트를 하나씩 반환 (페이지 단위 병렬 처리)"""
+        if not OCR_AVAILABLE:
+            raise ExtractionError("OCR 라이브러리(pytesseract, pdf2image)가 설치되지 않았습니다.")
+        
+        from pdf_ocr import count_pages, iter_ocr_pages
+        print(f"OCR 처리 시작: {pdf_path}")
+        
+        # 방법 1: pdf2image(Poppler)로 페이지 변환
+        try:
+            page_count = count_pages(pdf_path)
+        except Exception as e:
+            print(f"pdf2image 변환 실패: {e}")
+            
+            # 방법 2: PyMuPDF로 이미지 추출 후 OCR
+            if not FITZ_AVAILABLE:
+                raise ExtractionError(f"PDF를 이미지로 변환할 수 없습니다. Poppler가 설치되지 않았을 수 있습니다.\n원본 오류: {str(e)}")
+            yield from self.iter_text_with_fitz_ocr(pdf_path)
+            return
+        
+        yield from iter_ocr_pages(pdf_path, self.ocr_lang, self.ocr_quality, self.ocr_workers,
+                                  page_numbers=self.page_numbers(page_count), engine=self.ocr_engine)
+    
+    def iter_text_with_hybrid(self, pdf_path):
+        """
+        텍스트 레이어를 사용하고, 텍스트가 없거나 너무 적은 페이지만 OCR 처리 (CLI의 hybrid와 같음)
+        
+        텍스트 페이지와 스캔 페이지가 섞인 PDF에서 스캔 페이지를 놓치지 않으면서
+        텍스트 페이지에는 OCR 비용을 들이지 않는다.
+        """
+        ocr = OcrOptions(self.ocr_lang, self.ocr_quality, self.ocr_engine, self.ocr_workers)
+        return iter_text_with_hybrid(pdf_path, ocr, self.pages)
+    
+    def iter_text_with_fitz_ocr(self, pdf_path):
+        """PyMuPDF로 이미지를 추출한 후 페이지별 OCR 결과를 하나씩 반환"""
+        if not FITZ_AVAILABLE:
+            raise ExtractionError("PyMuPDF가 설치되지 않았습니다.")
+        
+        from pdf_ocr import count_pages, iter_ocr_pages
+        page_numbers = self.page_numbers(count_pages(pdf_path, "fitz"))
+        for page_text in iter_ocr_pages(pdf_path, self.ocr_lang, self.ocr_quality, self.ocr_workers,
+                                        renderer="fitz", page_numbers=page_numbers, engine=self.ocr_engine):
+            yield correct_korean_spacing(page_text)
+
+def _convert_file_job(job):
+    """프로세스 풀 작업자에서 실행되는 변환 작업"""
+    converter, pdf_path, output_path = job
+    return converter.convert_file(pdf_path, output_path)
+
 class PDFToTxtGUI:
     def __init__(self, root):
         self.root = root
@@ -58,9 +339,15 @@ class PDFToTxtGUI:
         self.pdf_files = []
         self.output_folder = ""
         self.method = tk.StringVar(value="pdfplumber")
+        self.workers = tk.IntVar(value=os.cpu_count() or 1)
+        self.use_cache = tk.BooleanVar(value=True)
+        # 페이지 범위와 글자 수 제한 (비워 두면 전체)
+        self.pages = tk.StringVar(value="")
+        self.max_chars = tk.StringVar(value="")
         if OCR_AVAILABLE:
             self.ocr_lang = tk.StringVar(value="kor+eng")
             self.ocr_quality = tk.StringVar(value="고품질")
+            self.ocr_engine = tk.StringVar(value="auto")
         
         self.create_widgets()
         
@@ -139,23 +426,45 @@ class PDFToTxtGUI:
         ttk.Button(output_frame, text="폴더 선택", command=self.select_output_folder).grid(row=1, column=0, pady=(5, 0))
         ttk.Button(output_frame, text="기본값으로 설정", command=self.reset_output_folder).grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
         
+        # 동시 변환 프로세스 수
+        ttk.Label(output_frame, text="동시 변환 수:").grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        ttk.Spinbox(output_frame, from_=1, to=max(os.cpu_count() or 1, 1), textvariable=self.workers,
+                    width=5).grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
+        # 추출 결과 캐시 (내용이 바뀌지 않은 PDF는 다시 추출하지 않음)
+        ttk.Checkbutton(output_frame, text="추출 결과 캐시 사용 (변경되지 않은 파일은 다시 추출하지 않음)",
+                        variable=self.use_cache).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
+        # 일부 페이지만 빠르게 확인할 때 사용 (예: 분류용으로 앞 2페이지만)
+        limit_rows = [("페이지 범위:", self.pages, "예: 1-10,50 (비우면 전체)"),
+                      ("최대 글자 수:", self.max_chars, "이 글자 수에 이르면 멈춤 (비우면 제한 없음)")]
+        for row, (label, variable, hint) in enumerate(limit_rows, start=4):
+            ttk.Label(output_frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=(5, 0))
+            entry_frame = ttk.Frame(output_frame)
+            entry_frame.grid(row=row, column=1, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+            ttk.Entry(entry_frame, textvariable=variable, width=15).pack(side=tk.LEFT)
+            ttk.Label(entry_frame, text=hint, foreground="gray").pack(side=tk.LEFT, padx=(5, 0))
+        
         # 추출 방법 선택
         method_frame = ttk.LabelFrame(main_frame, text="추출 방법", padding="10")
         method_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        ttk.Radiobutton(method_frame, text="pdfplumber (권장 - 표 지원)", 
-                       variable=self.method, value="pdfplumber").grid(row=0, column=0, sticky=tk.W)
-        ttk.Radiobutton(method_frame, text="PyPDF2 (빠름)", 
-                       variable=self.method, value="pypdf2").grid(row=1, column=0, sticky=tk.W)
-        
+        # 설치된 텍스트 추출 방법 (backends에 등록된 방법, 페이지당 비용이 싼 순서)
+        text_methods = backend_names("text")
+        for row, name in enumerate(text_methods):
+            ttk.Radiobutton(method_frame, text=backend_label(name),
+                           variable=self.method, value=name).grid(row=row, column=0, sticky=tk.W)
         if FITZ_AVAILABLE:
-            ttk.Radiobutton(method_frame, text="PyMuPDF (가장 강력 - 권장)", 
-                           variable=self.method, value="pymupdf").grid(row=2, column=0, sticky=tk.W)
             self.method.set("pymupdf")  # PyMuPDF가 있으면 기본값으로 설정
+        row = len(text_methods)
+        
+        if OCR_AVAILABLE:
+            ttk.Radiobutton(method_frame, text=backend_label("ocr"), 
+                           variable=self.method, value="ocr").grid(row=row, column=0, sticky=tk.W)
         
         if OCR_AVAILABLE:
-            ttk.Radiobutton(method_frame, text="OCR (이미지 기반 PDF용 - 느림)", 
-                           variable=self.method, value="ocr").grid(row=3, column=0, sticky=tk.W)
+            ttk.Radiobutton(method_frame, text="하이브리드 (텍스트 추출 + 스캔 페이지만 OCR)", 
+                           variable=self.method, value="hybrid").grid(row=row + 1, column=0, sticky=tk.W)
             
         # OCR 설정 프레임 (별도 행에 배치)
         if OCR_AVAILABLE:
@@ -174,6 +483,12 @@ class PDFToTxtGUI:
             quality_combo['values'] = ('고품질 (느림)', '표준', '빠름')
             quality_combo.grid(row=1, column=1, padx=(5, 0), sticky=tk.W)
             
+            # OCR 엔진 (tesserocr는 언어 모델을 한 번만 읽어서 페이지마다 재사용)
+            ttk.Label(ocr_frame, text="엔진:").grid(row=2, column=0, sticky=tk.W)
+            engine_combo = ttk.Combobox(ocr_frame, textvariable=self.ocr_engine, width=15, state='readonly')
+            engine_combo['values'] = OCR_ENGINES
+            engine_combo.grid(row=2, column=1, padx=(5, 0), sticky=tk.W)
+            
             # 변환 버튼을 다음 행으로 이동
             button_row = 5
         else:
@@ -274,517 +589,101 @@ class PDFToTxtGUI:
             messagebox.showwarning("경고", "변환할 PDF 파일을 선택해주세요.")
             return
         
+        # Tk 변수는 메인 스레드에서 읽어서 변환기에 전달
+        try:
+            converter = self.create_converter()
+        except ValueError as e:
+            messagebox.showerror("오류", str(e))
+            return
+        
         # 변환 중 버튼 비활성화 및 상태 표시
         self.convert_button.config(state='disabled', text='🔄 변환 중...')
         self.status_label.config(text="변환을 시작합니다...")
         
-        # 별도 스레드에서 변환 실행
-        threading.Thread(target=self.convert_files, daemon=True).start()
-    
-    def convert_files(self):
-        """파일 변환 실행"""
-        total_files = len(self.pdf_files)
-        self.progress.config(maximum=total_files)
-        success_count = 0
-        
-        for i, pdf_path in enumerate(self.pdf_files):
-            # 상태 업데이트
-            filename = os.path.basename(pdf_path)
-            self.root.after(0, lambda f=filename: self.status_label.config(text=f"변환 중: {f}"))
-            
-            # 출력 파일 경로 결정
-            if self.output_folder:
-                output_path = os.path.join(self.output_folder, Path(pdf_path).stem + ".txt")
-            else:
-                output_path = os.path.join(os.path.dirname(pdf_path), Path(pdf_path).stem + ".txt")
-            
-            # 변환 실행
-            if self.convert_single_file(pdf_path, output_path):
-                success_count += 1
-            
-            # 진행률 업데이트
-            self.root.after(0, lambda v=i+1: self.progress.config(value=v))
+        try:
+            workers = max(1, self.workers.get())
+        except tk.TclError:
+            workers = 1
         
-        # 완료 메시지
-        self.root.after(0, lambda: self.conversion_complete(success_count, total_files))
+        # 별도 스레드에서 변환 실행
+        threading.Thread(target=self.convert_files, args=(converter, workers), daemon=True).start()
     
-    def convert_single_file(self, pdf_path, output_path):
-        """단일 파일 변환"""
+    def create_converter(self):
+        """
+        현재 GUI 설정으로 변환기 생성
+        
+        Raises:
+            ValueError: 페이지 범위나 최대 글자 수 형식이 잘못됨
+        """
+        cache = ExtractionCache() if self.use_cache.get() else None
+        pages = self.pages.get().strip() or None
+        max_chars = self.max_chars.get().strip()
         try:
-            method = self.method.get()
-            
-            if method == "pymupdf":
-                extracted_text = self.extract_text_with_pymupdf(pdf_path)
-            elif method == "pdfplumber":
-                extracted_text = self.extract_text_with_pdfplumber(pdf_path)
-            elif method == "ocr":
-                extracted_text = self.extract_text_with_ocr(pdf_path)
-            else:
-                extracted_text = self.extract_text_with_pypdf2(pdf_path)
-            
-            # 텍스트 추출 실패 시 다른 방법들을 순차적으로 시도
-            if extracted_text is None or extracted_text.startswith("오류:"):
-                print(f"첫 번째 방법({method}) 실패, 다른 방법으로 재시도: {pdf_path}")
-                
-                # 모든 방법을 시도해보기
-                methods_to_try = []
-                if method != "pymupdf" and FITZ_AVAILABLE:
-                    methods_to_try.append(("pymupdf", self.extract_text_with_pymupdf))
-                if method != "pdfplumber":
-                    methods_to_try.append(("pdfplumber", self.extract_text_with_pdfplumber))
-                if method != "pypdf2":
-                    methods_to_try.append(("pypdf2", self.extract_text_with_pypdf2))
-                if method != "ocr" and OCR_AVAILABLE:
-                    methods_to_try.append(("ocr", self.extract_text_with_ocr))
-                
-                for method_name, extract_func in methods_to_try:
-                    print(f"시도 중: {method_name}")
-                    extracted_text = extract_func(pdf_path)
-                    if extracted_text and not extracted_text.startswith("오류:"):
-                        print(f"{method_name}로 성공!")
-                        break
-            
-            # 여전히 실패한 경우
-            if extracted_text is None or extracted_text.startswith("오류:"):
-                error_msg = extracted_text if extracted_text else "알 수 없는 오류"
-                with open(output_path, 'w', encoding='utf-8') as txt_file:
-                    txt_file.write(f"PDF 텍스트 추출 실패\n")
-                    txt_file.write(f"파일: {pdf_path}\n")
-                    txt_file.write(f"오류: {error_msg}\n")
-                    txt_file.write(f"\n이 파일은 다음 중 하나일 수 있습니다:\n")
-                    txt_file.write(f"- 이미지 기반 PDF (OCR 방법을 시도해보세요)\n")
-                    txt_file.write(f"- 암호화된 PDF (비밀번호 필요)\n")
-                    txt_file.write(f"- 손상된 PDF 파일\n")
-                    txt_file.write(f"- 특수 포맷이나 복잡한 레이아웃\n")
-                    txt_file.write(f"- 폰트가 임베드되지 않은 PDF\n")
-                    if OCR_AVAILABLE:
-                        txt_file.write(f"\n* 이미지 기반 PDF인 경우 'OCR' 방법을 선택하여 다시 시도해보세요.\n")
-                    else:
-                        txt_file.write(f"\n* OCR 기능을 사용하려면 다음 패키지를 설치하세요:\n")
-                        txt_file.write(f"  pip install pytesseract pdf2image pillow\n")
-                        txt_file.write(f"  그리고 Tesseract OCR 엔진을 설치하세요.\n")
-                return False
-            
-            # 성공적으로 텍스트를 추출한 경우
-            with open(output_path, 'w', encoding='utf-8') as txt_file:
-                txt_file.write(extracted_text)
-            
-            return True
-        except Exception as e:
-            print(f"변환 오류: {e}")
-            # 오류 정보를 파일로 저장
-            try:
-                with open(output_path, 'w', encoding='utf-8') as txt_file:
-                    txt_file.write(f"PDF 변환 중 오류 발생\n")
-                    txt_file.write(f"파일: {pdf_path}\n")
-                    txt_file.write(f"오류: {str(e)}\n")
-            except:
-                pass
-            return False
+            max_chars = int(max_chars) if max_chars else None
+        except ValueError:
+            raise ValueError(f"최대 글자 수는 숫자여야 합니다: {max_chars}") from None
+        if max_chars is not None and max_chars < 1:
+            raise ValueError(f"최대 글자 수는 양수여야 합니다: {max_chars}")
+        if OCR_AVAILABLE:
+            return PDFConverter(self.method.get(), self.ocr_lang.get(), self.ocr_quality.get(), cache=cache,
+                                ocr_engine=self.ocr_engine.get(), pages=pages, max_chars=max_chars)
+        return PDFConverter(self.method.get(), cache=cache, pages=pages, max_chars=max_chars)
     
-    def extract_text_with_pypdf2(self, pdf_path):
-        """PyPDF2를 사용하여 PDF에서 텍스트 추출"""
-        text = ""
-        try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # 암호화 체크
-                if pdf_reader.is_encrypted:
-                    print(f"암호화된 PDF 파일입니다: {pdf_path}")
-                    return "오류: 암호화된 PDF 파일입니다. 비밀번호가 필요합니다."
-                
-                # 페이지 수 체크
-                if len(pdf_reader.pages) == 0:
-                    print(f"페이지가 없는 PDF 파일입니다: {pdf_path}")
-                    return "오류: 페이지가 없는 PDF 파일입니다."
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text.strip():  # 빈 텍스트가 아닌 경우만 추가
-                        text += page_text + "\n"
-                    else:
-                        text += f"[페이지 {page_num + 1}: 텍스트 추출 불가 - 이미지 기반일 수 있음]\n"
-                        
-        except Exception as e:
-            print(f"PyPDF2로 텍스트 추출 중 오류 발생: {e}")
-            return f"오류: {str(e)}"
-        
-        if not text.strip():
-            return "오류: 추출된 텍스트가 없습니다. 이미지 기반 PDF이거나 텍스트가 없는 파일일 수 있습니다."
-        
-        return text
-
-    def extract_text_with_pdfplumber(self, pdf_path):
-        """pdfplumber를 사용하여 PDF에서 텍스트 추출"""
-        text = ""
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # 페이지 수 체크
-                if len(pdf.pages) == 0:
-                    return "오류: 페이지가 없는 PDF 파일입니다."
-                
-                for page_num, page in enumerate(pdf.pages):
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text += page_text + "\n"
-                    else:
-                        # 표나 다른 요소 추출 시도
-                        tables = page.extract_tables()
-                        if tables:
-                            for table in tables:
-                                for row in table:
-                                    if row:
-                                        text += " ".join([cell if cell else "" for cell in row]) + "\n"
-                        else:
-                            text += f"[페이지 {page_num + 1}: 텍스트 추출 불가 - 이미지 기반일 수 있음]\n"
-                            
-        except Exception as e:
-            print(f"pdfplumber로 텍스트 추출 중 오류 발생: {e}")
-            return f"오류: {str(e)}"
-        
-        if not text.strip():
-            return "오류: 추출된 텍스트가 없습니다. 이미지 기반 PDF이거나 텍스트가 없는 파일일 수 있습니다."
-        
-        return text
+    def get_output_path(self, pdf_path):
+        """출력 파일 경로 결정"""
+        if self.output_folder:
+            return os.path.join(self.output_folder, Path(pdf_path).stem + ".txt")
+        return os.path.join(os.path.dirname(pdf_path), Path(pdf_path).stem + ".txt")
     
-    def extract_text_with_pymupdf(self, pdf_path):
-        """PyMuPDF(fitz)를 사용하여 PDF에서 텍스트 추출 - 가장 강력한 방법"""
-        if not FITZ_AVAILABLE:
-            return "오류: PyMuPDF가 설치되지 않았습니다."
-        
-        text = ""
-        try:
-            doc = fitz.open(pdf_path)
-            
-            # 암호화 체크
-            if doc.needs_pass:
-                doc.close()
-                return "오류: 암호화된 PDF 파일입니다. 비밀번호가 필요합니다."
-            
-            # 페이지 수 체크
-            if doc.page_count == 0:
-                doc.close()
-                return "오류: 페이지가 없는 PDF 파일입니다."
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                page_text = page.get_text()
-                
-                if page_text.strip():
-                    text += page_text + "\n"
-                else:
-                    # 이미지에서 텍스트 추출 시도 (OCR 없이)
-                    blocks = page.get_text("dict")
-                    if blocks.get("blocks"):
-                        text += f"[페이지 {page_num + 1}: 구조화된 내용 감지됨]\n"
-                        for block in blocks["blocks"]:
-                            if "lines" in block:
-                                for line in block["lines"]:
-                                    for span in line["spans"]:
-                                        if span.get("text", "").strip():
-                                            text += span["text"] + " "
-                                text += "\n"
-                    else:
-                        text += f"[페이지 {page_num + 1}: 텍스트 추출 불가 - 이미지 기반일 수 있음]\n"
-            
-            doc.close()
-            
-        except Exception as e:
-            print(f"PyMuPDF로 텍스트 추출 중 오류 발생: {e}")
-            return f"오류: {str(e)}"
+    def convert_files(self, converter, workers=1):
+        """파일 변환 실행"""
+        total_files = len(self.pdf_files)
+        self.root.after(0, lambda: self.progress.config(maximum=total_files))
         
-        if not text.strip():
-            return "오류: 추출된 텍스트가 없습니다. 이미지 기반 PDF이거나 텍스트가 없는 파일일 수 있습니다."
+        # 파일 단위 병렬 처리 후 남는 코어는 각 파일의 OCR 페이지 병렬 처리에 배분
+        file_workers = min(workers, total_files)
+        converter.ocr_workers = max(1, workers // file_workers)
         
-        return text
-    
-    def extract_text_with_ocr(self, pdf_path):
-        """OCR을 사용하여 이미지 기반 PDF에서 텍스트 추출"""
-        if not OCR_AVAILABLE:
-            return "오류: OCR 라이브러리(pytesseract, pdf2image)가 설치되지 않았습니다."
+        jobs = [(converter, pdf_path, self.get_output_path(pdf_path)) for pdf_path in self.pdf_files]
         
-        text = ""
+        # 결과는 입력 순서대로 도착하므로 진행률도 순서대로 갱신됨
+        results = []
         try:
-            # PDF를 이미지로 변환 (여러 방법 시도)
-            print(f"OCR 처리 시작: {pdf_path}")
-            
-            # 방법 1: 기본 설정으로 시도
-            images = None
-            try:
-                images = convert_from_path(pdf_path, dpi=300, fmt='jpeg')
-            except Exception as e1:
-                print(f"방법 1 실패: {e1}")
-                
-                # 방법 2: 낮은 DPI로 시도
-                try:
-                    images = convert_from_path(pdf_path, dpi=200)
-                except Exception as e2:
-                    print(f"방법 2 실패: {e2}")
-                    
-                    # 방법 3: PyMuPDF로 이미지 추출 후 OCR
-                    try:
-                        if FITZ_AVAILABLE:
-                            return self.extract_text_with_fitz_ocr(pdf_path)
-                        else:
-                            return f"오류: PDF를 이미지로 변환할 수 없습니다. Poppler가 설치되지 않았을 수 있습니다.\n원본 오류: {str(e1)}"
-                    except Exception as e3:
-                        return f"오류: 모든 OCR 방법이 실패했습니다.\n오류들: {str(e1)}, {str(e2)}, {str(e3)}"
-            
-            if not images:
-                return "오류: PDF를 이미지로 변환할 수 없습니다."
-            
-            # 언어 설정 가져오기
-            lang = self.ocr_lang.get() if hasattr(self, 'ocr_lang') else 'kor+eng'
-            quality = self.ocr_quality.get() if hasattr(self, 'ocr_quality') else '고품질'
-            
-            for page_num, image in enumerate(images):
-                print(f"OCR 처리 중: 페이지 {page_num + 1}/{len(images)}")
-                
-                # 품질 설정에 따른 이미지 전처리
-                if quality.startswith('고품질'):
-                    # 고품질: 최대한 정확한 OCR
-                    image = image.convert('L')  # 그레이스케일 변환
-                    
-                    # 이미지 크기 조정 (너무 작으면 확대)
-                    width, height = image.size
-                    if width < 2000:  # 더 높은 해상도로 확대
-                        scale_factor = 2000 / width
-                        new_width = int(width * scale_factor)
-                        new_height = int(height * scale_factor)
-                        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # 이미지 품질 향상
-                    try:
-                        from PIL import ImageEnhance, ImageFilter
-                        
-                        # 대비 향상
-                        enhancer = ImageEnhance.Contrast(image)
-                        image = enhancer.enhance(1.5)  # 대비를 더 강하게
-                        
-                        # 선명도 향상
-                        enhancer = ImageEnhance.Sharpness(image)
-                        image = enhancer.enhance(1.3)  # 선명도를 더 강하게
-                        
-                        # 밝기 조정
-                        enhancer = ImageEnhance.Brightness(image)
-                        image = enhancer.enhance(1.1)  # 약간 밝게
-                    except ImportError:
-                        pass  # PIL의 ImageEnhance가 없으면 건너뛰기
-                        
-                elif quality == '표준':
-                    # 표준: 균형잡힌 처리
-                    image = image.convert('L')  # 그레이스케일 변환
-                    
-                    width, height = image.size
-                    if width < 1500:  # 표준 해상도로 확대
-                        scale_factor = 1500 / width
-                        new_width = int(width * scale_factor)
-                        new_height = int(height * scale_factor)
-                        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    try:
-                        from PIL import ImageEnhance
-                        enhancer = ImageEnhance.Contrast(image)
-                        image = enhancer.enhance(1.2)
-                        enhancer = ImageEnhance.Sharpness(image)
-                        image = enhancer.enhance(1.1)
-                    except ImportError:
-                        pass
-                        
-                else:  # 빠름
-                    # 빠름: 최소한의 처리
-                    image = image.convert('L')  # 그레이스케일 변환만
-                
-                # Tesseract OCR 설정을 품질에 따라 조정
-                if quality.startswith('고품질'):
-                    ocr_configs = [
-                        '--psm 6 -c preserve_interword_spaces=1 -c textord_really_old_xheight=1',  # 단일 텍스트 블록
-                        '--psm 4 -c preserve_interword_spaces=1 -c textord_really_old_xheight=1',  # 단일 열, 공백 보존
-                        '--psm 1 -c preserve_interword_spaces=1',  # 자동 페이지 분할
-                        '--psm 3 -c textord_really_old_xheight=1',  # 완전 자동
-                        '--psm 8 -c preserve_interword_spaces=1',  # 단일 단어
-                    ]
-                elif quality == '표준':
-                    ocr_configs = [
-                        '--psm 6 -c preserve_interword_spaces=1',  # 단일 텍스트 블록
-                        '--psm 4 -c preserve_interword_spaces=1',  # 단일 열
-                        '--psm 3',  # 완전 자동
-                    ]
-                else:  # 빠름
-                    ocr_configs = [
-                        '--psm 6',  # 단일 텍스트 블록만
-                    ]
-                
-                page_text = ""
-                for config in ocr_configs:
-                    try:
-                        page_text = pytesseract.image_to_string(image, lang=lang, config=config)
-                        if page_text.strip():
-                            break
-                    except Exception as e:
-                        print(f"OCR 설정 {config} 실패: {e}")
-                        continue
-                
-                if page_text.strip():
-                    # 텍스트 후처리 - 불필요한 공백 제거 및 정리
-                    lines = page_text.strip().split('\n')
-                    cleaned_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        # 너무 짧거나 특수 문자만 있는 라인 제거
-                        if line and len(line) > 1 and not line.replace(' ', '').replace('.', '').replace('_', '').replace('-', '') == '':
-                            # 일반적인 OCR 오류 패턴 수정
-                            line = line.replace('|', 'I')  # 세로선을 I로
-                            line = line.replace('０', '0')  # 전각 숫자를 반각으로
-                            line = line.replace('１', '1')
-                            line = line.replace('２', '2')
-                            line = line.replace('３', '3')
-                            line = line.replace('４', '4')
-                            line = line.replace('５', '5')
-                            line = line.replace('６', '6')
-                            line = line.replace('７', '7')
-                            line = line.replace('８', '8')
-                            line = line.replace('９', '9')
-                            cleaned_lines.append(line)
-                    
-                    if cleaned_lines:
-                        text += f"[페이지 {page_num + 1}]\n"
-                        text += '\n'.join(cleaned_lines) + "\n\n"
-                    else:
-                        text += f"[페이지 {page_num + 1}: OCR로 텍스트를 추출할 수 없음]\n\n"
-                else:
-                    text += f"[페이지 {page_num + 1}: OCR로 텍스트를 추출할 수 없음]\n\n"
+            for result in iter_parallel(_convert_file_job, jobs, workers):
+                results.append(result)
+                done = len(results)
+                status = f"변환 중 ({done}/{total_files}) - 완료: {os.path.basename(result.pdf_path)}"
+                self.root.after(0, lambda v=done, t=status: (self.progress.config(value=v),
+                                                             self.status_label.config(text=t)))
             
+            if converter.cache is not None:
+                converter.cache.evict()
         except Exception as e:
-            print(f"OCR로 텍스트 추출 중 오류 발생: {e}")
-            return f"오류: OCR 처리 실패 - {str(e)}"
-        
-        if not text.strip():
-            return "오류: OCR로 추출된 텍스트가 없습니다. 이미지 품질이 낮거나 텍스트가 없는 파일일 수 있습니다."
-        
-        return text
+            # 작업자 프로세스가 죽거나(BrokenProcessPool) 작업을 전달할 수 없으면 변환을 중단
+            message = f"변환 중 오류가 발생하여 중단했습니다 ({len(results)}/{total_files} 완료): {e}"
+            print(message)
+            self.root.after(0, lambda: (self.status_label.config(text=f"❌ {message}"),
+                                        messagebox.showerror("오류", message)))
+        else:
+            # 완료 메시지
+            success_count = sum(1 for result in results if result.success)
+            self.root.after(0, lambda: self.conversion_complete(success_count, total_files))
+        finally:
+            # 어떤 경우에도 변환 버튼은 다시 사용할 수 있게 함
+            self.root.after(0, self.reset_convert_button)
     
-    def extract_text_with_fitz_ocr(self, pdf_path):
-        """PyMuPDF로 이미지를 추출한 후 OCR 처리"""
-        if not FITZ_AVAILABLE:
-            return "오류: PyMuPDF가 설치되지 않았습니다."
-        
-        text = ""
-        try:
-            import fitz
-            doc = fitz.open(pdf_path)
-            
-            # 언어 설정 가져오기
-            lang = self.ocr_lang.get() if hasattr(self, 'ocr_lang') else 'kor+eng'
-            quality = self.ocr_quality.get() if hasattr(self, 'ocr_quality') else '고품질'
-            
-            for page_num in range(doc.page_count):
-                print(f"PyMuPDF OCR 처리 중: 페이지 {page_num + 1}/{doc.page_count}")
-                page = doc[page_num]
-                
-                # 페이지를 고해상도 이미지로 변환 (3x 확대로 품질 향상)
-                mat = fitz.Matrix(3.0, 3.0)  # 3x 확대로 더 좋은 품질
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("png")
-                
-                # PIL Image로 변환
-                from io import BytesIO
-                image = Image.open(BytesIO(img_data))
-                
-                # 이미지 전처리
-                # 1. 그레이스케일 변환
-                image = image.convert('L')
-                
-                # 2. 이미지 개선 (선명도 향상)
-                from PIL import ImageEnhance, ImageFilter
-                
-                # 대비 향상
-                enhancer = ImageEnhance.Contrast(image)
-                image = enhancer.enhance(1.5)  # 대비를 더 강하게
-                
-                # 선명도 향상
-                enhancer = ImageEnhance.Sharpness(image)
-                image = enhancer.enhance(1.3)  # 선명도를 더 강하게
-                
-                # 밝기 조정
-                enhancer = ImageEnhance.Brightness(image)
-                image = enhancer.enhance(1.1)  # 약간 밝게
-                
-                # OCR 처리 - 품질에 따른 설정
-                page_text = ""
-                if quality.startswith('고품질'):
-                    ocr_configs = [
-                        '--psm 6 -c preserve_interword_spaces=1 -c textord_really_old_xheight=1',  # 단일 텍스트 블록
-                        '--psm 4 -c preserve_interword_spaces=1 -c textord_really_old_xheight=1',  # 단일 열, 공백 보존
-                        '--psm 1 -c preserve_interword_spaces=1',  # 자동 페이지 분할
-                        '--psm 3 -c textord_really_old_xheight=1',  # 완전 자동
-                        '--psm 8 -c preserve_interword_spaces=1',  # 단일 단어
-                    ]
-                elif quality == '표준':
-                    ocr_configs = [
-                        '--psm 6 -c preserve_interword_spaces=1',  # 단일 텍스트 블록
-                        '--psm 4 -c preserve_interword_spaces=1',  # 단일 열
-                        '--psm 3',  # 완전 자동
-                    ]
-                else:  # 빠름
-                    ocr_configs = [
-                        '--psm 6',  # 단일 텍스트 블록만
-                    ]
-                
-                for config in ocr_configs:
-                    try:
-                        page_text = pytesseract.image_to_string(image, lang=lang, config=config)
-                        if page_text.strip():
-                            break
-                    except Exception as e:
-                        print(f"OCR 설정 {config} 실패: {e}")
-                        continue
-                
-                if page_text.strip():
-                    # 텍스트 후처리 - 불필요한 공백 제거 및 정리
-                    lines = page_text.strip().split('\n')
-                    cleaned_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        # 너무 짧거나 특수 문자만 있는 라인 제거
-                        if line and len(line) > 1 and not line.replace(' ', '').replace('.', '').replace('_', '').replace('-', '') == '':
-                            # 일반적인 OCR 오류 패턴 수정
-                            line = line.replace('|', 'I')  # 세로선을 I로
-                            line = line.replace('０', '0')  # 전각 숫자를 반각으로
-                            line = line.replace('１', '1')
-                            line = line.replace('２', '2')
-                            line = line.replace('３', '3')
-                            line = line.replace('４', '4')
-                            line = line.replace('５', '5')
-                            line = line.replace('６', '6')
-                            line = line.replace('７', '7')
-                            line = line.replace('８', '8')
-                            line = line.replace('９', '9')
-                            cleaned_lines.append(line)
-                    
-                    if cleaned_lines:
-                        text += f"[페이지 {page_num + 1}]\n"
-                        text += '\n'.join(cleaned_lines) + "\n\n"
-                    else:
-                        text += f"[페이지 {page_num + 1}: OCR로 텍스트를 추출할 수 없음]\n\n"
-                else:
-                    text += f"[페이지 {page_num + 1}: OCR로 텍스트를 추출할 수 없음]\n\n"
-            
-            doc.close()
-            
-        except Exception as e:
-            print(f"PyMuPDF OCR로 텍스트 추출 중 오류 발생: {e}")
-            return f"오류: PyMuPDF OCR 처리 실패 - {str(e)}"
-        
-        text = correct_korean_spacing(text)
-        return text
+    def convert_single_file(self, pdf_path, output_path):
+        """단일 파일 변환"""
+        return self.create_converter().convert_single_file(pdf_path, output_path)
     
-    def conversion_complete(self, success_count, total_files):
-        """변환 완료 처리"""
+    def reset_convert_button(self):
+        """변환 버튼과 진행률 표시를 변환 전 상태로 되돌림"""
         self.convert_button.config(state='normal', text='🚀 변환 시작')
         self.progress.config(value=0)
+    
+    def conversion_complete(self, success_count, total_files):
+        """변환 완료 처리"""
+        self.reset_convert_button()
         
         if success_count == total_files:
             self.status_label.config(text=f"✅ 모든 변환 완료! ({success_count}/{total_files})")
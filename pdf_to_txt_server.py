@@ -0,0 +1,235 @@
+"""
+로컬 변환 서버 (python pdf_to_txt.py --serve)
+
+PDF 라이브러리와 OCR 모델을 미리 불러 둔 작업자 프로세스를 띄워 두고 HTTP 요청으로
+변환하므로, 요청마다 파이썬 실행과 라이브러리 import 시간이 들지 않는다.
+TCP 포트 대신 Unix 소켓(--socket)으로도 열 수 있다.
+
+    POST /convert?method=pdfplumber&format=text   본문: PDF 파일 내용
+        format=text   (기본값) 전체 텍스트 (text/plain)
+        format=ndjson 페이지마다 {"type": "page", "page": 번호, "backend": 추출 방법, "confidence": OCR 신뢰도,
+                      "chars": 글자 수, "seconds": 처리 시간, "cached": 캐시 여부, "text": 텍스트}
+                      한 줄 (application/x-ndjson)
+        ocr_lang, ocr_quality, ocr_engine  OCR 설정 (method=ocr일 때)
+        pages=1-10,50  지정한 페이지만 변환
+        max_chars=N    텍스트가 N자에 이르면 나머지 페이지는 추출하지 않음
+    GET /health
+        {"status": "ok", "workers": 작업자 수}
+    
+    curl --data-binary @document.pdf "http://127.0.0.1:8765/convert?format=ndjson"
+    curl --unix-socket /tmp/pdf_to_txt.sock --data-binary @document.pdf http://localhost/convert
+"""
+import json
+import os
+import signal
+import socketserver
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import conversion_metrics as metrics
+from backends import backend_names, check_max_chars, limit_chars, load_backend, parse_page_ranges
+from page_text import page_record
+from pdf_source import PdfSource
+from pdf_to_txt import ExtractionError, OcrOptions, cache_settings, cached_pages, iter_pages
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 요청 본문(PDF) 최대 크기 (200MB)
+MAX_UPLOAD_BYTES = 200 * 1024 * 1024
+
+def _warm_up_worker(ocr_lang):
+    """
+    작업자 프로세스 시작 시 라이브러리와 OCR 모델을 미리 불러 둠
+    
+    추출 라이브러리는 처음 사용할 때 불려 오므로, 설치된 텍스트 추출 방법을 모두 여기서
+    불러 두어 작업자의 첫 요청이 import 시간을 치르지 않게 한다.
+    출력은 버린다 (요청 처리 중 print가 서버 로그에 섞이지 않도록).
+    """
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    for name in backend_names("text"):
+        try:
+            load_backend(name)
+        except ImportError:
+            # 설치가 깨진 라이브러리는 요청 때 오류로 알려줌
+            pass
+    import pdf_ocr
+    if pdf_ocr.OCR_AVAILABLE and pdf_ocr.TESSEROCR_AVAILABLE:
+        try:
+            pdf_ocr._get_tesserocr_api(ocr_lang)
+        except Exception:
+            # 언어 데이터가 없으면 요청 때 오류로 알려줌
+            pass
+
+def _ping(_):
+    return os.getpid()
+
+def _convert_bytes_job(pdf_bytes, method, ocr, cache, pages=None, max_chars=None):
+    """
+    작업자 프로세스에서 PDF 내용을 페이지별 텍스트 목록으로 변환
+    
+    받은 내용을 임시 파일에 쓰지 않고 추출 방법들이 메모리에서 바로 읽는다
+    (파일 경로만 받는 pdftotext, OCR일 때만 임시 파일 사용).
+    """
+    source = PdfSource(buffer=pdf_bytes, name="<upload>")
+    text_pages = iter_pages(source, method, ocr, pages)
+    if cache is not None:
+        text_pages = cached_pages(cache, source, text_pages, **cache_settings(method, ocr, pages))
+    return list(limit_chars(text_pages, max_chars))
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """변환 요청 처리 (server.executor, server.cache 사용)"""
+    server_version = "pdf_to_txt"
+    
+    def address_string(self):
+        # Unix 소켓은 클라이언트 주소가 없음
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+    
+    def do_GET(self):
+        if urlparse(self.path).path != "/health":
+            self._send_error(404, "없는 경로입니다")
+            return
+        self._send(200, "application/json", json.dumps({"status": "ok", "workers": self.server.workers}))
+    
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/convert":
+            self._send_error(404, "없는 경로입니다")
+            return
+        
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        method = query.get("method", "pdfplumber")
+        output_format = query.get("format", "text")
+        if output_format not in ("text", "ndjson"):
+            self._send_error(400, f"지원하지 않는 출력 형식: {output_format}")
+            return
+        try:
+            pages = parse_page_ranges(query.get("pages"))
+            max_chars = query.get("max_chars")
+            if max_chars is not None:
+                if not max_chars.lstrip("-").isdigit():
+                    raise ValueError(f"max_chars는 정수여야 합니다: {max_chars}")
+                max_chars = int(max_chars)
+                check_max_chars(max_chars)
+        except ValueError as e:
+            self._send_error(400, str(e))
+            return
+        
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_error(400, "요청 본문에 PDF 파일 내용이 없습니다")
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_error(413, "PDF 파일이 너무 큽니다")
+            return
+        pdf_bytes = self.rfile.read(length)
+        
+        ocr = OcrOptions(lang=query.get("ocr_lang", self.server.ocr_lang),
+                         quality=query.get("ocr_quality", "고품질"),
+                         engine=query.get("ocr_engine", "auto"),
+                         workers=1)  # 요청 간 병렬 처리는 작업자 풀이 담당
+        start_time = time.perf_counter()
+        try:
+            if metrics.enabled():
+                # 작업자 프로세스에서 생긴 측정 이벤트를 서버의 출력 대상으로 전달
+                text_pages, events = self.server.executor.submit(metrics.call_collecting, _convert_bytes_job,
+                                                                 pdf_bytes, method, ocr, self.server.cache,
+                                                                 pages, max_chars).result()
+                metrics.replay(events)
+            else:
+                text_pages = self.server.executor.submit(_convert_bytes_job, pdf_bytes, method, ocr,
+                                                         self.server.cache, pages, max_chars).result()
+        except ExtractionError as e:
+            self._record_request(method, start_time, len(pdf_bytes), error=str(e))
+            self._send_error(400, str(e))
+            return
+        except Exception as e:
+            self._record_request(method, start_time, len(pdf_bytes), error=str(e))
+            self._send_error(422, f"텍스트 추출 중 오류 발생: {e}")
+            return
+        elapsed = time.perf_counter() - start_time
+        self._record_request(method, start_time, len(pdf_bytes), chars=sum(map(len, text_pages)))
+        
+        headers = {"X-Page-Count": str(len(text_pages)), "X-Elapsed": f"{elapsed:.3f}"}
+        if output_format == "ndjson":
+            body = "".join(json.dumps(page_record(page_text, index + 1), ensure_ascii=False) + "\n"
+                           for index, page_text in enumerate(text_pages))
+            self._send(200, "application/x-ndjson", body, headers)
+        else:
+            self._send(200, "text/plain", "".join(text_pages), headers)
+    
+    def _record_request(self, method, start_time, size, chars=0, error=None):
+        """요청 하나를 변환 파일 하나로 측정 이벤트에 기록"""
+        if metrics.enabled():
+            metrics.record("file", time.perf_counter() - start_time, file="<upload>", method=method,
+                           success=error is None, chars=chars, bytes=size, error=error)
+    
+    def _send(self, status, content_type, body, headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _send_error(self, status, message):
+        self._send(status, "application/json", json.dumps({"error": message}, ensure_ascii=False))
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix 소켓으로 요청을 받는 HTTP 서버"""
+    daemon_threads = True
+
+def _stop_on_signal(signum, frame):
+    raise KeyboardInterrupt
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, workers=None, cache=None,
+          ocr_lang="kor+eng"):
+    """
+    변환 서버 실행 (Ctrl+C로 종료할 때까지 반환하지 않음)
+    
+    Args:
+        host (str): 접속을 받을 주소 (기본값: 이 컴퓨터에서만 접속 가능)
+        port (int): 포트 번호
+        socket_path (str, optional): 지정하면 TCP 대신 이 경로의 Unix 소켓 사용
+        workers (int, optional): 작업자 프로세스 수. None이면 CPU 코어 수
+        cache (ExtractionCache, optional): 추출 결과 캐시
+        ocr_lang (str): 작업자 시작 시 미리 불러 둘 OCR 언어
+    """
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_up_worker, initargs=(ocr_lang,))
+    # 작업자를 미리 모두 띄워 두어 첫 요청부터 준비된 작업자가 처리하도록 함
+    list(executor.map(_ping, range(workers)))
+    
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, ConversionHandler)
+        address = socket_path
+    else:
+        server = ThreadingHTTPServer((host, port), ConversionHandler)
+        address = f"http://{host}:{port}"
+    server.executor = executor
+    server.cache = cache
+    server.workers = workers
+    server.ocr_lang = ocr_lang
+    
+    # 서비스 관리자가 보내는 종료 신호(SIGTERM)도 Ctrl+C처럼 정리 후 종료
+    signal.signal(signal.SIGTERM, _stop_on_signal)
+    print(f"변환 서버 시작: {address} (작업자 {workers}개)")
+    print("종료하려면 Ctrl+C를 누르세요.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n변환 서버를 종료합니다.")
+    finally:
+        server.server_close()
+        executor.shutdown(cancel_futures=True)
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)